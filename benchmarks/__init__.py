@@ -0,0 +1,5 @@
+# SPDX-FileCopyrightText: 2026-present SPDX Contributors
+# SPDX-FileType: SOURCE
+# SPDX-License-Identifier: Apache-2.0
+
+"""Benchmarks of the SPDX License Matcher, see bench.py."""
@@ -0,0 +1,272 @@
+# SPDX-FileCopyrightText: 2026-present SPDX Contributors
+# SPDX-FileType: SOURCE
+# SPDX-License-Identifier: Apache-2.0
+
+"""Benchmarks of the matching stages, run offline.
+
+The corpus is the license texts of tests/data/licenses, or every license of an
+offline snapshot with --snapshot. Each license is matched as given and as
+synthetic variants of it:
+
+    verbatim    the license text as is
+    light       a few words replaced
+    heavy       one word in HEAVY_EDIT_FRACTION replaced
+    multi       several licenses one after the other
+    large       a license repeated up to LARGE_INPUT_SIZE characters
+
+For each stage and variant the latency percentiles, the throughput and the
+peak memory allocated by Python are reported. Memory is measured in a separate
+pass, as tracing allocations slows the code down:
+
+    python benchmarks/bench.py --output baseline.json
+    python benchmarks/bench.py --baseline baseline.json
+
+Compared to a baseline, the command fails if the median latency of a stage
+grew by more than the tolerance.
+"""
+
+import json
+import os
+import platform
+import random
+import sys
+import time
+import tracemalloc
+
+import click
+
+from spdx_license_matcher import __version__
+from spdx_license_matcher.computation import get_close_matches, get_matching_string, get_normalized_close_matches
+from spdx_license_matcher.index import LicenseIndex
+from spdx_license_matcher.normalize import normalize
+from spdx_license_matcher.segment import LicenseSegmenter
+from spdx_license_matcher.snapshot import Snapshot
+from spdx_license_matcher.sorensen_dice import get_dice_coefficient
+
+LICENSES_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'tests', 'data', 'licenses')
+
+VARIANTS = ('verbatim', 'light', 'heavy', 'multi', 'large')
+
+# Words replaced in the light variant, and fraction of the words replaced in the heavy one.
+LIGHT_EDITS = 3
+HEAVY_EDIT_FRACTION = 0.15
+
+# Licenses per multi-license input.
+MULTI_LICENSES = 3
+
+# Characters of each large input, and how many there are.
+LARGE_INPUT_SIZE = 1024 * 1024
+LARGE_INPUTS = 2
+
+PERCENTILES = (50, 90, 99)
+
+
+def load_corpus(snapshotPath=None):
+    """License texts to benchmark with.
+
+    Arguments:
+        snapshotPath {string} -- offline snapshot of the SPDX License List; None for tests/data/licenses.
+
+    Returns:
+        dictionary -- license ID as key and license text as value.
+    """
+    if snapshotPath:
+        snapshot = Snapshot.load(snapshotPath)
+        return {licenseId: entry['text'] for licenseId, entry in snapshot.entries.items()}
+    texts = {}
+    for fileName in sorted(os.listdir(LICENSES_DIR)):
+        licenseId, _ = os.path.splitext(fileName)
+        with open(os.path.join(LICENSES_DIR, fileName), 'r', encoding='utf-8') as fh:
+            texts[licenseId] = fh.read()
+    return texts
+
+
+def _replace_words(text, count, rng):
+    words = text.split(' ')
+    for i in rng.sample(range(len(words)), min(count, len(words))):
+        words[i] = rng.choice(('lorem', 'ipsum', 'dolor', 'amet'))
+    return ' '.join(words)
+
+
+def make_inputs(licenseTexts, seed=0):
+    """Synthetic inputs made of the license texts, the same for a given seed.
+
+    Arguments:
+        licenseTexts {dictionary} -- license ID as key and license text as value.
+        seed {int} -- seed of the random edits.
+
+    Returns:
+        list -- (variant, license ID of the original text, input text) of each input.
+    """
+    rng = random.Random(seed)
+    licenseIds = sorted(licenseTexts)
+    inputs = []
+    for licenseId in licenseIds:
+        text = licenseTexts[licenseId]
+        inputs.append(('verbatim', licenseId, text))
+        inputs.append(('light', licenseId, _replace_words(text, LIGHT_EDITS, rng)))
+        inputs.append(('heavy', licenseId, _replace_words(text, int(HEAVY_EDIT_FRACTION * len(text.split(' '))), rng)))
+    for i in range(0, len(licenseIds) - MULTI_LICENSES + 1, MULTI_LICENSES):
+        group = licenseIds[i:i + MULTI_LICENSES]
+        inputs.append(('multi', group[0], '\n\n'.join(licenseTexts[licenseId] for licenseId in group)))
+    for licenseId in rng.sample(licenseIds, min(LARGE_INPUTS, len(licenseIds))):
+        text = licenseTexts[licenseId]
+        inputs.append(('large', licenseId, (text + '\n\n') * (LARGE_INPUT_SIZE // (len(text) + 2) + 1)))
+    return inputs
+
+
+def _get_stages(licenseTexts, threshold, verify):
+    """Stages to benchmark: name, the variants it runs on, and a function of (license ID, input text, normalized input).
+
+    Only the normalize, segment and end-to-end stages include the normalization of the input.
+    """
+    normalizedTexts = {licenseId: normalize(text) for licenseId, text in licenseTexts.items()}
+    index = LicenseIndex.from_texts(normalizedTexts)
+    segmenter = LicenseSegmenter(normalizedTexts)
+    stages = [
+        ('normalize', VARIANTS, lambda licenseId, text, normalizedText: normalize(text)),
+        ('dice', VARIANTS, lambda licenseId, text, normalizedText: get_dice_coefficient(normalizedText, normalizedTexts[licenseId])),
+        ('match', VARIANTS, lambda licenseId, text, normalizedText: get_normalized_close_matches(normalizedText, index, threshold)),
+        ('segment', ('multi',), lambda licenseId, text, normalizedText: segmenter.find_segments(normalize(text, wholeText=False), threshold)),
+    ]
+    if verify:
+        from spdx_license_matcher.verify import StandardVerifier
+
+        verifier = StandardVerifier()
+        # Start the JVM and look the listed licenses up before timing.
+        verifier.get_standard_match({licenseId: 0.0 for licenseId in licenseTexts}, '')
+
+        def end_to_end(licenseId, text, normalizedText):
+            matches = get_close_matches(text, index, threshold)
+            return get_matching_string(matches, text, verifier)
+
+        stages.append(('verify', ('verbatim', 'light', 'heavy'), lambda licenseId, text, normalizedText: verifier.get_standard_match({licenseId: 0.0}, text)))
+        stages.append(('end-to-end', VARIANTS, end_to_end))
+    else:
+        stages.append(('end-to-end', VARIANTS, lambda licenseId, text, normalizedText: get_close_matches(text, index, threshold)))
+    return stages
+
+
+def _percentile(sortedValues, percent):
+    # Nearest rank.
+    rank = max(1, -(-percent * len(sortedValues) // 100))
+    return sortedValues[rank - 1]
+
+
+def run_benchmarks(licenseTexts, repeat=3, threshold=0.9, verify=False, memory=True, seed=0):
+    """Run every stage on every input.
+
+    Arguments:
+        licenseTexts {dictionary} -- license ID as key and license text as value.
+        repeat {int} -- times each stage runs on each input.
+        threshold {float} -- confidence threshold of the matching.
+        verify {bool} -- also benchmark the verification against the SPDX standard texts, which needs the JVM.
+        memory {bool} -- also measure the peak memory of each stage.
+        seed {int} -- seed of the synthetic inputs.
+
+    Returns:
+        dictionary -- 'stage/variant' as key and its measures as value.
+    """
+    inputs = [(variant, licenseId, text, normalize(text)) for variant, licenseId, text in make_inputs(licenseTexts, seed)]
+    results = {}
+    for stage, variants, function in _get_stages(licenseTexts, threshold, verify):
+        for variant in variants:
+            stageInputs = [(licenseId, text, normalizedText) for inputVariant, licenseId, text, normalizedText in inputs if inputVariant == variant]
+            if not stageInputs:
+                continue
+            latencies = []
+            for _ in range(repeat):
+                for stageInput in stageInputs:
+                    start = time.perf_counter()
+                    function(*stageInput)
+                    latencies.append(time.perf_counter() - start)
+            latencies.sort()
+            characters = repeat * sum(len(text) for _, text, _ in stageInputs)
+            total = sum(latencies)
+            measures = {
+                'inputs': len(stageInputs),
+                'runs': len(latencies),
+                'meanMs': 1000 * total / len(latencies),
+                'maxMs': 1000 * latencies[-1],
+                'inputsPerSecond': len(latencies) / total if total else None,
+                'charactersPerSecond': characters / total if total else None,
+            }
+            for percent in PERCENTILES:
+                measures['p{}Ms'.format(percent)] = 1000 * _percentile(latencies, percent)
+            if memory:
+                tracemalloc.start()
+                for stageInput in stageInputs:
+                    function(*stageInput)
+                measures['peakMemoryBytes'] = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+            results['{}/{}'.format(stage, variant)] = measures
+    return results
+
+
+def compare(results, baseline, tolerance=0.2):
+    """Compare the median latencies with a baseline.
+
+    Arguments:
+        results {dictionary} -- measures of run_benchmarks().
+        baseline {dictionary} -- measures of an earlier run.
+        tolerance {float} -- relative slowdown accepted.
+
+    Returns:
+        list -- (benchmark, baseline median, current median, ratio, regressed) of the benchmarks of both.
+    """
+    rows = []
+    for name in sorted(set(results) & set(baseline)):
+        before = baseline[name]['p50Ms']
+        after = results[name]['p50Ms']
+        ratio = after / before if before else float('inf')
+        rows.append((name, before, after, ratio, ratio > 1 + tolerance))
+    return rows
+
+
+@click.command()
+@click.option('--snapshot', 'snapshotPath', type=click.Path(exists=True, dir_okay=False), help='Benchmark with every license of this offline snapshot instead of tests/data/licenses.')
+@click.option('--repeat', '-r', default=3, type=click.IntRange(1), help='Times each stage runs on each input.', show_default=True)
+@click.option('--threshold', '-t', default=0.9, type=click.FloatRange(0.0, 1.0), help='Confidence threshold of the matching.', show_default=True)
+@click.option('--verify', is_flag=True, default=False, help='Also benchmark the verification against the SPDX standard texts (starts the JVM).')
+@click.option('--no-memory', 'noMemory', is_flag=True, default=False, help='Do not measure the peak memory.')
+@click.option('--output', '-o', type=click.Path(dir_okay=False, writable=True), help='Write the results to this JSON file, to be used as a baseline.')
+@click.option('--baseline', '-b', type=click.Path(exists=True, dir_okay=False), help='Compare the results with this JSON file from an earlier run.')
+@click.option('--tolerance', default=0.2, type=click.FloatRange(0.0), help='Relative slowdown of the median latency accepted before failing.', show_default=True)
+def bench(snapshotPath, repeat, threshold, verify, noMemory, output, baseline, tolerance):
+    """Benchmark normalization, scoring, verification and end-to-end matching."""
+    licenseTexts = load_corpus(snapshotPath)
+    results = run_benchmarks(licenseTexts, repeat, threshold, verify, not noMemory)
+
+    click.echo('{:<24} {:>6} {:>10} {:>10} {:>10} {:>10} {:>12} {:>10}'.format(
+        'benchmark', 'runs', 'p50 ms', 'p90 ms', 'p99 ms', 'max ms', 'chars/s', 'peak KiB'))
+    for name, measures in results.items():
+        click.echo('{:<24} {:>6} {:>10.3f} {:>10.3f} {:>10.3f} {:>10.3f} {:>12.0f} {:>10}'.format(
+            name, measures['runs'], measures['p50Ms'], measures['p90Ms'], measures['p99Ms'], measures['maxMs'],
+            measures['charactersPerSecond'] or 0,
+            measures['peakMemoryBytes'] // 1024 if 'peakMemoryBytes' in measures else '-'))
+
+    if output:
+        with open(output, 'w', encoding='utf-8') as fh:
+            json.dump({
+                'version': __version__,
+                'python': sys.version.split()[0],
+                'platform': platform.platform(),
+                'licenses': len(licenseTexts),
+                'repeat': repeat,
+                'results': results,
+            }, fh, indent=2)
+
+    if baseline:
+        with open(baseline, 'r', encoding='utf-8') as fh:
+            rows = compare(results, json.load(fh)['results'], tolerance)
+        click.echo('\n{:<24} {:>12} {:>12} {:>8}'.format('benchmark', 'baseline p50', 'current p50', 'ratio'))
+        for name, before, after, ratio, regressed in rows:
+            click.echo('{:<24} {:>12.3f} {:>12.3f} {:>8.2f}{}'.format(name, before, after, ratio, '  REGRESSION' if regressed else ''))
+        regressions = [row[0] for row in rows if row[4]]
+        if regressions:
+            raise click.ClickException('{} benchmark(s) slower than the baseline by more than {:.0%}: {}'.format(
+                len(regressions), tolerance, ', '.join(regressions)))
+
+
+if __name__ == '__main__':
+    bench()
@@ -0,0 +1,184 @@
+# SPDX-FileCopyrightText: 2026-present SPDX Contributors
+# SPDX-FileType: SOURCE
+# SPDX-License-Identifier: Apache-2.0
+
+"""Matching license texts from Python, for programs embedding the matcher.
+
+A Matcher loads and prepares the corpus once, and is then shared by any
+number of threads:
+
+    from spdx_license_matcher.api import Matcher
+
+    matcher = Matcher.from_store('spdx-corpus.bin')
+    result = matcher.match(text, topK=3)
+    if result.best is not None:
+        print(result.best.licenseId, result.best.score)
+
+Only the close matches are computed: checking them against the SPDX standard
+texts (see verify.open_verifier()) is left to the caller.
+"""
+
+import threading
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+from spdx_license_matcher.cache import DEFAULT_MAX_ENTRIES, open_cache
+from spdx_license_matcher.candidates import CandidateStats
+from spdx_license_matcher.computation import get_normalized_close_matches, get_normalized_scores, select_top_matches
+from spdx_license_matcher.instrument import span
+from spdx_license_matcher.normalize import normalize
+from spdx_license_matcher.shingles import ShingleIndex
+from spdx_license_matcher.storage import open_store
+
+
+@dataclass(frozen=True)
+class LicenseMatch:
+    """A license or exception of the corpus matching an input."""
+
+    licenseId: str
+    score: float
+
+    @property
+    def exact(self):
+        """Whether the normalized texts have the same bigrams, as verbatim copies do."""
+        return self.score == 1.0
+
+
+@dataclass
+class MatchResult:
+    """The matches of one input, the highest score first."""
+
+    matches: List[LicenseMatch] = field(default_factory=list)
+    stats: CandidateStats = field(default_factory=CandidateStats)
+
+    @property
+    def best(self) -> Optional[LicenseMatch]:
+        return self.matches[0] if self.matches else None
+
+    def to_dict(self):
+        """The matches as returned by get_close_matches().
+
+        Returns:
+            dictionary -- license ID as key and dice coefficient as value.
+        """
+        return {match.licenseId: match.score for match in self.matches}
+
+
+class Matcher:
+    """Matches license texts against a corpus loaded once.
+
+    Safe to share between threads: the index is only read, and the counters
+    of all the matches, in stats, are updated under a lock.
+    """
+
+    def __init__(self, index, threshold=0.9, engine='python', lsh=False, cache=None, shingles=None):
+        """Prepare a corpus for matching.
+
+        Arguments:
+            index {LicenseIndex} -- the bigram index of the corpus.
+            threshold {float} -- default confidence threshold below which a score is not a match.
+            engine {string} -- 'python' or 'sparse' scoring engine (requires NumPy and SciPy).
+            lsh {bool} -- only score the licenses found similar by MinHash LSH; faster, but may miss matches.
+            cache {ResultCache} -- optional cache of the matches.
+            shingles {ShingleIndex} -- only score the licenses ranked closest by this word shingle index;
+                fewer close matches to verify, but may miss matches.
+        """
+        self.index = index
+        self.threshold = threshold
+        self.cache = cache
+        self.shingles = shingles
+        self.scorer = index
+        if engine == 'sparse':
+            from spdx_license_matcher.sparse_dice import SparseDiceScorer
+
+            self.scorer = SparseDiceScorer(index)
+        self.lsh = None
+        if lsh:
+            if index.signatures is None:
+                raise ValueError('The index has no MinHash signatures')
+            from spdx_license_matcher.minhash import MinHashLSH
+
+            self.lsh = MinHashLSH(index.signatures)
+        self.stats = CandidateStats()
+        self._statsLock = threading.Lock()
+        # Build the lazily computed length order now rather than in concurrent matches.
+        index.get_length_candidates(1, threshold)
+
+    @classmethod
+    def from_store(cls, storeSpec=None, threshold=0.9, engine='python', lsh=False, cacheSpec=None, cacheSize=DEFAULT_MAX_ENTRIES,
+                   shingles=False):
+        """Load the corpus of a store built by build_spdx_licenses().
+
+        Arguments:
+            storeSpec {string} -- None or 'redis' for the Redis server at SPDX_REDIS_HOST, a redis:// URL,
+                or the path of a local memory-mapped corpus file.
+            threshold {float} -- default confidence threshold below which a score is not a match.
+            engine {string} -- 'python' or 'sparse' scoring engine.
+            lsh {bool} -- only score the licenses found similar by MinHash LSH.
+            cacheSpec {string} -- persistent result cache, as accepted by open_cache().
+            cacheSize {int} -- results kept in memory; 0 for none.
+            shingles {bool} -- only score the licenses ranked closest by a word shingle index of the license texts.
+
+        Returns:
+            Matcher -- the matcher.
+        """
+        store = open_store(storeSpec)
+        index = store.load_index()
+        shingleIndex = ShingleIndex(index.names, store.load_normalized_texts()) if shingles else None
+        return cls(index, threshold, engine, lsh, open_cache(cacheSpec, index, store, cacheSize), shingleIndex)
+
+    def match(self, text, threshold=None, topK=None):
+        """Match a license text.
+
+        Arguments:
+            text {string} -- license text to match.
+            threshold {float} -- confidence threshold (default: the one of the matcher).
+            topK {int} -- largest number of matches returned; None for all of them.
+
+        Returns:
+            MatchResult -- the matches at or above the threshold, the highest score first.
+                If some are perfect, only those.
+        """
+        return self.match_normalized(normalize(text), threshold, topK)
+
+    def match_normalized(self, normalizedText, threshold=None, topK=None):
+        """Same as match() for a text already normalized with normalize().
+
+        Arguments:
+            normalizedText {string} -- the normalized license text.
+            threshold {float} -- confidence threshold (default: the one of the matcher).
+            topK {int} -- largest number of matches returned; None for all of them.
+
+        Returns:
+            MatchResult -- the matches, the highest score first.
+        """
+        if threshold is None:
+            threshold = self.threshold
+        stats = CandidateStats()
+        if self.cache is None:
+            with span('score'):
+                scores = get_normalized_scores(normalizedText, self.scorer, threshold, self.lsh, stats, self.shingles)
+                selected = select_top_matches(scores, threshold, topK)
+        else:
+            # Same entries as the matches of the command line, whatever topK.
+            key = self.cache.make_matches_key(normalizedText, threshold, self.lsh is not None, self.shingles is not None)
+            matches = self.cache.fetch_matches(
+                key, lambda scoringStats: get_normalized_close_matches(normalizedText, self.scorer, threshold, self.lsh, scoringStats, self.shingles), stats
+            )
+            selected = select_top_matches(matches.items(), threshold, topK)
+        with self._statsLock:
+            self.stats.add(stats)
+        return MatchResult([LicenseMatch(licenseId, score) for licenseId, score in selected], stats)
+
+    def match_many(self, texts, threshold=None, topK=None):
+        """Match several license texts.
+
+        Arguments:
+            texts {iterable} -- license texts to match.
+            threshold {float} -- confidence threshold (default: the one of the matcher).
+            topK {int} -- largest number of matches returned for each text; None for all of them.
+
+        Returns:
+            list -- a MatchResult for each text, in the order of the texts.
+        """
+        return [self.match(text, threshold, topK) for text in texts]
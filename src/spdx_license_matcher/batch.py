@@ -0,0 +1,219 @@
+# SPDX-FileCopyrightText: 2026-present SPDX Contributors
+# SPDX-FileType: SOURCE
+# SPDX-License-Identifier: Apache-2.0
+
+"""Scoring of many license files against the license index in a pool of worker processes."""
+
+import glob
+import os
+import time
+from dataclasses import dataclass, field
+from typing import Optional
+
+from spdx_license_matcher.candidates import CandidateStats
+from spdx_license_matcher.computation import get_normalized_close_matches
+from spdx_license_matcher.index import LicenseIndex
+from spdx_license_matcher.instrument import capture, timed
+from spdx_license_matcher.normalize import normalize
+
+# Per-process state, set once by _init_worker so the index is only transferred and loaded once per worker.
+_worker = {}
+
+# Files larger than this many bytes are not matched by default. The largest SPDX license texts are about 100 KB.
+DEFAULT_MAX_SIZE = 10 * 1024 * 1024
+
+# Characters read at a time, so that reading stops soon after the size limit.
+READ_CHUNK_SIZE = 1024 * 1024
+
+
+class InputTooLargeError(ValueError):
+    """A file is larger than the size limit of the scan."""
+
+    def __init__(self, path, maxSize):
+        # Both arguments are kept in args, so that the error is unpickled when a worker process sends it back.
+        super().__init__(path, maxSize)
+        self.path = path
+        self.maxSize = maxSize
+
+    def __str__(self):
+        return '{} is larger than the limit of {} bytes'.format(self.path, self.maxSize)
+
+
+@dataclass
+class FileResult:
+    """Outcome of scoring one file."""
+
+    path: str
+    inputText: Optional[str] = None
+    matches: Optional[dict] = None
+    error: Optional[Exception] = None
+    stats: CandidateStats = field(default_factory=CandidateStats)
+    # Licenses found in parts of the file, when segmenting.
+    segments: Optional[list] = None
+    # Seconds spent in each stage, by stage name.
+    timings: dict = field(default_factory=dict)
+    # (name, seconds) of the instrumentation spans of the file, to be reported by the calling process.
+    spans: list = field(default_factory=list)
+
+
+def collect_files(textFiles=(), directories=(), patterns=()):
+    """List the files to scan, without duplicates and in a stable order.
+
+    Arguments:
+        textFiles {list} -- paths of individual files, kept in the given order.
+        directories {list} -- directory trees whose files are all scanned.
+        patterns {list} -- glob patterns, '**' matching any number of directories.
+
+    Returns:
+        list -- file paths.
+    """
+    paths = list(textFiles)
+    for directory in directories:
+        for root, dirNames, fileNames in os.walk(directory):
+            dirNames.sort()
+            paths.extend(os.path.join(root, fileName) for fileName in sorted(fileNames))
+    for pattern in patterns:
+        paths.extend(path for path in sorted(glob.glob(pattern, recursive=True)) if os.path.isfile(path))
+    return list(dict.fromkeys(paths))
+
+
+def _init_worker(indexSource, threshold, engine, lsh, maxSize, segmenter, cache, shingles):
+    if isinstance(indexSource, bytes):
+        index = LicenseIndex.from_bytes(indexSource)
+    else:
+        index = indexSource.load_index()
+    _worker['scorer'] = _get_scorer(index, threshold, engine, lsh, segmenter, cache, shingles)
+    _worker['maxSize'] = maxSize
+
+
+def _get_scorer(index, threshold, engine, lsh, segmenter=None, cache=None, shingles=None):
+    licenseData = index
+    if engine == 'sparse':
+        from spdx_license_matcher.sparse_dice import SparseDiceScorer
+
+        licenseData = SparseDiceScorer(index)
+    lshTable = None
+    if lsh:
+        from spdx_license_matcher.minhash import MinHashLSH
+
+        lshTable = MinHashLSH(index.signatures)
+    return licenseData, threshold, lshTable, segmenter, cache, shingles
+
+
+@timed('read')
+def read_text(path, maxSize=DEFAULT_MAX_SIZE):
+    """Read a text file, without reading much past the size limit.
+
+    Arguments:
+        path {string} -- path of the file.
+        maxSize {int} -- largest size accepted, in bytes; 0 for no limit.
+
+    Returns:
+        string -- the text of the file.
+
+    Raises:
+        InputTooLargeError -- if the file is larger than maxSize.
+    """
+    with open(path, "r", encoding="utf-8") as fh:
+        if not maxSize:
+            return fh.read()
+        if os.fstat(fh.fileno()).st_size > maxSize:
+            raise InputTooLargeError(path, maxSize)
+        # The size of pipes and devices is unknown: count characters, which are at least one byte.
+        chunks = []
+        size = 0
+        while True:
+            chunk = fh.read(READ_CHUNK_SIZE)
+            if not chunk:
+                return ''.join(chunks)
+            size += len(chunk)
+            if size > maxSize:
+                raise InputTooLargeError(path, maxSize)
+            chunks.append(chunk)
+
+
+def _read_and_score(path, scorer, maxSize=DEFAULT_MAX_SIZE):
+    # The spans are sent back with the result, as worker processes have no listeners.
+    with capture() as spans:
+        result = _match_file(path, scorer, maxSize)
+    result.spans = spans
+    return result
+
+
+def _match_file(path, scorer, maxSize):
+    licenseData, threshold, lshTable, segmenter, cache, shingles = scorer
+    result = FileResult(path)
+    start = time.perf_counter()
+    try:
+        result.inputText = read_text(path, maxSize)
+    except (OSError, UnicodeDecodeError, InputTooLargeError) as e:
+        result.error = e
+        return result
+    finally:
+        result.timings['read'] = time.perf_counter() - start
+    if segmenter is not None:
+        start = time.perf_counter()
+        normalizedInputText = normalize(result.inputText, wholeText=False)
+        result.timings['normalize'] = time.perf_counter() - start
+        start = time.perf_counter()
+        result.segments = segmenter.find_segments(normalizedInputText, threshold)
+        result.timings['segment'] = time.perf_counter() - start
+        return result
+    start = time.perf_counter()
+    normalizedInputText = normalize(result.inputText)
+    result.timings['normalize'] = time.perf_counter() - start
+    start = time.perf_counter()
+    if cache is None:
+        result.matches = get_normalized_close_matches(normalizedInputText, licenseData, threshold, lshTable, result.stats, shingles)
+    else:
+        # The scores only depend on the normalized text.
+        key = cache.make_matches_key(normalizedInputText, threshold, lshTable is not None, shingles is not None)
+        result.matches = cache.fetch_matches(
+            key, lambda stats: get_normalized_close_matches(normalizedInputText, licenseData, threshold, lshTable, stats, shingles), result.stats
+        )
+    result.timings['score'] = time.perf_counter() - start
+    return result
+
+
+def _score_in_worker(path):
+    return _read_and_score(path, _worker['scorer'], _worker['maxSize'])
+
+
+def score_files(paths, index, threshold=0.9, jobs=1, engine='python', lsh=False, ordered=True, store=None, maxSize=DEFAULT_MAX_SIZE, segmenter=None, cache=None, shingles=None):
+    """Read and score files against the license index, in parallel worker processes.
+
+    Arguments:
+        paths {list} -- paths of the files to score.
+        index {LicenseIndex} -- the bigram index, loaded once per worker.
+        threshold {float} -- confidence threshold below which a score is not a match.
+        jobs {int} -- number of worker processes; 1 scores in the current process.
+        engine {string} -- 'python' or 'sparse' scoring engine.
+        lsh {bool} -- only score the licenses found similar by the MinHash LSH index.
+        ordered {bool} -- yield the results in the given order, rather than as soon as each file is scored.
+        store {CorpusStore} -- store the index was loaded from; workers open it themselves if it is shareable.
+        maxSize {int} -- files larger than this many bytes get an InputTooLargeError; 0 for no limit.
+        segmenter {LicenseSegmenter} -- find the licenses in parts of each file instead of matching whole files.
+        cache {ResultCache} -- optional cache of the matches, with a memory tier in each worker.
+        shingles {ShingleIndex} -- only score the shortlist of the licenses ranked closest by this word shingle index.
+
+    Returns:
+        generator -- a FileResult for each path.
+    """
+    if jobs <= 1 or len(paths) <= 1:
+        scorer = _get_scorer(index, threshold, engine, lsh, segmenter, cache, shingles)
+        for path in paths:
+            yield _read_and_score(path, scorer, maxSize)
+        return
+
+    # multiprocessing is only imported when there are worker processes.
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+
+    indexSource = store if store is not None and store.shareable else index.to_bytes()
+    with ProcessPoolExecutor(
+        max_workers=jobs, initializer=_init_worker, initargs=(indexSource, threshold, engine, lsh, maxSize, segmenter, cache, shingles)
+    ) as pool:
+        if ordered:
+            yield from pool.map(_score_in_worker, paths, chunksize=max(1, min(16, len(paths) // (jobs * 4))))
+        else:
+            for future in as_completed([pool.submit(_score_in_worker, path) for path in paths]):
+                yield future.result()
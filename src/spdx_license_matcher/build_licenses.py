@@ -2,85 +2,208 @@
 # SPDX-FileType: SOURCE
 # SPDX-License-Identifier: Apache-2.0
 
-"""Logic to fetch SPDX licenses and license exceptions, and populate the Redis database."""
+"""Logic to fetch SPDX licenses and license exceptions, and populate the corpus store (Redis by default)."""
 
+import hashlib
 import os
-from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from importlib.util import find_spec
+from urllib.parse import urljoin
 
-import redis
-import requests
 from dotenv import load_dotenv
 
-from spdx_license_matcher.normalize import normalize
+from spdx_license_matcher.index import INDEX_FORMAT_VERSION, LicenseIndex, prepare_text
+from spdx_license_matcher.normalize import NORMALIZER_VERSION, normalize
+from spdx_license_matcher.storage import RedisStore
 from spdx_license_matcher.utils import compressStringToBytes
 
 load_dotenv()
 
-r = redis.StrictRedis(host=os.environ.get(key="SPDX_REDIS_HOST", default="localhost"), port=6379, db=0)
-
 
 def get_url(url):
     """GET URL and return response"""
-    user_agent = 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/51.0.2704.103 Safari/537.36'
-    headers = {'User-Agent': user_agent }
-    res = requests.get(url, headers=headers)
-    return res
+    from spdx_license_matcher.fetch import get_default_client
+
+    return get_default_client().get(url)
+
 
+def build_spdx_licenses(snapshot=None, store=None, onlyIfEmpty=False, client=None, processes=None):
+    """Get data from SPDX license list and exception list and set data in the store,
+    together with the bigram index of all the normalized texts.
 
-def build_spdx_licenses():
-    """Get data from SPDX license list and exception list and set data in Redis.
+    The build is incremental: nothing is done if the store already holds the same
+    version of the SPDX License List, normalized and indexed by the same version of
+    this package, and otherwise only the licenses whose text changed are normalized
+    and written again. Concurrent builds of the same store
+    wait for each other. Normalizing, compressing and indexing each text is spread
+    over worker processes; the result does not depend on their number.
+
+    Arguments:
+        snapshot {Snapshot} -- offline SPDX License List snapshot to use instead of downloading the lists.
+        store {CorpusStore} -- where to save the corpus (default: the Redis database).
+        onlyIfEmpty {bool} -- only build if the store is still empty once the build lock is held.
+        client {HttpClient} -- client downloading the lists (default: a new one, configured by the environment).
+        processes {int} -- worker processes preparing the texts (default: the number of CPUs); 1 prepares them in this process.
+
+    Returns:
+        bool -- whether the store was updated.
     """
-    # Delete all the keys in the current database
-    r.flushdb()
-
-    _build_list(
-        'https://spdx.org/licenses/licenses.json',
-        'licenses',
-        'licenseId',
-        'licenseText',
-    )
-    _build_list(
-        'https://spdx.org/licenses/exceptions.json',
-        'exceptions',
-        'licenseExceptionId',
-        'licenseExceptionText',
+    store = store or RedisStore()
+    with store.build_lock():
+        # Another process may have built the corpus while this one was waiting for the lock.
+        if onlyIfEmpty and not store.is_empty():
+            return False
+        metadata = {} if store.is_empty() else store.load_metadata()
+        # MinHash signatures for the optional LSH candidate stage need NumPy.
+        minhash = find_spec('numpy') is not None
+
+        if snapshot is not None:
+            licenseListVersion = snapshot.licenseListVersion
+            if _is_up_to_date(metadata, licenseListVersion, minhash):
+                return False
+            texts = {licenseId: entry['text'] for licenseId, entry in snapshot.entries.items()}
+        else:
+            from spdx_license_matcher.fetch import HttpClient, get_list_url
+
+            ownClient = client is None
+            client = client or HttpClient()
+            try:
+                licensesUrl = get_list_url('licenses.json')
+                licensesJson = client.get_json(licensesUrl)
+                licenseListVersion = licensesJson.get('licenseListVersion')
+                if _is_up_to_date(metadata, licenseListVersion, minhash):
+                    return False
+                exceptionsUrl = get_list_url('exceptions.json')
+                texts = _build_list(client, licensesUrl, licensesJson, 'licenses', 'licenseId', 'licenseText')
+                texts.update(_build_list(client, exceptionsUrl, client.get_json(exceptionsUrl), 'exceptions', 'licenseExceptionId', 'licenseExceptionText'))
+            finally:
+                if ownClient:
+                    client.close()
+
+        # Texts normalized by another version of normalize() are all normalized again.
+        previousChecksums = metadata.get('checksums', {}) if metadata.get('normalizer') == NORMALIZER_VERSION else {}
+        storedTexts = store.load_normalized_texts() if previousChecksums else {}
+        checksums = {licenseId: _checksum(text) for licenseId, text in texts.items()}
+        # Texts missing from the store, such as evicted Redis keys, are normalized again as well.
+        changed = {
+            licenseId for licenseId, checksum in checksums.items()
+            if previousChecksums.get(licenseId) != checksum or storedTexts.get(licenseId) is None
+        }
+        tasks = []
+        for licenseId in sorted(texts):
+            if licenseId not in changed:
+                tasks.append((licenseId, None, storedTexts[licenseId], False))
+            elif snapshot is not None and snapshot.normalizerVersion == NORMALIZER_VERSION:
+                tasks.append((licenseId, texts[licenseId], snapshot.entries[licenseId]['normalized'], store.compressesTexts))
+            else:
+                tasks.append((licenseId, texts[licenseId], None, store.compressesTexts))
+        normalizedTexts = {}
+        compressedTexts = {}
+        preparedTexts = {}
+        for licenseId, normalizedText, compressed, prepared in _map_prepare(tasks, minhash, processes):
+            normalizedTexts[licenseId] = normalizedText
+            preparedTexts[licenseId] = prepared
+            if compressed is not None:
+                compressedTexts[licenseId] = compressed
+        index = LicenseIndex.from_prepared(preparedTexts)
+        metadata = {
+            'licenseListVersion': licenseListVersion,
+            'normalizer': NORMALIZER_VERSION,
+            'indexFormat': INDEX_FORMAT_VERSION,
+            'minhash': index.signatures is not None,
+            'checksums': checksums,
+        }
+        store.save(normalizedTexts, index, metadata, changed if previousChecksums else None, compressedTexts)
+        return True
+
+
+def _is_up_to_date(metadata, licenseListVersion, minhash):
+    # Signatures are only missing when this process could add them, so that processes with and without
+    # NumPy sharing a store do not rebuild it in turn.
+    return (
+        licenseListVersion is not None
+        and metadata.get('licenseListVersion') == licenseListVersion
+        and metadata.get('normalizer') == NORMALIZER_VERSION
+        and metadata.get('indexFormat') == INDEX_FORMAT_VERSION
+        and (metadata.get('minhash') or not minhash)
     )
 
 
-def _build_list(url, listKey, idField, textField):
-    """Helper to download list and set data in Redis.
+def _checksum(text):
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+def _prepare(task, minhash):
+    licenseId, text, normalizedText, compress = task
+    if normalizedText is None:
+        normalizedText = normalize(text)
+    compressed = compressStringToBytes(normalizedText) if compress else None
+    return licenseId, normalizedText, compressed, prepare_text(normalizedText, minhash)
+
+
+def _map_prepare(tasks, minhash, processes=None):
+    """Prepare the texts of the corpus, in worker processes if there are several.
 
     Arguments:
-        url {string} -- URL of the SPDX list json.
+        tasks {list} -- (license ID, original text or None, normalized text or None, whether to compress it) of each text.
+        minhash {bool} -- also compute the MinHash signatures.
+        processes {int} -- number of worker processes (default: the number of CPUs).
+
+    Returns:
+        iterator -- (license ID, normalized text, compressed text or None, result of prepare_text()),
+            in the order of the tasks.
+    """
+    processes = processes or os.cpu_count() or 1
+    function = partial(_prepare, minhash=minhash)
+    if processes <= 1 or len(tasks) <= 1:
+        return map(function, tasks)
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=processes) as pool:
+        # Results come back in the order of the tasks, so the corpus is the same whatever the number of processes.
+        return list(pool.map(function, tasks, chunksize=max(1, len(tasks) // (processes * 4))))
+
+
+def _build_list(client, listUrl, listJson, listKey, idField, textField):
+    """Helper to download the texts of a list.
+
+    Arguments:
+        client {HttpClient} -- the client downloading the detail jsons.
+        listUrl {string} -- URL of the list json, which relative detail URLs are resolved against.
+        listJson {dictionary} -- the SPDX list json (e.g. licenses.json).
         listKey {string} -- key of the list in the top-level json (e.g. 'licenses', 'exceptions').
         idField {string} -- key of the identifier in each license detail json.
         textField {string} -- key of the license text in each license detail json.
+
+    Returns:
+        dictionary -- identifier as key and license text as value.
+    """
+    itemsUrl = [urljoin(listUrl, item.get('detailsUrl')) for item in listJson[listKey]]
+    texts = {}
+    for itemJson in client.get_all_json(itemsUrl):
+        texts[itemJson[idField]] = itemJson[textField]
+    return texts
+
+
+def is_keys_empty(store=None):
+    """To check if the licenses are present in the store or not.
+
+    Arguments:
+        store {CorpusStore} -- the corpus store (default: the Redis database).
+
+    Returns:
+        bool -- returns if the spdx licenses is present in the store or not.
     """
-    response = requests.get(url)
-    listJson = response.json()
-    items = listJson[listKey]
-    itemsUrl = [item.get('detailsUrl') for item in items]
-
-    with ThreadPoolExecutor(max_workers=2) as pool:
-        responses = list(pool.map(get_url, itemsUrl))
-
-    for response in responses:
-        try:
-            itemJson = response.json()
-            itemName = itemJson[idField]
-            itemText = itemJson[textField]
-            normalizeText = normalize(itemText)
-            compressedText = compressStringToBytes(normalizeText)
-            r.set(itemName, compressedText)
-        except Exception as e:
-            print(e)
-            raise
-
-
-def is_keys_empty():
-    """To check if the keys in redis is present or not.
+    return (store or RedisStore()).is_empty()
+
+
+def get_license_index(store=None):
+    """Load the precomputed bigram index from the store.
+
+    Arguments:
+        store {CorpusStore} -- the corpus store (default: the Redis database).
 
     Returns:
-        bool -- returns if the spdx licenses is present in the redis database or not.
+        LicenseIndex -- the index of all the licenses and exceptions in the store.
     """
-    return r.keys("*") == []
+    return (store or RedisStore()).load_index()
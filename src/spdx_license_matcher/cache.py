@@ -0,0 +1,327 @@
+# SPDX-FileCopyrightText: 2026-present SPDX Contributors
+# SPDX-FileType: SOURCE
+# SPDX-License-Identifier: Apache-2.0
+
+"""Cache of matching results, so that license files seen before are not scored and verified again.
+
+Results are kept in a least recently used memory tier, and optionally in a
+persistent tier shared by runs and processes: a local SQLite file or Redis.
+Keys are digests of the input (normalized for the scores, as they only depend
+on the normalized text) and of the parameters of the result, within the
+generation of the corpus: a digest of the SPDX License List version and of the
+license texts. Rebuilding the corpus with other texts starts a new generation,
+and the persistent tiers drop the entries of the other generations when opened.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+
+from spdx_license_matcher.candidates import CandidateStats
+from spdx_license_matcher.computation import get_standard_match
+from spdx_license_matcher.index import text_digest
+from spdx_license_matcher.instrument import timed
+
+# Entries of the memory tier by default.
+DEFAULT_MAX_ENTRIES = 4096
+
+# Prefix of the Redis keys of cached results. They contain ':', so they are never taken for license IDs.
+REDIS_KEY_PREFIX = 'spdx:cache:'
+
+
+def corpus_generation(index, metadata=None):
+    """Digest identifying the corpus the results were computed with.
+
+    Arguments:
+        index {LicenseIndex} -- the bigram index of the corpus.
+        metadata {dictionary} -- build metadata of the corpus store, with the SPDX License List version.
+
+    Returns:
+        string -- hexadecimal digest.
+    """
+    digest = hashlib.sha256()
+    digest.update(str((metadata or {}).get('licenseListVersion')).encode('utf-8'))
+    if index.digests is not None:
+        digest.update(json.dumps([index.names, index.digests]).encode('utf-8'))
+    else:
+        digest.update(index.to_bytes())
+    return digest.hexdigest()[:32]
+
+
+class ResultCache:
+    """Results by key, in a memory tier and an optional persistent tier.
+
+    Lookups are counted in the cacheHits, cacheMisses and cacheEvictions of
+    the CandidateStats given to get() and put().
+    """
+
+    def __init__(self, generation, maxEntries=DEFAULT_MAX_ENTRIES, tier=None):
+        """Create a cache.
+
+        Arguments:
+            generation {string} -- corpus generation, from corpus_generation().
+            maxEntries {int} -- entries of the memory tier; 0 for no memory tier.
+            tier {SqliteTier|RedisTier} -- optional persistent tier.
+        """
+        self.generation = generation
+        self.maxEntries = maxEntries
+        self.tier = tier
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        if tier is not None:
+            tier.open(generation)
+
+    def __getstate__(self):
+        # Each process has its own memory tier.
+        return {'generation': self.generation, 'maxEntries': self.maxEntries, 'tier': self.tier}
+
+    def __setstate__(self, state):
+        # The persistent tier was opened by the process which created the cache.
+        self.__dict__.update(state)
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def make_key(self, kind, text, *parameters):
+        """Key of a result.
+
+        Arguments:
+            kind {string} -- what the result is, such as 'matches'.
+            text {string} -- the input the result was computed from.
+            parameters -- anything else the result depends on, serializable to JSON.
+
+        Returns:
+            string -- the key.
+        """
+        return '{}:{}:{}'.format(kind, text_digest(text), text_digest(json.dumps(parameters, sort_keys=True)))
+
+    def make_matches_key(self, normalizedText, threshold, lsh=False, shingles=False):
+        """Key of the close matches of a normalized text, the same for the command line, the server and the API.
+
+        Arguments:
+            normalizedText {string} -- the normalized input.
+            threshold {float} -- confidence threshold of the matches.
+            lsh {bool} -- whether MinHash LSH pruned the candidates.
+            shingles {bool} -- whether a word shingle index shortlisted the candidates.
+
+        Returns:
+            string -- the key.
+        """
+        return self.make_key('close-matches', normalizedText, threshold, lsh, shingles)
+
+    @timed('cache')
+    def get(self, key, stats=None):
+        """Get a result.
+
+        Arguments:
+            key {string} -- key from make_key().
+            stats {CandidateStats} -- optional counters to update.
+
+        Returns:
+            object -- the result, or None if it is not cached.
+        """
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+        if value is None and self.tier is not None:
+            value = self.tier.get(key)
+            if value is not None:
+                self._remember(key, value, stats)
+        if stats is not None:
+            if value is None:
+                stats.cacheMisses += 1
+            else:
+                stats.cacheHits += 1
+        return value
+
+    def fetch(self, key, compute, stats=None):
+        """Get a result, computing and caching it if it is not cached.
+
+        Arguments:
+            key {string} -- key from make_key().
+            compute {function} -- computes the result, which must not be None.
+            stats {CandidateStats} -- optional counters to update.
+
+        Returns:
+            object -- the result.
+        """
+        value = self.get(key, stats)
+        if value is None:
+            value = compute()
+            self.put(key, value, stats)
+        return value
+
+    def fetch_matches(self, key, compute, stats=None):
+        """Get close matches, computing and caching them with the candidate counts of their scoring.
+
+        On a hit, the candidate counts of the scoring are added to stats as if the matches were computed.
+
+        Arguments:
+            key {string} -- key from make_key().
+            compute {function} -- called with a CandidateStats to update, computes the matches.
+            stats {CandidateStats} -- optional counters to update.
+
+        Returns:
+            dictionary -- the close matches.
+        """
+        def compute_entry():
+            scoringStats = CandidateStats()
+            matches = compute(scoringStats)
+            return {'matches': matches, 'candidates': scoringStats.get_candidate_counts()}
+
+        entry = self.fetch(key, compute_entry, stats)
+        if stats is not None:
+            stats.add_candidate_counts(entry['candidates'])
+        return entry['matches']
+
+    def put(self, key, value, stats=None):
+        """Cache a result.
+
+        Arguments:
+            key {string} -- key from make_key().
+            value {object} -- the result, serializable to JSON; None is not cached.
+            stats {CandidateStats} -- optional counters to update.
+        """
+        self._remember(key, value, stats)
+        if self.tier is not None:
+            self.tier.put(key, value)
+
+    def _remember(self, key, value, stats):
+        if not self.maxEntries:
+            return
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            evicted = 0
+            while len(self._entries) > self.maxEntries:
+                self._entries.popitem(last=False)
+                evicted += 1
+        if stats is not None:
+            stats.cacheEvictions += evicted
+
+
+class CachedVerifier:
+    """Verifier of the SPDX standard texts answering from the cache the inputs verified before."""
+
+    def __init__(self, verifier, cache, stats=None):
+        """Wrap a verifier.
+
+        Arguments:
+            verifier {StandardVerifier} -- verifier of the inputs not cached, None for the shared one.
+            cache {ResultCache} -- the result cache.
+            stats {CandidateStats} -- optional counters to update.
+        """
+        self.verifier = verifier
+        self.cache = cache
+        self.stats = stats
+
+    def get_standard_match(self, matches, inputText):
+        # The Java comparison sees the input as given, not normalized. Verifiers of other kinds may answer otherwise.
+        key = self.cache.make_key('standard', inputText, list(matches), getattr(self.verifier, 'kind', 'java'))
+        return self.cache.fetch(key, lambda: {'licenseId': self._verify(matches, inputText)}, self.stats)['licenseId']
+
+    def _verify(self, matches, inputText):
+        return get_standard_match(matches, inputText, self.verifier)
+
+
+class SqliteTier:
+    """Persistent tier in a local SQLite file, shared by the processes using it."""
+
+    def __init__(self, path):
+        self.path = path
+        self.generation = None
+        self._local = threading.local()
+
+    def __getstate__(self):
+        return {'path': self.path, 'generation': self.generation}
+
+    def __setstate__(self, state):
+        self.__init__(state['path'])
+        self.generation = state['generation']
+
+    def _connection(self):
+        # SQLite connections may not be shared between threads.
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            connection = self._local.connection = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        return connection
+
+    def open(self, generation):
+        self.generation = generation
+        connection = self._connection()
+        connection.execute('CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY, generation TEXT, value TEXT)')
+        connection.execute('DELETE FROM results WHERE generation != ?', (generation,))
+
+    def get(self, key):
+        row = self._connection().execute('SELECT value FROM results WHERE key = ? AND generation = ?', (key, self.generation)).fetchone()
+        return None if row is None else json.loads(row[0])
+
+    def put(self, key, value):
+        self._connection().execute(
+            'INSERT OR REPLACE INTO results (key, generation, value) VALUES (?, ?, ?)',
+            (key, self.generation, json.dumps(value)),
+        )
+
+
+class RedisTier:
+    """Persistent tier in a Redis database, such as the one of the corpus."""
+
+    def __init__(self, url):
+        import redis
+
+        self.url = url
+        self.client = redis.StrictRedis.from_url(url)
+        self.generation = None
+
+    def __getstate__(self):
+        # Clients hold sockets: each process connects again.
+        return {'url': self.url, 'generation': self.generation}
+
+    def __setstate__(self, state):
+        self.__init__(state['url'])
+        self.generation = state['generation']
+
+    def _prefix(self):
+        return '{}{}:'.format(REDIS_KEY_PREFIX, self.generation)
+
+    def open(self, generation):
+        self.generation = generation
+        stale = [key for key in self.client.scan_iter(match=REDIS_KEY_PREFIX + '*') if not key.decode('utf-8').startswith(self._prefix())]
+        if stale:
+            self.client.delete(*stale)
+
+    def get(self, key):
+        value = self.client.get(self._prefix() + key)
+        return None if value is None else json.loads(value)
+
+    def put(self, key, value):
+        self.client.set(self._prefix() + key, json.dumps(value))
+
+
+def open_cache(spec, index, store=None, maxEntries=DEFAULT_MAX_ENTRIES):
+    """Open the result cache described by spec.
+
+    Arguments:
+        spec {string} -- None for the memory tier only, 'redis' for the Redis server at SPDX_REDIS_HOST,
+            a redis:// URL, or the path of a local SQLite file.
+        index {LicenseIndex} -- the bigram index of the corpus.
+        store {CorpusStore} -- the corpus store, with the build metadata of the persistent tiers.
+        maxEntries {int} -- entries of the memory tier; 0 for no memory tier.
+
+    Returns:
+        ResultCache -- the cache, or None if it has no tier at all.
+    """
+    if not spec:
+        # The memory tier lives no longer than the index it was computed with.
+        return ResultCache(corpus_generation(index), maxEntries) if maxEntries else None
+    if spec == 'redis':
+        tier = RedisTier('redis://{}:6379/0'.format(os.environ.get(key="SPDX_REDIS_HOST", default="localhost")))
+    elif spec.startswith(('redis://', 'rediss://', 'unix://')):
+        tier = RedisTier(spec)
+    else:
+        tier = SqliteTier(spec)
+    metadata = store.load_metadata() if store is not None else None
+    return ResultCache(corpus_generation(index, metadata), maxEntries, tier)
@@ -0,0 +1,104 @@
+# SPDX-FileCopyrightText: 2026-present SPDX Contributors
+# SPDX-FileType: SOURCE
+# SPDX-License-Identifier: Apache-2.0
+
+"""Candidate generation: prune licenses that cannot reach the threshold before exact Dice scoring."""
+
+from dataclasses import dataclass
+
+# Counters of CandidateStats describing the scoring of one input, kept with its cached matches.
+CANDIDATE_COUNTERS = ('total', 'prunedByLength', 'prunedByMinHash', 'prunedByShingles', 'exactHits', 'exactMisses')
+
+
+@dataclass
+class CandidateStats:
+    """Running counts of the licenses considered, pruned and scored.
+
+    Inputs found by the exact match lookup are counted as exactHits and skip
+    candidate generation altogether; the others are counted as exactMisses.
+    Result cache lookups are counted as cacheHits and cacheMisses, and results
+    dropped from its memory tier as cacheEvictions.
+    """
+
+    total: int = 0
+    prunedByLength: int = 0
+    prunedByMinHash: int = 0
+    prunedByShingles: int = 0
+    exactHits: int = 0
+    exactMisses: int = 0
+    cacheHits: int = 0
+    cacheMisses: int = 0
+    cacheEvictions: int = 0
+
+    @property
+    def scored(self):
+        return self.total - self.prunedByLength - self.prunedByMinHash - self.prunedByShingles
+
+    def add(self, other):
+        """Add the counts of other to these counts.
+
+        Arguments:
+            other {CandidateStats} -- counts to add.
+        """
+        self.total += other.total
+        self.prunedByLength += other.prunedByLength
+        self.prunedByMinHash += other.prunedByMinHash
+        self.prunedByShingles += other.prunedByShingles
+        self.exactHits += other.exactHits
+        self.exactMisses += other.exactMisses
+        self.cacheHits += other.cacheHits
+        self.cacheMisses += other.cacheMisses
+        self.cacheEvictions += other.cacheEvictions
+
+    def get_candidate_counts(self):
+        """The counts of CANDIDATE_COUNTERS, without the cache counters.
+
+        Returns:
+            dictionary -- counter name as key and count as value.
+        """
+        return {name: getattr(self, name) for name in CANDIDATE_COUNTERS}
+
+    def add_candidate_counts(self, counts):
+        """Add counts from get_candidate_counts() to these counts.
+
+        Arguments:
+            counts {dictionary} -- counter name as key and count as value.
+        """
+        for name in CANDIDATE_COUNTERS:
+            setattr(self, name, getattr(self, name) + counts.get(name, 0))
+
+
+def get_candidates(index, normalizedText, threshold, lsh=None, stats=None, shingles=None):
+    """Licenses of the index that may reach the threshold against the input.
+
+    Length pruning is exact: it never drops a license that would score at or
+    above the threshold, nor a perfect match. The optional MinHash LSH and word
+    shingle stages are approximate and may drop true matches, which the stats
+    make measurable.
+
+    Arguments:
+        index {LicenseIndex} -- the bigram index.
+        normalizedText {string} -- normalized input license text.
+        threshold {float} -- confidence threshold.
+        lsh {MinHashLSH} -- optional LSH table over the index signatures.
+        stats {CandidateStats} -- optional counters to update.
+        shingles {ShingleIndex} -- optional word shingle index, keeping the licenses ranked closest to the input.
+
+    Returns:
+        list -- license positions in the index, in index order.
+    """
+    candidates = index.get_length_candidates(max(len(normalizedText) - 1, 0), threshold)
+    lengthCandidates = len(candidates)
+    if lsh is not None:
+        similar = lsh.get_candidates(normalizedText)
+        candidates = [pos for pos in candidates if pos in similar]
+    lshCandidates = len(candidates)
+    if shingles is not None:
+        shortlist = shingles.get_candidates(normalizedText, candidates)
+        candidates = [pos for pos in candidates if pos in shortlist]
+    if stats is not None:
+        stats.total += len(index)
+        stats.prunedByLength += len(index) - lengthCandidates
+        stats.prunedByMinHash += lengthCandidates - lshCandidates
+        stats.prunedByShingles += lshCandidates - len(candidates)
+    return sorted(candidates)
@@ -4,40 +4,108 @@
 
 """Algorithms for finding close matches and validating them against the SPDX License List."""
 
+import heapq
+
+from spdx_license_matcher.candidates import get_candidates
+from spdx_license_matcher.index import LicenseIndex
+from spdx_license_matcher.instrument import timed
 from spdx_license_matcher.normalize import normalize
 from spdx_license_matcher.sorensen_dice import get_dice_coefficient
-from spdx_license_matcher.utils import (
-    checkTextStandardException,
-    checkTextStandardLicense,
-    decompressBytesToString,
-    getListedException,
-    getListedLicense,
-    isListedException,
-)
+from spdx_license_matcher.utils import decompressBytesToString
+from spdx_license_matcher.verify import get_default_verifier
 
 
-def get_close_matches(inputText, licenseData, threshold=0.9):
+def get_close_matches(inputText, licenseData, threshold=0.9, lsh=None, stats=None, shingles=None):
     """Normalizes the given license text and forms bigrams before comparing it
     with a database of known licenses.
 
     Arguments:
         text {string} -- text is the license text input by the user.
+        licenseData {dictionary|LicenseIndex|SparseDiceScorer} -- license texts keyed by license ID, or a scorer of the precomputed bigram index.
+        threshold {float} -- confidence threshold below which a score is not a match.
+        lsh {MinHashLSH} -- optional LSH table to further narrow down the candidates of the index.
+        stats {CandidateStats} -- optional counters of the licenses pruned before scoring.
+        shingles {ShingleIndex} -- optional word shingle index to only score a shortlist of the candidates of the index.
+
+    Returns:
+        dictionary -- dictionary with license name as key and dice coefficient as value.
+    """
+    return get_normalized_close_matches(normalize(inputText), licenseData, threshold, lsh, stats, shingles)
+
+
+@timed('score')
+def get_normalized_close_matches(normalizedInputText, licenseData, threshold=0.9, lsh=None, stats=None, shingles=None):
+    """Same as get_close_matches() for an input that is already normalized.
+
+    Arguments:
+        normalizedInputText {string} -- license text input by the user, normalized with normalize().
+        licenseData {dictionary|LicenseIndex|SparseDiceScorer} -- license texts keyed by license ID, or a scorer of the precomputed bigram index.
+        threshold {float} -- confidence threshold below which a score is not a match.
+        lsh {MinHashLSH} -- optional LSH table to further narrow down the candidates of the index.
+        stats {CandidateStats} -- optional counters of the licenses pruned before scoring.
+        shingles {ShingleIndex} -- optional word shingle index to only score a shortlist of the candidates of the index.
+
+    Returns:
+        dictionary -- dictionary with license name as key and dice coefficient as value.
+    """
+    if not isinstance(licenseData, dict):
+        scores = dict(get_normalized_scores(normalizedInputText, licenseData, threshold, lsh, stats, shingles))
+    else:
+        scores = {}
+        for key in licenseData:
+            try:
+                licenseName = key.decode('utf-8')
+                normalizedLicenseText = decompressBytesToString(licenseData.get(key))
+            except Exception:
+                licenseName = key
+                normalizedLicenseText = normalize(licenseData.get(key))
+            scores[licenseName] = get_dice_coefficient(normalizedInputText, normalizedLicenseText)
+    return _select_matches(scores, threshold)
+
+
+def get_normalized_scores(normalizedInputText, scorer, threshold=0.9, lsh=None, stats=None, shingles=None):
+    """Scores of the licenses of the index which may reach the threshold against a normalized input.
+
+    Verbatim license texts are found by their digest and scored 1.0 without any
+    scoring, and the other licenses are pruned by get_candidates().
+
+    Arguments:
+        normalizedInputText {string} -- license text input by the user, normalized with normalize().
+        scorer {LicenseIndex|SparseDiceScorer} -- scorer of the precomputed bigram index.
+        threshold {float} -- confidence threshold used to prune the licenses.
+        lsh {MinHashLSH} -- optional LSH table to further narrow down the candidates of the index.
+        stats {CandidateStats} -- optional counters of the licenses pruned before scoring.
+        shingles {ShingleIndex} -- optional word shingle index to only score a shortlist of the candidates.
+
+    Returns:
+        iterable -- (license ID, dice coefficient) pairs, in index order.
+    """
+    index = scorer if isinstance(scorer, LicenseIndex) else scorer.index
+    exactMatches = index.get_exact_matches(normalizedInputText)
+    if exactMatches is not None and stats is not None:
+        if exactMatches:
+            stats.exactHits += 1
+        else:
+            stats.exactMisses += 1
+    if exactMatches:
+        return [(licenseName, 1.0) for licenseName in exactMatches]
+    candidates = get_candidates(index, normalizedInputText, threshold, lsh, stats, shingles)
+    return scorer.iter_scores(normalizedInputText, candidates)
+
+
+def _select_matches(scores, threshold):
+    """Keep the perfect matches if there are any, otherwise the scores at or above the threshold.
+
+    Arguments:
+        scores {dictionary} -- license name as key and dice coefficient as value.
+        threshold {float} -- confidence threshold below which a score is not a match.
 
     Returns:
         dictionary -- dictionary with license name as key and dice coefficient as value.
     """
     matches = {}
     perfectMatches = {}
-    normalizedInputText = normalize(inputText)
-    for key in licenseData:
-        try:
-            licenseName = key.decode('utf-8')
-            normalizedLicenseText = decompressBytesToString(licenseData.get(key))
-        except Exception:
-            licenseName = key
-            normalizedLicenseText = normalize(licenseData.get(key))
-        score = get_dice_coefficient(normalizedInputText, normalizedLicenseText)
-
+    for licenseName, score in scores.items():
         if score == 1.0:
             perfectMatches[licenseName] = score
         else:
@@ -52,12 +120,47 @@ def get_close_matches(inputText, licenseData, threshold=0.9):
     return matches
 
 
-def get_matching_string(matches, inputText):
+def select_top_matches(scores, threshold=0.9, topK=None):
+    """Keep the best scores at or above the threshold, with a heap of topK entries.
+
+    As in the matches of get_close_matches(), perfect matches leave out all the others.
+
+    Arguments:
+        scores {iterable} -- (license ID, dice coefficient) pairs.
+        threshold {float} -- confidence threshold below which a score is not a match.
+        topK {int} -- largest number of matches to keep; None to keep them all.
+
+    Returns:
+        list -- (license ID, dice coefficient) pairs, the highest score first, and equal scores in the order they came in.
+    """
+    if topK is not None and topK < 1:
+        raise ValueError('topK must be at least 1')
+    perfectMatches = []
+    heap = []
+    for position, (licenseName, score) in enumerate(scores):
+        if score == 1.0:
+            perfectMatches.append((licenseName, score))
+        elif perfectMatches or score < threshold:
+            continue
+        else:
+            # The smallest entry is the lowest score, and the latest among equal scores.
+            entry = (score, -position, licenseName)
+            if topK is None or len(heap) < topK:
+                heapq.heappush(heap, entry)
+            elif entry > heap[0]:
+                heapq.heapreplace(heap, entry)
+    if perfectMatches:
+        return perfectMatches[:topK]
+    return [(licenseName, score) for score, _, licenseName in sorted(heap, reverse=True)]
+
+
+def get_matching_string(matches, inputText, verifier=None):
     """Return the matching string with all of the license IDs matched with the input license text if none matches then it returns empty string.
 
     Arguments:
         matches {dictionary} -- Contains the license IDs(which matched with the input text) with their respective sorensen dice score as valus.
         inputText {string} -- license text input by the user.
+        verifier {StandardVerifier} -- verifier of the SPDX standard texts (default: the shared one).
 
     Returns:
         string -- matching string containing the license IDs that actually matched else returns empty string.
@@ -73,14 +176,24 @@ def get_matching_string(matches, inputText):
         return matchingString
 
     else:
-        for licenseID in matches:
-            if isListedException(licenseID):
-                listedException = getListedException(licenseID)
-                isTextStandard = checkTextStandardException(listedException, inputText)
-            else:
-                listedLicense = getListedLicense(licenseID)
-                isTextStandard = checkTextStandardLicense(listedLicense, inputText)
-            if not isTextStandard:
-                matchingString = 'The following license ID(s) match: ' + licenseID
-                return matchingString
+        licenseID = get_standard_match(matches, inputText, verifier)
+        if licenseID is not None:
+            matchingString = 'The following license ID(s) match: ' + licenseID
+            return matchingString
         return ""
+
+
+def get_standard_match(matches, inputText, verifier=None):
+    """Return the first close match whose SPDX standard text matches the input text.
+
+    Arguments:
+        matches {dictionary} -- Contains the license IDs(which matched with the input text) with their respective sorensen dice score as valus.
+        inputText {string} -- license text input by the user.
+        verifier {StandardVerifier} -- verifier of the SPDX standard texts (default: the shared one).
+
+    Returns:
+        string -- the matching license ID, or None if the input differs from all of them.
+    """
+    if verifier is None:
+        verifier = get_default_verifier()
+    return verifier.get_standard_match(matches, inputText)
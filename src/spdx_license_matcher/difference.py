@@ -5,10 +5,16 @@
 """Functions for generating text differences and calculating similarity percentage."""
 
 import difflib
+from collections import Counter
 
-import jellyfish
+from spdx_license_matcher.instrument import timed
+from spdx_license_matcher.normalize import normalize
 
+# Words of context around the changes of a word diff.
+WORD_DIFF_CONTEXT = 5
 
+
+@timed('diff')
 def generate_diff(originalLicenseText, inputLicenseText):
     """Generate difference of the input license text with that of SPDX license.
 
@@ -25,17 +31,166 @@ def generate_diff(originalLicenseText, inputLicenseText):
     return lines
 
 
-def get_similarity_percent(text1, text2):
+@timed('diff')
+def generate_word_diff(originalLicenseText, inputLicenseText, context=WORD_DIFF_CONTEXT):
+    """Generate the difference of the words of the normalized texts.
+
+    Differences in case, spacing, punctuation variants or copyright notices,
+    which the matching ignores, are not shown, and a changed word in a long
+    paragraph shows as that word rather than as the whole paragraph.
+
+    Arguments:
+        originalLicenseText {string} -- SPDX license text of the closely matched license.
+        inputLicenseText {string} -- license text input by the user.
+        context {int} -- words of context around the changes.
+
+    Returns:
+        list -- lines like those of generate_diff(): a '@@ -start,count +start,count @@' header
+            for each group of changes, in words, then ' ' context, '-' removed and '+' added words.
+    """
+    originalWords = normalize(originalLicenseText).split()
+    inputWords = normalize(inputLicenseText).split()
+    lines = []
+    matcher = difflib.SequenceMatcher(None, originalWords, inputWords, autojunk=False)
+    for group in matcher.get_grouped_opcodes(context):
+        first, last = group[0], group[-1]
+        lines.append('@@ -{},{} +{},{} @@'.format(first[1] + 1, last[2] - first[1], first[3] + 1, last[4] - first[3]))
+        for tag, i1, i2, j1, j2 in group:
+            if tag == 'equal':
+                lines.append(' ' + ' '.join(originalWords[i1:i2]))
+                continue
+            if i2 > i1:
+                lines.append('-' + ' '.join(originalWords[i1:i2]))
+            if j2 > j1:
+                lines.append('+' + ' '.join(inputWords[j1:j2]))
+    return lines
+
+
+def levenshtein_distance(text1, text2, maxDistance=None):
+    """Levenshtein distance between two texts, optionally bounded.
+
+    The common prefix and suffix are skipped, and the rest is computed with the
+    bit-parallel algorithm of Myers (1999), one column per character of the
+    shorter text. With a bound, the distance is given up as soon as it is known
+    to exceed it: from the character counts of the texts, or from the last row
+    of the columns computed so far.
+
+    Arguments:
+        text1 {string} -- string 1
+        text2 {string} -- string 2
+        maxDistance {int} -- largest distance of interest; None for no bound.
+
+    Returns:
+        int -- the distance, or None if it is larger than maxDistance.
+    """
+    # The common prefix and suffix do not change the distance.
+    prefix = _common_prefix_length(text1, text2)
+    text1 = text1[prefix:]
+    text2 = text2[prefix:]
+    suffix = _common_suffix_length(text1, text2)
+    text1 = text1[:len(text1) - suffix]
+    text2 = text2[:len(text2) - suffix]
+    if len(text1) < len(text2):
+        text1, text2 = text2, text1
+    if maxDistance is not None:
+        if len(text1) - len(text2) > maxDistance:
+            return None
+        # Each edit adds or removes at most one occurrence of a character.
+        counts1 = Counter(text1)
+        counts2 = Counter(text2)
+        if max(sum((counts1 - counts2).values()), sum((counts2 - counts1).values())) > maxDistance:
+            return None
+    if not text2:
+        return len(text1)
+
+    # Bit i of the vectors is row i + 1, for the character i of the longer text.
+    peq = {}
+    for i, character in enumerate(text1):
+        peq[character] = peq.get(character, 0) | (1 << i)
+    rows = len(text1)
+    mask = (1 << rows) - 1
+    lastRow = 1 << (rows - 1)
+    pv = mask
+    mv = 0
+    score = rows
+    columns = len(text2)
+    for j, character in enumerate(text2):
+        eq = peq.get(character, 0)
+        xv = eq | mv
+        xh = (((eq & pv) + pv) ^ pv) | eq
+        ph = mv | ~(xh | pv)
+        mh = pv & xh
+        if ph & lastRow:
+            score += 1
+        elif mh & lastRow:
+            score -= 1
+        # The distance decreases by at most one per column left.
+        if maxDistance is not None and score - (columns - j - 1) > maxDistance:
+            return None
+        ph = (ph << 1) | 1
+        mh <<= 1
+        pv = (mh | ~(xv | ph)) & mask
+        mv = ph & xv
+    if maxDistance is not None and score > maxDistance:
+        return None
+    return score
+
+
+def _common_prefix_length(text1, text2):
+    # Binary search comparing slices, rather than a Python loop over the characters.
+    low = 0
+    high = min(len(text1), len(text2))
+    while low < high:
+        middle = (low + high + 1) // 2
+        if text1[low:middle] == text2[low:middle]:
+            low = middle
+        else:
+            high = middle - 1
+    return low
+
+
+def _common_suffix_length(text1, text2):
+    low = 0
+    high = min(len(text1), len(text2))
+    while low < high:
+        middle = (low + high + 1) // 2
+        if text1[len(text1) - middle:len(text1) - low] == text2[len(text2) - middle:len(text2) - low]:
+            low = middle
+        else:
+            high = middle - 1
+    return low
+
+
+def _percent(bigger, distance):
+    return round((bigger - distance) / bigger * 100, 2)
+
+
+@timed('similarity')
+def get_similarity_percent(text1, text2, cutoff=None):
     """Levenshtein distance, a string metric for measuring the difference between two sequences, is used to calculate the similarity percentage between two license texts.
 
     Arguments:
         text1 {string} -- string 1
         text2 {string} -- string 2
+        cutoff {float} -- similarity percentage below which the exact value is not needed; None to always compute it.
 
     Returns:
-        float -- similarity percentage between the two given texts.
+        float -- similarity percentage between the two given texts, or None if it is below the cutoff.
     """
-    levDis = float(jellyfish.levenshtein_distance(text1, text2))
     bigger = float(max(len(text1), len(text2)))
-    similarityPercentage = round((bigger - levDis) / bigger * 100, 2)
-    return similarityPercentage
+    if not bigger:
+        return 100.0
+    maxDistance = None
+    if cutoff is not None:
+        # Largest distance whose similarity, once rounded, is not below the cutoff.
+        maxDistance = max(0, int(bigger * (100 - cutoff) / 100))
+        while _percent(bigger, maxDistance + 1) >= cutoff:
+            maxDistance += 1
+        while maxDistance >= 0 and _percent(bigger, maxDistance) < cutoff:
+            maxDistance -= 1
+        if maxDistance < 0:
+            return None
+    levDis = levenshtein_distance(text1, text2, maxDistance)
+    if levDis is None:
+        return None
+    return _percent(bigger, levDis)
@@ -0,0 +1,187 @@
+# SPDX-FileCopyrightText: 2026-present SPDX Contributors
+# SPDX-FileType: SOURCE
+# SPDX-License-Identifier: Apache-2.0
+
+"""HTTP client downloading the SPDX License List.
+
+An HttpClient keeps one pool of connections, of the size of its concurrency,
+and gives every request a timeout. Connection errors, read timeouts and
+429 and 5xx answers are retried with exponential backoff. With a cache
+directory, the documents are saved with their ETag and Last-Modified headers,
+and later requests are conditional: a 304 answer reuses the saved document.
+
+Environment variables:
+    SPDX_LICENSE_LIST_URL  -- base URL of the list (default: https://spdx.org/licenses/)
+    SPDX_HTTP_CACHE  -- directory of the documents saved for conditional requests
+    SPDX_FETCH_CONCURRENCY  -- number of documents downloaded in parallel
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urljoin
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+LICENSE_LIST_URL = 'https://spdx.org/licenses/'
+
+# Documents downloaded in parallel by default.
+DEFAULT_CONCURRENCY = 8
+
+# Seconds to connect, and between two bytes of an answer.
+DEFAULT_TIMEOUT = (10, 30)
+
+# Retries of a request, waiting backoff * 2 ** retry seconds before each one.
+DEFAULT_RETRIES = 4
+DEFAULT_BACKOFF = 0.5
+
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+USER_AGENT = 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/51.0.2704.103 Safari/537.36'
+
+
+def get_list_url(path=''):
+    """URL of a document of the SPDX License List.
+
+    Arguments:
+        path {string} -- path relative to the list, such as 'licenses.json'.
+
+    Returns:
+        string -- the URL, under SPDX_LICENSE_LIST_URL if set.
+    """
+    base = os.environ.get('SPDX_LICENSE_LIST_URL') or LICENSE_LIST_URL
+    if not base.endswith('/'):
+        base += '/'
+    return urljoin(base, path)
+
+
+class HttpClient:
+    """Pooled HTTP client with timeouts, retries and conditional requests."""
+
+    def __init__(self, concurrency=None, timeout=DEFAULT_TIMEOUT, retries=DEFAULT_RETRIES, backoff=DEFAULT_BACKOFF, cacheDir=None):
+        """Create a client.
+
+        Arguments:
+            concurrency {int} -- documents downloaded in parallel by get_all_json() (default: SPDX_FETCH_CONCURRENCY or 8).
+            timeout {float|tuple} -- seconds to connect and to wait for data, or (connect, read).
+            retries {int} -- retries of a failed request.
+            backoff {float} -- backoff factor of the retries, in seconds.
+            cacheDir {string} -- directory of the documents saved for conditional requests (default: SPDX_HTTP_CACHE, if set).
+        """
+        self.concurrency = concurrency or int(os.environ.get('SPDX_FETCH_CONCURRENCY') or DEFAULT_CONCURRENCY)
+        self.timeout = timeout
+        self.cacheDir = cacheDir if cacheDir is not None else os.environ.get('SPDX_HTTP_CACHE')
+        retry = Retry(
+            total=retries,
+            backoff_factor=backoff,
+            status_forcelist=RETRY_STATUSES,
+            allowed_methods=frozenset(['GET']),
+            respect_retry_after_header=True,
+        )
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.concurrency, max_retries=retry)
+        self.session = requests.Session()
+        self.session.headers['User-Agent'] = USER_AGENT
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+    def get(self, url, headers=None):
+        """GET a URL.
+
+        Arguments:
+            url {string} -- the URL.
+            headers {dictionary} -- additional request headers.
+
+        Returns:
+            Response -- the answer, whatever its status once the retries are exhausted.
+        """
+        return self.session.get(url, headers=headers, timeout=self.timeout)
+
+    def get_json(self, url):
+        """GET a JSON document, conditionally if it was saved in the cache directory.
+
+        Arguments:
+            url {string} -- the URL.
+
+        Returns:
+            object -- the decoded document.
+
+        Raises:
+            requests.exceptions.RequestException -- if the document could not be downloaded.
+        """
+        saved = self._load(url)
+        headers = {}
+        if saved is not None:
+            if saved.get('etag'):
+                headers['If-None-Match'] = saved['etag']
+            if saved.get('lastModified'):
+                headers['If-Modified-Since'] = saved['lastModified']
+        response = self.get(url, headers)
+        if response.status_code == 304 and saved is not None:
+            return saved['document']
+        response.raise_for_status()
+        document = response.json()
+        etag = response.headers.get('ETag')
+        lastModified = response.headers.get('Last-Modified')
+        if etag or lastModified:
+            self._save(url, {'etag': etag, 'lastModified': lastModified, 'document': document})
+        return document
+
+    def get_all_json(self, urls):
+        """GET JSON documents, concurrency of them at a time.
+
+        Arguments:
+            urls {list} -- the URLs.
+
+        Returns:
+            list -- the decoded documents, in the order of the URLs.
+        """
+        with ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix='spdx-fetch') as pool:
+            return list(pool.map(self.get_json, urls))
+
+    def close(self):
+        """Close the pooled connections."""
+        self.session.close()
+
+    def _path(self, url):
+        return os.path.join(self.cacheDir, hashlib.sha256(url.encode('utf-8')).hexdigest() + '.json')
+
+    def _load(self, url):
+        if not self.cacheDir:
+            return None
+        try:
+            with open(self._path(url), encoding='utf-8') as fh:
+                return json.load(fh)
+        except (OSError, ValueError):
+            return None
+
+    def _save(self, url, entry):
+        if not self.cacheDir:
+            return
+        os.makedirs(self.cacheDir, exist_ok=True)
+        # Written aside and renamed, so that concurrent builds never read a partial entry.
+        fd, temporaryPath = tempfile.mkstemp(dir=self.cacheDir, suffix='.tmp')
+        with os.fdopen(fd, 'w', encoding='utf-8') as fh:
+            json.dump(entry, fh)
+        os.replace(temporaryPath, self._path(url))
+
+
+_defaultClient = None
+_defaultClientLock = threading.Lock()
+
+
+def get_default_client():
+    """The client shared by the callers which do not have their own.
+
+    Returns:
+        HttpClient -- the shared client.
+    """
+    global _defaultClient
+    with _defaultClientLock:
+        if _defaultClient is None:
+            _defaultClient = HttpClient()
+        return _defaultClient
@@ -0,0 +1,312 @@
+# SPDX-FileCopyrightText: 2026-present SPDX Contributors
+# SPDX-FileType: SOURCE
+# SPDX-License-Identifier: Apache-2.0
+
+"""Precomputed character bigram index of the normalized SPDX License List."""
+
+import hashlib
+import json
+import sys
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import Counter
+
+INDEX_MAGIC = b"SPDXBIGR"
+INDEX_FORMAT_VERSION = 1
+
+
+def count_bigrams(normalizedText):
+    """Count the character bigrams of a normalized license text.
+
+    Arguments:
+        normalizedText {string} -- license text normalized with normalize().
+
+    Returns:
+        Counter -- bigram string as key and number of occurrences as value.
+    """
+    return Counter(normalizedText[i:i+2] for i in range(len(normalizedText)-1))
+
+
+def text_digest(normalizedText):
+    """Digest identifying a normalized license text, for exact match lookups.
+
+    Arguments:
+        normalizedText {string} -- license text normalized with normalize().
+
+    Returns:
+        string -- hexadecimal digest.
+    """
+    return hashlib.blake2b(normalizedText.encode('utf-8'), digest_size=16).hexdigest()
+
+
+def prepare_text(normalizedText, minhash=False):
+    """Compute the data of the index which only depends on one text.
+
+    Arguments:
+        normalizedText {string} -- license text normalized with normalize().
+        minhash {bool} -- also compute its MinHash signature (requires NumPy).
+
+    Returns:
+        tuple -- bigram counts, digest (None for texts without bigrams) and MinHash signature (None without minhash).
+    """
+    # Texts without bigrams score 0.0 even against themselves, so they never match exactly.
+    digest = text_digest(normalizedText) if len(normalizedText) > 1 else None
+    signature = None
+    if minhash:
+        from spdx_license_matcher.minhash import get_minhash_signature
+
+        signature = get_minhash_signature(normalizedText)
+    return count_bigrams(normalizedText), digest, signature
+
+
+class LicenseIndex:
+    """Bigram multisets of every license, stored as compact bigram-id counts.
+
+    The counts are laid out like a sparse row matrix: the bigram ids and counts
+    of the license at position ``pos`` are ``ids[offsets[pos]:offsets[pos+1]]``
+    and ``counts[offsets[pos]:offsets[pos+1]]``, and ``totals[pos]`` is its
+    number of bigrams. A query is therefore only bigrammed once and scored
+    against the stored counts, with the same result as get_dice_coefficient().
+    """
+
+    def __init__(self, names, bigrams, offsets, ids, counts, totals, signatures=None, digests=None):
+        self.names = names
+        self.bigrams = bigrams
+        self.offsets = offsets
+        self.ids = ids
+        self.counts = counts
+        self.totals = totals
+        # MinHash signatures of the licenses, concatenated, when built with minhash=True.
+        self.signatures = signatures
+        # text_digest() of each normalized license text, None for texts without bigrams.
+        self.digests = digests
+        self.bigramIds = {bigram: bigramId for bigramId, bigram in enumerate(bigrams)}
+        self._lengthOrder = None
+        self._exactMatches = None
+        if digests is not None:
+            self._exactMatches = {}
+            for name, digest in zip(names, digests):
+                if digest is not None:
+                    self._exactMatches.setdefault(digest, []).append(name)
+
+    def __len__(self):
+        return len(self.names)
+
+    @classmethod
+    def from_texts(cls, normalizedTexts, minhash=False):
+        """Build an index from normalized license texts.
+
+        Arguments:
+            normalizedTexts {dictionary} -- license ID as key and normalized license text as value.
+            minhash {bool} -- also store MinHash signatures for LSH candidate selection (requires NumPy).
+
+        Returns:
+            LicenseIndex -- the index of the given licenses, in sorted license ID order.
+        """
+        return cls.from_prepared({name: prepare_text(text, minhash) for name, text in normalizedTexts.items()})
+
+    @classmethod
+    def from_prepared(cls, preparedTexts):
+        """Build an index from the data of each text computed by prepare_text().
+
+        Arguments:
+            preparedTexts {dictionary} -- license ID as key and the result of prepare_text() as value.
+
+        Returns:
+            LicenseIndex -- the index of the given licenses, in sorted license ID order.
+        """
+        names = sorted(preparedTexts)
+        bigramCounts = [preparedTexts[name][0] for name in names]
+        bigrams = sorted(set().union(*bigramCounts))
+        bigramIds = {bigram: bigramId for bigramId, bigram in enumerate(bigrams)}
+
+        offsets = array('I', [0])
+        ids = array('I')
+        counts = array('I')
+        totals = array('I')
+        digests = [preparedTexts[name][1] for name in names]
+        for licenseCounts in bigramCounts:
+            for bigramId, count in sorted((bigramIds[bigram], count) for bigram, count in licenseCounts.items()):
+                ids.append(bigramId)
+                counts.append(count)
+            offsets.append(len(ids))
+            totals.append(sum(licenseCounts.values()))
+
+        signatures = None
+        if names and preparedTexts[names[0]][2] is not None:
+            signatures = array('I')
+            for name in names:
+                signatures.extend(preparedTexts[name][2])
+        return cls(names, bigrams, offsets, ids, counts, totals, signatures, digests)
+
+    def to_bytes(self):
+        """Serialize the index to its binary storage format.
+
+        Returns:
+            bytes -- magic, header length, JSON header and the raw count arrays.
+        """
+        arrays = [('offsets', self.offsets), ('ids', self.ids), ('counts', self.counts), ('totals', self.totals)]
+        if self.signatures is not None:
+            arrays.append(('signatures', self.signatures))
+        header = json.dumps({
+            'version': INDEX_FORMAT_VERSION,
+            'byteorder': sys.byteorder,
+            'names': self.names,
+            'bigrams': self.bigrams,
+            'digests': self.digests,
+            'arrays': [[name, values.typecode, len(values)] for name, values in arrays],
+        }).encode('utf-8')
+        header += b' ' * (-len(header) % 4)
+        chunks = [INDEX_MAGIC, len(header).to_bytes(4, 'little'), header]
+        chunks.extend(values.tobytes() for _, values in arrays)
+        return b''.join(chunks)
+
+    @classmethod
+    def from_bytes(cls, data, copy=True):
+        """Load an index serialized with to_bytes().
+
+        Arguments:
+            data {bytes} -- serialized index, or any buffer such as a memory-mapped file.
+            copy {bool} -- copy the arrays; when False and the byte order matches, they are
+                read-only views of the buffer, so processes mapping the same file share them.
+
+        Returns:
+            LicenseIndex -- the deserialized index.
+        """
+        data = memoryview(data)
+        if data[:len(INDEX_MAGIC)] != INDEX_MAGIC:
+            raise ValueError('Not a SPDX license bigram index.')
+        position = len(INDEX_MAGIC)
+        headerLength = int.from_bytes(data[position:position+4], 'little')
+        position += 4
+        header = json.loads(bytes(data[position:position+headerLength]).decode('utf-8'))
+        position += headerLength
+        if header['version'] != INDEX_FORMAT_VERSION:
+            raise ValueError(f"Unsupported license index version {header['version']}.")
+
+        arrays = {}
+        for name, typecode, length in header['arrays']:
+            values = array(typecode)
+            size = length * values.itemsize
+            if not copy and header['byteorder'] == sys.byteorder:
+                values = data[position:position+size].cast(typecode)
+            else:
+                values.frombytes(data[position:position+size])
+                if header['byteorder'] != sys.byteorder:
+                    values.byteswap()
+            arrays[name] = values
+            position += size
+        return cls(
+            header['names'], header['bigrams'], arrays['offsets'], arrays['ids'], arrays['counts'], arrays['totals'],
+            arrays.get('signatures'), header.get('digests'),
+        )
+
+    def get_exact_matches(self, normalizedText):
+        """Licenses whose normalized text is identical to the input, found without scoring.
+
+        They are the licenses which get_scores() would score 1.0, barring texts
+        that differ but have exactly the same bigrams.
+
+        Arguments:
+            normalizedText {string} -- normalized input license text.
+
+        Returns:
+            list -- license IDs in index order, or None if the index has no text digests.
+        """
+        if self._exactMatches is None:
+            return None
+        return self._exactMatches.get(text_digest(normalizedText), [])
+
+    def query_counts(self, normalizedText):
+        """Bigram the input text once for scoring against the index.
+
+        Bigrams that occur in no license can never match, so they only count
+        towards the total.
+
+        Arguments:
+            normalizedText {string} -- normalized input license text.
+
+        Returns:
+            tuple -- dictionary of bigram id to count, and total number of bigrams.
+        """
+        bigramIds = self.bigramIds
+        queryCounts = {}
+        for bigram, count in count_bigrams(normalizedText).items():
+            bigramId = bigramIds.get(bigram)
+            if bigramId is not None:
+                queryCounts[bigramId] = count
+        return queryCounts, max(len(normalizedText) - 1, 0)
+
+    def get_length_candidates(self, queryTotal, threshold):
+        """Positions of the licenses whose number of bigrams allows reaching the threshold.
+
+        The Dice coefficient of texts with na and nb bigrams is at most
+        2*min(na, nb)/(na + nb). The bound is computed the same way as the
+        coefficient, so no license that would score at or above the threshold
+        is left out.
+
+        Arguments:
+            queryTotal {int} -- number of bigrams of the input.
+            threshold {float} -- confidence threshold.
+
+        Returns:
+            list -- license positions in the index, in ascending order of length.
+        """
+        if self._lengthOrder is None:
+            positions = sorted(range(len(self.names)), key=self.totals.__getitem__)
+            self._lengthOrder = (positions, [self.totals[pos] for pos in positions])
+        positions, sortedTotals = self._lengthOrder
+        if threshold <= 0.0:
+            return list(positions)
+        if not queryTotal:
+            return []
+        # t*na/(2-t) <= nb <= na*(2-t)/t, widened by one and then checked exactly.
+        low = bisect_left(sortedTotals, int(queryTotal * threshold / (2.0 - threshold)) - 1)
+        high = bisect_right(sortedTotals, int(queryTotal * (2.0 - threshold) / threshold) + 1)
+        return [
+            positions[i]
+            for i in range(low, high)
+            if sortedTotals[i] and float(2*min(queryTotal, sortedTotals[i]))/float(queryTotal + sortedTotals[i]) >= threshold
+        ]
+
+    def get_scores(self, normalizedText, candidates=None):
+        """Sorensen dice coefficient of the input against the indexed licenses.
+
+        Texts of fewer than two characters have no bigrams and score 0.0.
+
+        Arguments:
+            normalizedText {string} -- normalized input license text.
+            candidates {list} -- positions of the licenses to score (default: all of them).
+
+        Returns:
+            dictionary -- license ID as key and dice coefficient as value.
+        """
+        return dict(self.iter_scores(normalizedText, candidates))
+
+    def iter_scores(self, normalizedText, candidates=None):
+        """Same as get_scores(), one license at a time.
+
+        Arguments:
+            normalizedText {string} -- normalized input license text.
+            candidates {list} -- positions of the licenses to score (default: all of them).
+
+        Returns:
+            generator -- (license ID, dice coefficient) of each license, in the order of the candidates.
+        """
+        queryCounts, queryTotal = self.query_counts(normalizedText)
+        offsets, ids, counts, totals, names = self.offsets, self.ids, self.counts, self.totals, self.names
+        if candidates is None:
+            candidates = range(len(names))
+        for pos in candidates:
+            name = names[pos]
+            total = totals[pos]
+            if not queryTotal or not total:
+                yield name, 0.0
+                continue
+            start, end = offsets[pos], offsets[pos+1]
+            matches = 0
+            for bigramId, count in zip(ids[start:end], counts[start:end]):
+                queryCount = queryCounts.get(bigramId)
+                if queryCount:
+                    matches += queryCount if queryCount < count else count
+            yield name, float(2*matches)/float(queryTotal + total)
@@ -0,0 +1,145 @@
+# SPDX-FileCopyrightText: 2026-present SPDX Contributors
+# SPDX-FileType: SOURCE
+# SPDX-License-Identifier: Apache-2.0
+
+"""Named timing spans around the stages of matching, reported to listeners.
+
+Stages are wrapped in span(name). A listener is a function called with the
+name and the duration in seconds of every span, for example to forward the
+timings to a metrics system:
+
+    from spdx_license_matcher import instrument
+
+    instrument.add_listener(lambda name, seconds: histogram(name).observe(seconds))
+
+Spans nest: the time of 'verify.lookup' is also part of 'verify'. Without
+listeners, and outside capture(), a span costs a couple of attribute lookups.
+
+Span names:
+    store.fetch, store.load, decompress  -- loading the corpus (and texts from Redis)
+    read, normalize, score, shingles, segment  -- matching an input
+    cache  -- result cache lookups
+    jvm.start, jvm.init, verify, verify.lookup, verify.compare  -- the SPDX Java library
+    spdx.fetch, similarity, diff  -- showing the differences with a license
+"""
+
+import functools
+import threading
+import time
+from contextlib import contextmanager
+
+_listeners = []
+_local = threading.local()
+
+
+def add_listener(listener):
+    """Call listener(name, seconds) at the end of every span.
+
+    Arguments:
+        listener {function} -- called with the span name and its duration in seconds, from any thread.
+    """
+    _listeners.append(listener)
+
+
+def remove_listener(listener):
+    """Stop calling a listener added by add_listener().
+
+    Arguments:
+        listener {function} -- the listener.
+    """
+    _listeners.remove(listener)
+
+
+@contextmanager
+def span(name):
+    """Time the code run in the context as the span name."""
+    if not _listeners and getattr(_local, 'spans', None) is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record(name, time.perf_counter() - start)
+
+
+def timed(name):
+    """Decorator timing every call of a function as the span name."""
+    def decorator(function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if not _listeners and getattr(_local, 'spans', None) is None:
+                return function(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                record(name, time.perf_counter() - start)
+        return wrapper
+    return decorator
+
+
+def record(name, seconds):
+    """Report a span timed by other means, or in another process.
+
+    Arguments:
+        name {string} -- span name.
+        seconds {float} -- duration of the span.
+    """
+    spans = getattr(_local, 'spans', None)
+    if spans is not None:
+        spans.append((name, seconds))
+        return
+    for listener in list(_listeners):
+        listener(name, seconds)
+
+
+@contextmanager
+def capture():
+    """Hold back the spans of the calling thread instead of reporting them.
+
+    Used by worker processes, whose spans are sent back with their results and
+    reported with record() by the process having the listeners.
+
+    Returns:
+        list -- (name, seconds) of each span ended in the context.
+    """
+    previous = getattr(_local, 'spans', None)
+    spans = _local.spans = []
+    try:
+        yield spans
+    finally:
+        _local.spans = previous
+
+
+class Profile:
+    """Listener adding up the calls and time of each span.
+
+    The spans of parallel worker processes add up, so their total may exceed the wall time.
+    """
+
+    def __init__(self):
+        self.calls = {}
+        self.seconds = {}
+        self._lock = threading.Lock()
+        self._start = time.perf_counter()
+
+    def __call__(self, name, seconds):
+        with self._lock:
+            self.calls[name] = self.calls.get(name, 0) + 1
+            self.seconds[name] = self.seconds.get(name, 0.0) + seconds
+
+    def format(self):
+        """Breakdown of the time spent in each span, the slowest first.
+
+        Returns:
+            list -- lines of text.
+        """
+        elapsed = time.perf_counter() - self._start
+        lines = ['{:<18} {:>8} {:>11} {:>11} {:>8}'.format('span', 'calls', 'total s', 'mean ms', '% wall')]
+        for name in sorted(self.seconds, key=lambda name: -self.seconds[name]):
+            seconds = self.seconds[name]
+            lines.append('{:<18} {:>8} {:>11.3f} {:>11.3f} {:>7.1f}%'.format(
+                name, self.calls[name], seconds, 1000 * seconds / self.calls[name], 100 * seconds / elapsed if elapsed else 0))
+        lines.append('{:<18} {:>8} {:>11.3f}'.format('wall', '', elapsed))
+        return lines
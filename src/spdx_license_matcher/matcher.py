@@ -4,16 +4,27 @@
 
 """Command line interface for the SPDX License Matcher tool."""
 
-import os
+import json
+import time
+from importlib.util import find_spec
 
 import click
-import redis
 from dotenv import load_dotenv
 
-from spdx_license_matcher.build_licenses import build_spdx_licenses, is_keys_empty
-from spdx_license_matcher.computation import get_close_matches, get_matching_string
-from spdx_license_matcher.difference import generate_diff, get_similarity_percent
+from spdx_license_matcher.batch import DEFAULT_MAX_SIZE, InputTooLargeError, collect_files, score_files
+from spdx_license_matcher.build_licenses import build_spdx_licenses, get_license_index, is_keys_empty
+from spdx_license_matcher.cache import DEFAULT_MAX_ENTRIES as DEFAULT_CACHE_ENTRIES
+from spdx_license_matcher.cache import CachedVerifier, open_cache
+from spdx_license_matcher.candidates import CandidateStats
+from spdx_license_matcher.computation import get_matching_string, get_standard_match
+from spdx_license_matcher.difference import generate_diff, generate_word_diff, get_similarity_percent
+from spdx_license_matcher.instrument import Profile, add_listener, record, remove_listener
+from spdx_license_matcher.segment import LicenseSegmenter
+from spdx_license_matcher.shingles import ShingleIndex
+from spdx_license_matcher.snapshot import Snapshot
+from spdx_license_matcher.storage import open_store
 from spdx_license_matcher.utils import colors, get_spdx_license_text
+from spdx_license_matcher.verify import open_verifier
 
 load_dotenv()
 
@@ -29,33 +40,34 @@ def _print_version_callback(ctx, param, value):
     ctx.exit()
 
 
-@click.command()
-@click.option('--text_file', '-f', required=True, help='The name of the file in which there is the text you want to match against the SPDX License database.')
-@click.option('--threshold', '-t', default=0.9, type = click.FloatRange(0.0, 1.0), help='Confidence threshold below which we just won"t consider it a match.', show_default=True)
-@click.option('--build/--no-build', default=False, help='Builds the SPDX license list in the database. If licenses are already present it will update the redis database.')
-@click.option('--version', '-V', is_flag=True, is_eager=True, callback=_print_version_callback, expose_value=False, help='Show version and exit.')
-def matcher(text_file, threshold, build):
-    """SPDX License matcher to match license text against the SPDX license list using an algorithm which finds close matches."""
-    with open(text_file, "r", encoding="utf-8") as fh:
-        inputText = fh.read()
-
-    if build or is_keys_empty():
-        click.echo('Building SPDX License List. This may take a while...')
-        build_spdx_licenses()
-
-    r = redis.StrictRedis(host=os.environ.get(key="SPDX_REDIS_HOST", default="localhost"), port=6379, db=0)
-    keys = r.keys()
-    values = r.mget(keys)
-    licenseData = dict(list(zip(keys, values)))
-    matches = get_close_matches(inputText, licenseData, threshold)
-    matchingString = get_matching_string(matches, inputText)
+def _echo_result(inputText, matches, snapshot=None, verifier=None, cache=None, stats=None, cutoff=None, wordDiff=False):
+    """Verify the close matches against the SPDX standard texts and print the outcome.
+
+    The similarity and the differences are only shown if the similarity is at least cutoff percent.
+    """
+    matchingString = get_matching_string(matches, inputText, verifier)
     if matchingString == '':
         licenseID = max(matches, key=matches.get)
-        spdxLicenseText = get_spdx_license_text(licenseID)
-        similarityPercent = get_similarity_percent(spdxLicenseText, inputText)
-        click.echo(colors('\nThe given license text matches {}% with that of {} based on Levenstein distance.'.format(similarityPercent, licenseID), 94))
-        differences = generate_diff(spdxLicenseText, inputText)
-        for line in differences:
+
+        def compare():
+            spdxLicenseText = get_spdx_license_text(licenseID, snapshot)
+            similarityPercent = get_similarity_percent(spdxLicenseText, inputText, cutoff)
+            if similarityPercent is None:
+                return {'similarityPercent': None, 'diff': []}
+            return {
+                'similarityPercent': similarityPercent,
+                'diff': (generate_word_diff if wordDiff else generate_diff)(spdxLicenseText, inputText),
+            }
+
+        if cache is None:
+            difference = compare()
+        else:
+            difference = cache.fetch(cache.make_key('difference', inputText, licenseID, cutoff, wordDiff), compare, stats)
+        if difference['similarityPercent'] is None:
+            click.echo(colors('\nThe given license text matches less than {}% with that of {} based on Levenstein distance.'.format(cutoff, licenseID), 94))
+            return
+        click.echo(colors('\nThe given license text matches {}% with that of {} based on Levenstein distance.'.format(difference['similarityPercent'], licenseID), 94))
+        for line in difference['diff']:
             if line[0] == '+':
                 line = colors(line, 92)
             if line[0] == '-':
@@ -67,5 +79,185 @@ def matcher(text_file, threshold, build):
         click.echo(colors(matchingString, 92))
 
 
+def _echo_segments(segments):
+    """Print the licenses found in parts of a file."""
+    if not segments:
+        click.echo(colors('There is not enough confidence threshold for any part of the text to match against the SPDX License database.', 91))
+        return
+    click.echo(colors('The following license ID(s) were found:', 92))
+    for segment in segments:
+        click.echo('  {} ({:.1%}) at characters {}-{} of the normalized text'.format(segment.licenseId, segment.score, segment.start, segment.end))
+
+
+def _echo_profile(stageProfile):
+    """Print the time spent in each stage."""
+    remove_listener(stageProfile)
+    for line in stageProfile.format():
+        click.echo(line, err=True)
+
+
+def _json_record(result, snapshot=None, verifier=None, cache=None, stats=None, cutoff=None):
+    """Machine-readable result of one file, verified the same way as _echo_result()."""
+    record = {'file': result.path}
+    timings = result.timings
+    if result.error is not None:
+        if isinstance(result.error, InputTooLargeError):
+            record['verdict'] = 'too-large'
+        record['error'] = str(result.error)
+        record['timings'] = timings
+        return record
+
+    if result.segments is not None:
+        record['verdict'] = 'segments' if result.segments else 'no-match'
+        record['segments'] = [
+            {'licenseId': segment.licenseId, 'start': segment.start, 'end': segment.end, 'score': segment.score}
+            for segment in result.segments
+        ]
+        record['timings'] = timings
+        return record
+
+    matches = result.matches
+    inputText = result.inputText
+    record['matches'] = [
+        {'licenseId': licenseID, 'score': score}
+        for licenseID, score in sorted(matches.items(), key=lambda item: (-item[1], item[0]))
+    ]
+    if not matches:
+        record['verdict'] = 'no-match'
+        record['matchedLicenseIds'] = []
+    elif all(score == 1.0 for score in matches.values()):
+        record['verdict'] = 'perfect'
+        record['matchedLicenseIds'] = list(matches)
+    else:
+        start = time.perf_counter()
+        licenseID = get_standard_match(matches, inputText, verifier)
+        timings['verify'] = time.perf_counter() - start
+        if licenseID is not None:
+            record['verdict'] = 'standard'
+            record['matchedLicenseIds'] = [licenseID]
+        else:
+            record['verdict'] = 'different'
+            record['matchedLicenseIds'] = []
+            licenseID = max(matches, key=matches.get)
+            record['closestLicenseId'] = licenseID
+            similarityKey = None if cache is None else cache.make_key('similarity', inputText, licenseID, cutoff)
+            similarity = None if cache is None else cache.get(similarityKey, stats)
+            if similarity is None:
+                start = time.perf_counter()
+                spdxLicenseText = get_spdx_license_text(licenseID, snapshot)
+                timings['fetch'] = time.perf_counter() - start
+                start = time.perf_counter()
+                similarity = {'similarityPercent': get_similarity_percent(spdxLicenseText, inputText, cutoff)}
+                timings['similarity'] = time.perf_counter() - start
+                if cache is not None:
+                    cache.put(similarityKey, similarity, stats)
+            record['similarityPercent'] = similarity['similarityPercent']
+    record['candidates'] = {
+        'total': result.stats.total,
+        'prunedByLength': result.stats.prunedByLength,
+        'prunedByMinHash': result.stats.prunedByMinHash,
+        'prunedByShingles': result.stats.prunedByShingles,
+        'exactMatch': result.stats.exactHits > 0,
+    }
+    record['timings'] = timings
+    return record
+
+
+@click.command()
+@click.option('--text_file', '-f', multiple=True, help='The name of the file in which there is the text you want to match against the SPDX License database. Can be repeated.')
+@click.option('--directory', '-d', multiple=True, type=click.Path(exists=True, file_okay=False), help='Match every file in this directory tree. Can be repeated.')
+@click.option('--glob', '-g', 'patterns', multiple=True, help='Match every file matching this glob pattern ("**" matches any directories). Can be repeated.')
+@click.option('--jobs', '-j', default=1, type=click.IntRange(1), help='Number of worker processes scoring files in parallel.', show_default=True)
+@click.option('--max-size', 'maxSize', default=DEFAULT_MAX_SIZE, type=click.IntRange(0), help='Files larger than this many bytes are not matched and are reported as too large; 0 for no limit.', show_default=True)
+@click.option('--verifier', 'verifierKind', type=click.Choice(['java', 'template']), default='java', help='Verify the close matches with the SPDX Java library, or with the SPDX license templates in Python, using the Java library only for licenses without a usable template. template is experimental: its answers are not yet checked against the Java library on the whole license list.', show_default=True)
+@click.option('--verify-threads', 'verifyThreads', default=0, type=click.IntRange(0), help='Threads verifying the close matches of a file against the SPDX standard texts with the Java library in parallel; 0 verifies them one after the other.', show_default=True)
+@click.option('--threshold', '-t', default=0.9, type = click.FloatRange(0.0, 1.0), help='Confidence threshold below which we just won"t consider it a match.', show_default=True)
+@click.option('--build/--no-build', default=False, help='Builds the SPDX license list in the database. If licenses are already present it will update the licenses which changed in a new version of the list.')
+@click.option('--store', 'storeSpec', envvar='SPDX_CORPUS_STORE', help='Where the license corpus is kept: "redis" (default, at SPDX_REDIS_HOST), a redis:// URL, or the path of a local memory-mapped corpus file.')
+@click.option('--snapshot', 'snapshotPath', envvar='SPDX_LICENSE_SNAPSHOT', type=click.Path(exists=True, dir_okay=False), help='Offline SPDX License List snapshot (see spdx-license-matcher-snapshot) used to build the database and show differences without network access.')
+@click.option('--engine', type=click.Choice(['python', 'sparse']), default='python', help='Scoring engine. "sparse" scores all licenses at once with NumPy/SciPy (pip install license-matcher[fast]).', show_default=True)
+@click.option('--lsh', is_flag=True, default=False, help='Only score licenses found similar by MinHash LSH. Faster, but may miss matches (requires license-matcher[fast]).')
+@click.option('--shingles', is_flag=True, default=False, help='Only score the licenses ranked closest by a word shingle index weighted toward the phrases telling them apart. Fewer close matches to verify, but may miss matches.')
+@click.option('--cache', 'cacheSpec', envvar='SPDX_RESULT_CACHE', help='Also keep the results in a persistent cache shared by runs: "redis" (at SPDX_REDIS_HOST), a redis:// URL, or the path of a local SQLite file.')
+@click.option('--cache-size', 'cacheSize', default=DEFAULT_CACHE_ENTRIES, type=click.IntRange(0), help='Results kept in memory, by each worker process, so that files seen before are not matched again; 0 for none.', show_default=True)
+@click.option('--min-similarity', 'minSimilarity', default=0.0, type=click.FloatRange(0.0, 100.0), help='When the text differs from all the licenses, only compute its exact similarity with the closest one, and show the differences, if it is at least this many percent.', show_default=True)
+@click.option('--diff', 'diffMode', type=click.Choice(['line', 'word']), default='line', help='Show the differences by line of the texts, or by word of the normalized texts.', show_default=True)
+@click.option('--segment', is_flag=True, default=False, help='Find the licenses in parts of each file, for files holding several licenses such as THIRD-PARTY-NOTICES.')
+@click.option('--format', 'outputFormat', type=click.Choice(['text', 'json']), default='text', help='"json" streams one JSON object per file (NDJSON) as soon as it is matched, with scores, verdict and timings.', show_default=True)
+@click.option('--profile', is_flag=True, default=False, help='Print the time spent in each stage (reading, normalization, scoring, JVM, verification, downloads...) to stderr.')
+@click.option('--verbose', '-v', is_flag=True, default=False, help='Report how many files matched exactly and how many licenses were pruned before scoring.')
+@click.option('--version', '-V', is_flag=True, is_eager=True, callback=_print_version_callback, expose_value=False, help='Show version and exit.')
+def matcher(text_file, directory, patterns, jobs, maxSize, verifierKind, verifyThreads, threshold, build, storeSpec, snapshotPath, engine, lsh, shingles, cacheSpec, cacheSize, minSimilarity, diffMode, segment, outputFormat, profile, verbose):
+    """SPDX License matcher to match license text against the SPDX license list using an algorithm which finds close matches."""
+    paths = collect_files(text_file, directory, patterns)
+    if not paths:
+        raise click.UsageError('Give the files to match with --text_file, --directory or --glob.')
+    if profile:
+        stageProfile = Profile()
+        add_listener(stageProfile)
+        click.get_current_context().call_on_close(lambda: _echo_profile(stageProfile))
+
+    if engine == 'sparse' and (find_spec('numpy') is None or find_spec('scipy') is None):
+        raise click.ClickException('The sparse engine requires NumPy and SciPy: pip install license-matcher[fast]')
+    if shingles and segment:
+        raise click.UsageError('--shingles only shortlists the licenses matched against whole files, not with --segment.')
+    if lsh and find_spec('numpy') is None:
+        raise click.ClickException('MinHash LSH requires NumPy: pip install license-matcher[fast]')
+
+    store = open_store(storeSpec)
+    snapshot = Snapshot.load(snapshotPath) if snapshotPath else None
+    if build or is_keys_empty(store):
+        click.echo('Building SPDX License List. This may take a while...', err=outputFormat == 'json')
+        if not build_spdx_licenses(snapshot, store, onlyIfEmpty=not build) and build:
+            click.echo('The SPDX License List is up to date.', err=outputFormat == 'json')
+
+    # The corpus is loaded once, and once per worker process, for all the files.
+    index = get_license_index(store)
+    if lsh and index.signatures is None:
+        raise click.ClickException('The license database has no MinHash signatures. Rebuild it with --build after installing license-matcher[fast].')
+
+    segmenter = LicenseSegmenter(store.load_normalized_texts()) if segment else None
+    shingleIndex = ShingleIndex(index.names, store.load_normalized_texts()) if shingles else None
+
+    cache = open_cache(cacheSpec, index, store, cacheSize)
+    cutoff = minSimilarity or None
+
+    stats = CandidateStats()
+    standardVerifier = open_verifier(verifierKind, snapshot, verifyThreads)
+    verifier = standardVerifier if cache is None else CachedVerifier(standardVerifier, cache, stats)
+    try:
+        for result in score_files(paths, index, threshold, jobs, engine, lsh, outputFormat == 'text', store, maxSize, segmenter, cache, shingleIndex):
+            stats.add(result.stats)
+            for name, seconds in result.spans:
+                record(name, seconds)
+            if outputFormat == 'json':
+                click.echo(json.dumps(_json_record(result, snapshot, verifier, cache, stats, cutoff)))
+                continue
+            if len(paths) > 1:
+                click.echo(colors('==> {} <=='.format(result.path), 1))
+            if isinstance(result.error, InputTooLargeError):
+                click.echo(colors('Skipped: {}.'.format(result.error), 93))
+                continue
+            if result.error is not None:
+                click.echo(colors('Could not read {}: {}'.format(result.path, result.error), 91))
+                continue
+            if result.segments is not None:
+                _echo_segments(result.segments)
+                continue
+            _echo_result(result.inputText, result.matches, snapshot, verifier, cache, stats, cutoff, diffMode == 'word')
+    finally:
+        standardVerifier.close()
+
+    if verbose and stats.exactHits:
+        click.echo('{} of {} files matched a license text exactly.'.format(
+            stats.exactHits, stats.exactHits + stats.exactMisses), err=True)
+    if verbose and stats.cacheHits + stats.cacheMisses:
+        click.echo('Result cache: {} hits, {} misses, {} evictions.'.format(
+            stats.cacheHits, stats.cacheMisses, stats.cacheEvictions), err=True)
+    if verbose and stats.total:
+        click.echo('Scored {} of {} licenses ({} pruned by length, {} by MinHash LSH, {} by word shingles).'.format(
+            stats.scored, stats.total, stats.prunedByLength, stats.prunedByMinHash, stats.prunedByShingles), err=True)
+
+
 if __name__ == "__main__":
     matcher()
@@ -0,0 +1,95 @@
+# SPDX-FileCopyrightText: 2026-present SPDX Contributors
+# SPDX-FileType: SOURCE
+# SPDX-License-Identifier: Apache-2.0
+
+"""MinHash signatures and locality-sensitive hashing over normalized license texts.
+
+Requires the optional ``fast`` dependencies (``pip install license-matcher[fast]``).
+"""
+
+import zlib
+from array import array
+
+import numpy as np
+
+NUM_PERMUTATIONS = 128
+BAND_ROWS = 4
+SHINGLE_SIZE = 5
+
+# Permutations are h(x) = (a*x + b) mod p over 31-bit shingle hashes, so that
+# every product fits in 64 bits. The coefficients come from a fixed LCG, and
+# not from a NumPy random generator, so stored signatures stay valid across versions.
+_PRIME = (1 << 31) - 1
+
+
+def _coefficients(count, seed):
+    values = []
+    state = seed
+    for _ in range(count):
+        state = (state * 6364136223846793005 + 1442695040888963407) % (1 << 64)
+        values.append(state >> 34)
+    return np.array([value % (_PRIME - 1) + 1 for value in values], dtype=np.uint64)
+
+
+_A = _coefficients(NUM_PERMUTATIONS, 1)
+_B = _coefficients(NUM_PERMUTATIONS, 2)
+
+
+def get_minhash_signature(normalizedText):
+    """MinHash signature of the character shingles of a normalized license text.
+
+    Arguments:
+        normalizedText {string} -- normalized license text.
+
+    Returns:
+        array -- NUM_PERMUTATIONS unsigned integers; equal texts have equal signatures.
+    """
+    shingles = {
+        zlib.crc32(normalizedText[i:i+SHINGLE_SIZE].encode('utf-8')) & _PRIME
+        for i in range(max(len(normalizedText) - SHINGLE_SIZE + 1, 1))
+    }
+    hashes = np.fromiter(shingles, dtype=np.uint64, count=len(shingles))
+    signature = np.full(NUM_PERMUTATIONS, _PRIME, dtype=np.uint64)
+    for start in range(0, len(hashes), 4096):
+        chunk = hashes[start:start+4096]
+        permuted = (_A[:, None] * chunk[None, :] + _B[:, None]) % _PRIME
+        np.minimum(signature, permuted.min(axis=1), out=signature)
+    return array('I', signature.astype(np.uint32).tobytes())
+
+
+class MinHashLSH:
+    """Banded LSH table over the MinHash signatures stored in a LicenseIndex.
+
+    Licenses sharing all BAND_ROWS rows of at least one band with the input are
+    candidates, which keeps licenses with a shingle Jaccard similarity of about
+    0.6 and above with high probability.
+    """
+
+    def __init__(self, signatures):
+        self.buckets = {}
+        numLicenses = len(signatures) // NUM_PERMUTATIONS
+        for pos in range(numLicenses):
+            signature = signatures[pos*NUM_PERMUTATIONS:(pos+1)*NUM_PERMUTATIONS]
+            for key in _band_keys(signature):
+                self.buckets.setdefault(key, []).append(pos)
+
+    def get_candidates(self, normalizedText):
+        """Positions of the licenses that share a band with the input.
+
+        Arguments:
+            normalizedText {string} -- normalized input license text.
+
+        Returns:
+            set -- license positions in the index.
+        """
+        candidates = set()
+        for key in _band_keys(get_minhash_signature(normalizedText)):
+            candidates.update(self.buckets.get(key, ()))
+        return candidates
+
+
+def _band_keys(signature):
+    return [
+        (band, tuple(signature[band*BAND_ROWS:(band+1)*BAND_ROWS]))
+        for band in range(NUM_PERMUTATIONS // BAND_ROWS)
+    ]
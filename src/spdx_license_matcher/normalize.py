@@ -6,6 +6,12 @@
 
 import re
 
+from spdx_license_matcher.instrument import timed
+
+# Version of the normalized texts; bump it whenever normalize() gives different texts, so that the
+# corpora and snapshots normalized by an older version are normalized again.
+NORMALIZER_VERSION = 1
+
 URL_REGEX = r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\(\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+'
 COPYRIGHT_NOTICE_REGEX = r"((?<=\n)|.*)Copyright.+(?=\n)|Copyright.+\\n"
 COPYRIGHT_SYMBOLS = r"[©Ⓒⓒ]"
@@ -59,46 +65,117 @@ VARIETAL_WORDS_SPELLING = {
 }
 
 
-def normalize(licenseText):
+# Compiled once rather than looked up in the re module cache for every text.
+_URL_PATTERN = re.compile(URL_REGEX)
+_COMMENTS_PATTERN = re.compile(COMMENTS_REGEX)
+_BULLETS_NUMBERING_PATTERN = re.compile(BULLETS_NUMBERING_REGEX)
+_COPYRIGHT_SYMBOLS_TABLE = str.maketrans({symbol: "(C)" for symbol in COPYRIGHT_SYMBOLS.strip("[]")})
+# EXTRANEOUS_REGEX without its leading whitespace, which is removed by _remove_extraneous_text().
+_EXTRANEOUS_PHRASE_PATTERN = re.compile(r"(?i)end of terms and conditions")
+_ADDENDIUM_EXHIBIT_WORDS = ("APPENDIX", "APADDENDUM", "EXHIBIT")
+# The spellings are replaced one after the other, in this order: a replacement can create or
+# consume an occurrence of a later spelling (e.g. "sub-licence" becomes "sub-license", then
+# "sublicense"), which a single pass over all of them would not reproduce. A spelling absent
+# from the text costs one scan and no copy.
+_VARIETAL_WORDS_SPELLING = tuple(VARIETAL_WORDS_SPELLING.items())
+
+
+@timed('normalize')
+def normalize(licenseText, wholeText=True):
     """Normalize the license text with all the SPDX license list matching guidelines.
 
     Arguments:
         licenseText {string} -- licenseText is the license text of the license.
+        wholeText {bool} -- the text is a single license; when False, the title line and
+            the text after the end of the terms or an appendix are kept, as the text may
+            hold several licenses one after the other.
 
     Returns:
         string -- license text nomalized with all the SPDX matching guidelines.
     """
 
     # To avoid a possibility of a non-match due to urls not being same.
-    licenseText = re.sub(URL_REGEX, 'normalized/url', licenseText)
+    licenseText = _URL_PATTERN.sub('normalized/url', licenseText)
 
     # To avoid the license mismatch merely due to the existence or absence of code comment indicators placed within the license text, they are just removed.
-    licenseText = re.sub(COMMENTS_REGEX, "", licenseText)
+    licenseText = _COMMENTS_PATTERN.sub("", licenseText)
 
     # To avoid a license mismatch merely because extraneous text that appears at the end of the terms of a license is different or missing.
-    licenseText = re.sub(EXTRANEOUS_REGEX, "", licenseText)
-    licenseText = re.sub(ADDENDIUM_EXHIBIT_REGEX, "", licenseText)
+    if wholeText:
+        licenseText = _remove_extraneous_text(licenseText)
+        licenseText = _remove_addendum_exhibit(licenseText)
 
     # By using a default copyright symbol (c)", we can avoid the possibility of a mismatch.
-    licenseText = re.sub(COPYRIGHT_SYMBOLS, "(C)", licenseText)
+    licenseText = licenseText.translate(_COPYRIGHT_SYMBOLS_TABLE)
 
     # To avoid a license mismatch merely because the copyright notice is different, it is not substantive and is removed.
-    licenseText = re.sub(COPYRIGHT_NOTICE_REGEX, "", licenseText)
+    licenseText = _remove_copyright_notices(licenseText)
 
     # To avoid a possibility of a non-match due to case sensitivity.
     licenseText = licenseText.lower()
 
     # To remove the license name or title present at the beginning of the license text.
-    if 'license' in licenseText.split('\n')[0]:
-        licenseText = '\n'.join(licenseText.split('\n')[1:])
+    if wholeText:
+        firstLineEnd = licenseText.find('\n')
+        if firstLineEnd == -1:
+            if 'license' in licenseText:
+                licenseText = ''
+        elif 'license' in licenseText[:firstLineEnd]:
+            licenseText = licenseText[firstLineEnd+1:]
 
     # To avoid the possibility of a non-match due to variations of bullets, numbers, letter, or no bullets used are simply removed.
-    licenseText = re.sub(BULLETS_NUMBERING_REGEX, " ", licenseText)
+    licenseText = _BULLETS_NUMBERING_PATTERN.sub(" ", licenseText)
 
     # To avoid the possibility of a non-match due to the same word being spelled differently.
-    for initial, final in VARIETAL_WORDS_SPELLING.items():
+    for initial, final in _VARIETAL_WORDS_SPELLING:
         licenseText = licenseText.replace(initial, final)
 
     # To avoid the possibility of a non-match due to different spacing of words, line breaks, or paragraphs.
     licenseText = " ".join(licenseText.split())
     return licenseText
+
+
+# The helpers below remove exactly what re.sub() of the corresponding regex removes, in
+# linear time: the regexes backtrack over whole lines or whitespace runs at every position,
+# which is quadratic on long lines such as minified sources.
+
+def _remove_extraneous_text(licenseText):
+    """Same as re.sub(EXTRANEOUS_REGEX, "", licenseText)."""
+    match = _EXTRANEOUS_PHRASE_PATTERN.search(licenseText)
+    if match is None:
+        return licenseText
+    return licenseText[:match.start()].rstrip()
+
+
+def _remove_addendum_exhibit(licenseText):
+    """Same as re.sub(ADDENDIUM_EXHIBIT_REGEX, "", licenseText)."""
+    end = len(licenseText)
+    for word in _ADDENDIUM_EXHIBIT_WORDS:
+        position = licenseText.find(word, 0, end)
+        if position != -1:
+            end = position
+    return licenseText[:end]
+
+
+def _remove_copyright_notices(licenseText):
+    """Same as re.sub(COPYRIGHT_NOTICE_REGEX, "", licenseText).
+
+    A line followed by a newline is emptied if it has "Copyright" followed by
+    at least one character. The last line, which is not followed by a newline,
+    loses everything from its first "Copyright" to its last literal backslash-n,
+    if there is one after "Copyright" and at least one character.
+    """
+    if 'Copyright' not in licenseText:
+        return licenseText
+    lines = licenseText.split('\n')
+    for number in range(len(lines) - 1):
+        line = lines[number]
+        if line.find('Copyright', 0, len(line) - 1) != -1:
+            lines[number] = ''
+    lastLine = lines[-1]
+    start = lastLine.find('Copyright')
+    if start != -1:
+        end = lastLine.rfind('\\n')
+        if end >= start + len('Copyright') + 1:
+            lines[-1] = lastLine[:start] + lastLine[end+2:]
+    return '\n'.join(lines)
@@ -0,0 +1,268 @@
+# SPDX-FileCopyrightText: 2026-present SPDX Contributors
+# SPDX-FileType: SOURCE
+# SPDX-License-Identifier: Apache-2.0
+
+"""Detection of several licenses in one text, such as THIRD-PARTY-NOTICES files.
+
+Scoring a whole file against whole licenses fails when the file holds several
+licenses: each of them is only a part of the file. Instead:
+
+1. Runs of SHINGLE_WORDS words of the input are looked up in an inverted index
+   of the license texts. Only a sample of the runs is indexed, and runs found in
+   more than INFORMATIVE_FRACTION of the licenses are left out, as boilerplate.
+   A license is a candidate where the input has a good part of its runs.
+2. Around each candidate occurrence, windows of about the length of the license
+   slide over the input one character at a time. The bigram counts of the window
+   and their intersection with the license are updated as one bigram enters and
+   another leaves, so each step costs the same whatever the length.
+3. The best windows scoring at or above the threshold are segments. Segments
+   overlapping a better one are dropped.
+"""
+
+import zlib
+from collections import defaultdict
+from dataclasses import dataclass
+
+from spdx_license_matcher.index import count_bigrams
+from spdx_license_matcher.instrument import timed
+
+# Words per run (shingle), and 1 in how many distinct runs is indexed.
+SHINGLE_WORDS = 4
+SHINGLE_SAMPLING = 4
+
+# Runs found in a larger fraction of the licenses are not indexed.
+INFORMATIVE_FRACTION = 0.2
+
+# Fraction of the indexed runs of a license which the input must have for windows to be tried.
+MIN_SHINGLE_COVERAGE = 0.5
+
+# Characters around the hits of a candidate occurrence where its windows may also start or end.
+REGION_MARGIN = 256
+
+# Window lengths tried, relative to the length of the license.
+WINDOW_LENGTH_RATIOS = (1.0, 0.95, 1.05, 0.9, 1.1)
+
+# Window lengths after the first are not tried if its score is this far below the threshold.
+LADDER_SLACK = 0.1
+
+# Largest overlap between two segments, relative to the shorter one.
+MAX_OVERLAP = 0.1
+
+
+@dataclass
+class Segment:
+    """A license found in a span of the normalized input."""
+
+    licenseId: str
+    # Character offsets of the span in the normalized input, end excluded.
+    start: int
+    end: int
+    score: float
+
+
+def _get_shingles(normalizedText):
+    """Sampled word runs of a normalized text.
+
+    Returns:
+        generator -- (character offset, shingle hash) of each sampled run.
+    """
+    # crc32 rather than hash(), which differs between processes.
+    words = normalizedText.split(' ')
+    offsets = []
+    offset = 0
+    for word in words:
+        offsets.append(offset)
+        offset += len(word) + 1
+    for i in range(len(words) - SHINGLE_WORDS + 1):
+        shingle = zlib.crc32(' '.join(words[i:i+SHINGLE_WORDS]).encode('utf-8'))
+        if shingle % SHINGLE_SAMPLING == 0:
+            yield offsets[i], shingle
+
+
+class LicenseSegmenter:
+    """Finds the licenses in texts holding several of them."""
+
+    def __init__(self, normalizedTexts):
+        """Index the license texts.
+
+        Arguments:
+            normalizedTexts {dictionary} -- license ID as key and normalized license text as value.
+        """
+        self.names = sorted(normalizedTexts)
+        self.texts = [normalizedTexts[name] for name in self.names]
+        postings = defaultdict(set)
+        for pos, text in enumerate(self.texts):
+            for _, shingle in _get_shingles(text):
+                postings[shingle].add(pos)
+        maxLicenses = max(1, int(INFORMATIVE_FRACTION * len(self.names)))
+        self.postings = {
+            shingle: tuple(licenses)
+            for shingle, licenses in postings.items()
+            if len(licenses) <= maxLicenses
+        }
+        self.numShingles = [0] * len(self.names)
+        for licenses in self.postings.values():
+            for pos in licenses:
+                self.numShingles[pos] += 1
+        self._bigramCounts = {}
+
+    def _get_bigram_counts(self, pos):
+        counts = self._bigramCounts.get(pos)
+        if counts is None:
+            counts = self._bigramCounts[pos] = count_bigrams(self.texts[pos])
+        return counts
+
+    @timed('segment')
+    def find_segments(self, normalizedText, threshold=0.9):
+        """Find the licenses in a text holding several of them.
+
+        Arguments:
+            normalizedText {string} -- input normalized with normalize(text, wholeText=False).
+            threshold {float} -- confidence threshold below which a window is not a match.
+
+        Returns:
+            list -- a Segment for each license found, in order of position.
+        """
+        candidates = self._get_candidate_regions(normalizedText)
+        # Windows slide over bigram ids, shared by the input and the candidates, rather than strings.
+        bigramIds = {}
+        licenseBigrams = {}
+        for pos in candidates:
+            licenseBigrams[pos] = [
+                (bigramIds.setdefault(bigram, len(bigramIds) + 1), count)
+                for bigram, count in self._get_bigram_counts(pos).items()
+            ]
+        # Bigrams of no candidate share id 0, which never counts towards an intersection.
+        textIds = [bigramIds.get(normalizedText[i:i+2], 0) for i in range(len(normalizedText) - 1)]
+
+        hits = []
+        for pos, regions in candidates.items():
+            licenseCounts = [0] * (len(bigramIds) + 1)
+            for bigramId, count in licenseBigrams[pos]:
+                licenseCounts[bigramId] = count
+            licenseTotal = max(len(self.texts[pos]) - 1, 0)
+            for regionStart, regionEnd in regions:
+                for start, end, score in _find_windows(textIds, licenseCounts, licenseTotal, regionStart, regionEnd, threshold):
+                    hits.append(Segment(self.names[pos], start, end, score))
+
+        segments = []
+        for hit in sorted(hits, key=lambda segment: (-segment.score, segment.start, segment.licenseId)):
+            if all(_overlap(hit, segment) <= MAX_OVERLAP * min(hit.end - hit.start, segment.end - segment.start) for segment in segments):
+                segments.append(hit)
+        return sorted(segments, key=lambda segment: segment.start)
+
+    def _get_candidate_regions(self, normalizedText):
+        """Spans of the input around the occurrences of each candidate license.
+
+        An occurrence is where the input has enough of the license's indexed runs
+        within the length of the license.
+
+        Returns:
+            dictionary -- license position as key and list of (start, end) character spans as value.
+        """
+        hitOffsets = defaultdict(list)
+        for offset, shingle in _get_shingles(normalizedText):
+            for pos in self.postings.get(shingle, ()):
+                hitOffsets[pos].append(offset)
+
+        length = len(normalizedText)
+        regions = {}
+        for pos, offsets in hitOffsets.items():
+            windowLength = len(self.texts[pos])
+            minHits = max(1, MIN_SHINGLE_COVERAGE * self.numShingles[pos])
+            # Spans of hits no longer than the license holding at least minHits hits, merged when they overlap.
+            occurrences = []
+            last = 0
+            for first in range(len(offsets)):
+                last = max(last, first)
+                while last + 1 < len(offsets) and offsets[last + 1] - offsets[first] <= windowLength:
+                    last += 1
+                if last - first + 1 >= minHits:
+                    if occurrences and offsets[first] <= occurrences[-1][1]:
+                        occurrences[-1][1] = offsets[last]
+                    else:
+                        occurrences.append([offsets[first], offsets[last]])
+            spans = []
+            for first, last in occurrences:
+                if last - first < windowLength:
+                    # A window of about the license length must hold the first and the last hit.
+                    reach = int(max(WINDOW_LENGTH_RATIOS) * windowLength) + REGION_MARGIN
+                    spans.append((max(0, last - reach), min(length, first + reach)))
+                else:
+                    # Several occurrences next to each other.
+                    spans.append((max(0, first - windowLength), min(length, last + windowLength)))
+            if spans:
+                regions[pos] = spans
+        return regions
+
+
+def _overlap(a, b):
+    return min(a.end, b.end) - max(a.start, b.start)
+
+
+def _find_windows(textIds, licenseCounts, licenseTotal, regionStart, regionEnd, threshold):
+    """Best non-overlapping windows of a region scoring at or above the threshold against one license.
+
+    Arguments:
+        textIds {list} -- bigram id of each bigram of the input.
+        licenseCounts {list} -- count of each bigram id in the license.
+        licenseTotal {int} -- number of bigrams of the license.
+        regionStart {int} -- first character of the region.
+        regionEnd {int} -- character after the region.
+        threshold {float} -- confidence threshold.
+
+    Returns:
+        list -- (start, end, score) character span and dice coefficient of each window.
+    """
+    windows = []
+    pending = [(regionStart, regionEnd)]
+    while pending:
+        start, end = pending.pop()
+        best = None
+        for ratio in WINDOW_LENGTH_RATIOS:
+            windowTotal = max(1, round(licenseTotal * ratio))
+            if windowTotal + 1 > end - start:
+                continue
+            score, windowStart = _slide_window(textIds, licenseCounts, licenseTotal, start, end, windowTotal)
+            if best is None or score > best[2]:
+                best = (windowStart, windowStart + windowTotal + 1, score)
+            if best[2] < threshold - LADDER_SLACK:
+                # Other lengths will not make up for it.
+                break
+        if best is None or best[2] < threshold:
+            continue
+        windows.append(best)
+        # The same license may occur again before or after.
+        pending.append((start, best[0]))
+        pending.append((best[1], end))
+    return windows
+
+
+def _slide_window(textIds, licenseCounts, licenseTotal, start, end, windowTotal):
+    """Slide a window of windowTotal bigrams over the characters start to end of the input.
+
+    Returns:
+        tuple -- best dice coefficient against the license, and the start of its window.
+    """
+    windowCounts = [0] * len(licenseCounts)
+    common = 0
+    for bigramId in textIds[start:start + windowTotal]:
+        count = windowCounts[bigramId]
+        if count < licenseCounts[bigramId]:
+            common += 1
+        windowCounts[bigramId] = count + 1
+    bestCommon, bestStart = common, start
+    for windowStart in range(start + 1, end - windowTotal):
+        leaving = textIds[windowStart - 1]
+        count = windowCounts[leaving] - 1
+        windowCounts[leaving] = count
+        if count < licenseCounts[leaving]:
+            common -= 1
+        entering = textIds[windowStart + windowTotal - 1]
+        count = windowCounts[entering]
+        if count < licenseCounts[entering]:
+            common += 1
+        windowCounts[entering] = count + 1
+        if common > bestCommon:
+            bestCommon, bestStart = common, windowStart
+    return float(2*bestCommon)/float(windowTotal + licenseTotal), bestStart
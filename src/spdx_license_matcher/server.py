@@ -0,0 +1,228 @@
+# SPDX-FileCopyrightText: 2026-present SPDX Contributors
+# SPDX-FileType: SOURCE
+# SPDX-License-Identifier: Apache-2.0
+
+"""Long-running matching server keeping the license index and the JVM warm.
+
+Requests are JSON over HTTP, on a TCP port or a Unix socket:
+
+    POST /match   {"text": "...", "threshold": 0.9}
+                  -> {"matches": {"MIT": 1.0}, "matchingString": "..."}
+    GET  /health  -> {"status": "ok", "licenses": 700, "exactHits": 12, "exactMisses": 3,
+                      "cacheHits": 40, "cacheMisses": 15, "cacheEvictions": 0,
+                      "jvm": {"bootSeconds": 0.4, "initSeconds": 1.2, "offline": true, "options": [...]}}
+
+exactHits and exactMisses count the requests answered by the exact match lookup
+of verbatim license texts, and the others. The cache counters are those of the
+result cache, for the scores and the verifications. jvm is null until the JVM
+is started (see utils.get_jvm_startup).
+"""
+
+import json
+import os
+import socketserver
+import threading
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import click
+from dotenv import load_dotenv
+
+from spdx_license_matcher.build_licenses import build_spdx_licenses, get_license_index, is_keys_empty
+from spdx_license_matcher.candidates import CandidateStats
+from spdx_license_matcher.cache import DEFAULT_MAX_ENTRIES as DEFAULT_CACHE_ENTRIES
+from spdx_license_matcher.cache import CachedVerifier, open_cache
+from spdx_license_matcher.computation import get_matching_string, get_normalized_close_matches
+from spdx_license_matcher.normalize import normalize
+from spdx_license_matcher.snapshot import Snapshot
+from spdx_license_matcher.storage import open_store
+from spdx_license_matcher.utils import _ensure_jvm, get_jvm_startup
+from spdx_license_matcher.verify import open_verifier
+
+load_dotenv()
+
+# Largest request body accepted, in bytes.
+MAX_REQUEST_SIZE = 16 * 1024 * 1024
+
+
+class MatchService:
+    """Matches license texts against an index loaded once, the same way as the CLI."""
+
+    def __init__(self, index, threshold=0.9, verifier=None, cache=None):
+        self.index = index
+        self.threshold = threshold
+        self.verifier = verifier
+        self.cache = cache
+        self.numLicenses = len(index)
+        self.stats = CandidateStats()
+        self._statsLock = threading.Lock()
+        # Build the lazily computed length order now rather than in concurrent requests.
+        index.get_length_candidates(1, threshold)
+
+    def match(self, text, threshold=None):
+        """Match a license text.
+
+        Arguments:
+            text {string} -- license text to match.
+            threshold {float} -- confidence threshold (default: the server threshold).
+
+        Returns:
+            dictionary -- the close matches and the matching string.
+        """
+        if threshold is None:
+            threshold = self.threshold
+        stats = CandidateStats()
+        verifier = self.verifier
+        normalizedText = normalize(text)
+        if self.cache is None:
+            matches = get_normalized_close_matches(normalizedText, self.index, threshold, stats=stats)
+        else:
+            key = self.cache.make_matches_key(normalizedText, threshold)
+            matches = self.cache.fetch_matches(
+                key, lambda scoringStats: get_normalized_close_matches(normalizedText, self.index, threshold, stats=scoringStats), stats
+            )
+            verifier = CachedVerifier(verifier, self.cache, stats)
+        matchingString = get_matching_string(matches, text, verifier)
+        with self._statsLock:
+            self.stats.add(stats)
+        return {'matches': matches, 'matchingString': matchingString}
+
+
+class MatchRequestHandler(BaseHTTPRequestHandler):
+    server_version = 'spdx-license-matcher'
+
+    def address_string(self):
+        # Unix socket clients have no address.
+        return self.client_address[0] if self.client_address else 'unix'
+
+    def do_GET(self):
+        if self.path != '/health':
+            self._send_json(HTTPStatus.NOT_FOUND, {'error': 'Not found.'})
+            return
+        service = self.server.service
+        self._send_json(HTTPStatus.OK, {
+            'status': 'ok',
+            'licenses': service.numLicenses,
+            'exactHits': service.stats.exactHits,
+            'exactMisses': service.stats.exactMisses,
+            'cacheHits': service.stats.cacheHits,
+            'cacheMisses': service.stats.cacheMisses,
+            'cacheEvictions': service.stats.cacheEvictions,
+            'jvm': get_jvm_startup(),
+        })
+
+    def do_POST(self):
+        if self.path != '/match':
+            self._send_json(HTTPStatus.NOT_FOUND, {'error': 'Not found.'})
+            return
+        try:
+            length = int(self.headers.get('Content-Length') or 0)
+        except ValueError:
+            length = -1
+        if length < 0:
+            # rfile.read(-1) would wait for the client to close the connection.
+            self._send_json(HTTPStatus.BAD_REQUEST, {'error': 'Invalid Content-Length.'})
+            return
+        if length > MAX_REQUEST_SIZE:
+            self._send_json(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, {'error': 'Request too large.'})
+            return
+        try:
+            body = json.loads(self.rfile.read(length))
+            text = body['text']
+            threshold = body.get('threshold')
+            if not isinstance(text, str) or not (threshold is None or 0.0 <= float(threshold) <= 1.0):
+                raise ValueError
+        except (ValueError, KeyError, TypeError):
+            self._send_json(HTTPStatus.BAD_REQUEST, {'error': 'Expected a JSON object with a "text" string and an optional "threshold" between 0 and 1.'})
+            return
+        try:
+            result = self.server.service.match(text, None if threshold is None else float(threshold))
+        except Exception as error:
+            # Such as the cache or the JVM failing: answer rather than drop the connection.
+            self.log_error('Matching failed: %r', error)
+            self._send_json(HTTPStatus.INTERNAL_SERVER_ERROR, {'error': 'Matching failed: {}'.format(error)})
+            return
+        self._send_json(HTTPStatus.OK, result)
+
+    def _send_json(self, status, payload):
+        data = json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+class ThreadingUnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def server_bind(self):
+        socketserver.UnixStreamServer.server_bind(self)
+        self.server_name = self.server_address
+        self.server_port = 0
+
+
+def make_server(service, host='127.0.0.1', port=8000, socketPath=None):
+    """Create a server handling each request in its own thread.
+
+    Arguments:
+        service {MatchService} -- the warm matching service.
+        host {string} -- TCP host to listen on.
+        port {int} -- TCP port to listen on, 0 for any free port.
+        socketPath {string} -- listen on this Unix socket instead of TCP.
+
+    Returns:
+        server -- a socketserver server; call serve_forever() to run it.
+    """
+    if socketPath:
+        if os.path.exists(socketPath):
+            os.unlink(socketPath)
+        server = ThreadingUnixHTTPServer(socketPath, MatchRequestHandler)
+    else:
+        server = ThreadingHTTPServer((host, port), MatchRequestHandler)
+    server.service = service
+    return server
+
+
+@click.command()
+@click.option('--host', default='127.0.0.1', help='Host to listen on.', show_default=True)
+@click.option('--port', '-p', default=8000, type=click.IntRange(0, 65535), help='TCP port to listen on.', show_default=True)
+@click.option('--socket', 'socketPath', type=click.Path(dir_okay=False), help='Listen on this Unix socket instead of a TCP port.')
+@click.option('--threshold', '-t', default=0.9, type=click.FloatRange(0.0, 1.0), help='Default confidence threshold of the requests.', show_default=True)
+@click.option('--verify-threads', 'verifyThreads', default=4, type=click.IntRange(0), help='Threads attached to the JVM once, verifying the close matches against the SPDX standard texts for all requests; 0 verifies in the request threads.', show_default=True)
+@click.option('--cache', 'cacheSpec', envvar='SPDX_RESULT_CACHE', help='Also keep the results in a persistent cache: "redis" (at SPDX_REDIS_HOST), a redis:// URL, or the path of a local SQLite file.')
+@click.option('--cache-size', 'cacheSize', default=DEFAULT_CACHE_ENTRIES, type=click.IntRange(0), help='Results kept in memory; 0 for none.', show_default=True)
+@click.option('--build/--no-build', default=False, help='Builds the SPDX license list in the database before serving.')
+@click.option('--store', 'storeSpec', envvar='SPDX_CORPUS_STORE', help='Where the license corpus is kept: "redis" (default), a redis:// URL, or the path of a local memory-mapped corpus file.')
+@click.option('--snapshot', 'snapshotPath', envvar='SPDX_LICENSE_SNAPSHOT', type=click.Path(exists=True, dir_okay=False), help='Offline SPDX License List snapshot to build the database from.')
+def serve(host, port, socketPath, threshold, verifyThreads, cacheSpec, cacheSize, build, storeSpec, snapshotPath):
+    """Serve license matching over HTTP, with the license list and the JVM kept warm."""
+    store = open_store(storeSpec)
+    snapshot = Snapshot.load(snapshotPath) if snapshotPath else None
+    if build or is_keys_empty(store):
+        click.echo('Building SPDX License List. This may take a while...')
+        if not build_spdx_licenses(snapshot, store, onlyIfEmpty=not build) and build:
+            click.echo('The SPDX License List is up to date.')
+    index = get_license_index(store)
+    # The experimental template verifier is left to the command line until it is checked against the Java library.
+    service = MatchService(index, threshold, open_verifier('java', snapshot, verifyThreads), open_cache(cacheSpec, index, store, cacheSize))
+    click.echo('Starting the JVM...')
+    _ensure_jvm()
+    startup = get_jvm_startup()
+    click.echo('JVM started in {:.2f} s, SPDX model initialized in {:.2f} s{}'.format(
+        startup['bootSeconds'], startup['initSeconds'], ' (offline)' if startup['offline'] else ''))
+    server = make_server(service, host, port, socketPath)
+    click.echo('Serving {} licenses on {}'.format(service.numLicenses, socketPath or 'http://{}:{}'.format(host, server.server_port)))
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.verifier.close()
+        if socketPath and os.path.exists(socketPath):
+            os.unlink(socketPath)
+
+
+if __name__ == "__main__":
+    serve()
@@ -0,0 +1,168 @@
+# SPDX-FileCopyrightText: 2026-present SPDX Contributors
+# SPDX-FileType: SOURCE
+# SPDX-License-Identifier: Apache-2.0
+
+"""Inverted index of word shingles, ranking the licenses of a family apart.
+
+Character bigrams hardly tell BSD-2-Clause from BSD-3-Clause, or the GPL
+versions apart: all of them score close to the threshold against each other's
+texts, and are all verified against the SPDX standard texts. Runs of
+SHINGLE_WORDS words do: the clause only one of them has is made of runs the
+other lacks.
+
+Each run is weighted by its inverse document frequency, so that the runs
+shared by a whole family weigh little and the ones telling its members apart
+weigh much; runs found in more than INFORMATIVE_FRACTION of the licenses are
+left out. The licenses are ranked by the weighted Dice coefficient of their
+runs and those of the input, and only the best ones are kept for the exact
+Dice scoring: at most SHORTLIST_SIZE of them, scoring at least SHORTLIST_RATIO
+of the best. Like MinHash LSH, this is faster but may miss a match.
+"""
+
+import math
+from collections import defaultdict
+
+from spdx_license_matcher.instrument import timed
+
+# Words per run (shingle).
+SHINGLE_WORDS = 3
+
+# Runs found in a larger fraction of the licenses are not indexed.
+INFORMATIVE_FRACTION = 0.2
+
+# Largest number of licenses kept for scoring, and their lowest weighted similarity relative to the best.
+SHORTLIST_SIZE = 10
+SHORTLIST_RATIO = 0.8
+
+
+def get_word_shingles(normalizedText):
+    """Runs of SHINGLE_WORDS words of a normalized text.
+
+    Arguments:
+        normalizedText {string} -- normalized license text.
+
+    Returns:
+        list -- a tuple of words for each run, in the order of the text.
+    """
+    words = normalizedText.split(' ')
+    return list(zip(*(words[i:] for i in range(SHINGLE_WORDS))))
+
+
+class ShingleIndex:
+    """Inverted index of the word shingles of the licenses of a LicenseIndex.
+
+    Only holds tuples of words, so it is pickled to worker processes as is.
+    """
+
+    def __init__(self, names, normalizedTexts):
+        """Index the license texts.
+
+        Arguments:
+            names {list} -- license IDs, in the order of the positions of the LicenseIndex.
+            normalizedTexts {dictionary} -- license ID as key and normalized license text as value.
+        """
+        self.names = list(names)
+        self.texts = [normalizedTexts[name] for name in self.names]
+        shingleSets = [set(get_word_shingles(text)) for text in self.texts]
+        documents = defaultdict(int)
+        for shingles in shingleSets:
+            for shingle in shingles:
+                documents[shingle] += 1
+        numLicenses = len(self.names)
+        maxLicenses = max(1, int(INFORMATIVE_FRACTION * numLicenses))
+        self.weights = {
+            shingle: math.log((numLicenses + 1) / count)
+            for shingle, count in documents.items()
+            if count <= maxLicenses
+        }
+        # Weight of the runs no license has, in the total of the input.
+        self.unknownWeight = math.log(numLicenses + 1)
+        postings = defaultdict(list)
+        self.totals = [0.0] * numLicenses
+        for pos, shingles in enumerate(shingleSets):
+            for shingle in shingles:
+                weight = self.weights.get(shingle)
+                if weight is not None:
+                    postings[shingle].append(pos)
+                    self.totals[pos] += weight
+        self.postings = {shingle: tuple(licenses) for shingle, licenses in postings.items()}
+        self._common = set(documents) - set(self.weights)
+
+    def __len__(self):
+        return len(self.names)
+
+    def rank(self, normalizedText, candidates=None):
+        """Rank the licenses by the weighted Dice coefficient of their shingles and those of the input.
+
+        Arguments:
+            normalizedText {string} -- normalized input license text.
+            candidates {iterable} -- positions of the licenses to rank; None for all of them.
+
+        Returns:
+            list -- (position, weighted similarity) of the licenses sharing an indexed shingle with the input,
+                the highest first.
+        """
+        allowed = None if candidates is None else set(candidates)
+        shared = defaultdict(float)
+        inputTotal = 0.0
+        for shingle in set(get_word_shingles(normalizedText)):
+            weight = self.weights.get(shingle)
+            if weight is None:
+                if shingle not in self._common:
+                    inputTotal += self.unknownWeight
+                continue
+            inputTotal += weight
+            for pos in self.postings[shingle]:
+                shared[pos] += weight
+        ranked = [
+            (pos, 2 * weight / (inputTotal + self.totals[pos]))
+            for pos, weight in shared.items()
+            if allowed is None or pos in allowed
+        ]
+        ranked.sort(key=lambda item: (-item[1], item[0]))
+        return ranked
+
+    @timed('shingles')
+    def get_candidates(self, normalizedText, candidates=None):
+        """Shortlist of the licenses closest to the input.
+
+        Arguments:
+            normalizedText {string} -- normalized input license text.
+            candidates {iterable} -- positions of the licenses to choose from; None for all of them.
+
+        Returns:
+            set -- positions of the licenses to score. All the candidates if the input shares
+                no indexed shingle with them, such as a text of a few words.
+        """
+        ranked = self.rank(normalizedText, candidates)
+        if not ranked:
+            return set(range(len(self.names)) if candidates is None else candidates)
+        lowest = SHORTLIST_RATIO * ranked[0][1]
+        return {pos for pos, similarity in ranked[:SHORTLIST_SIZE] if similarity >= lowest}
+
+    def get_separating_phrases(self, licenseId, otherId, limit=5):
+        """Phrases of a license which another close license does not have.
+
+        Arguments:
+            licenseId {string} -- license ID whose phrases are returned.
+            otherId {string} -- license ID of the license to tell it from.
+            limit {int} -- largest number of phrases returned.
+
+        Returns:
+            list -- the phrases, as normalized text, the most distinctive first.
+        """
+        shingles = get_word_shingles(self.texts[self.names.index(licenseId)])
+        others = set(get_word_shingles(self.texts[self.names.index(otherId)]))
+        phrases = []
+        start = None
+        for i, shingle in enumerate(shingles + [None]):
+            if shingle is not None and shingle not in others:
+                if start is None:
+                    start, weight = i, 0.0
+                weight += self.weights.get(shingle, 0.0)
+            elif start is not None:
+                words = [run[0] for run in shingles[start:i]] + list(shingles[i - 1][1:])
+                phrases.append((weight, ' '.join(words)))
+                start = None
+        phrases.sort(key=lambda phrase: -phrase[0])
+        return [phrase for _, phrase in phrases[:limit]]
@@ -0,0 +1,207 @@
+# SPDX-FileCopyrightText: 2026-present SPDX Contributors
+# SPDX-FileType: SOURCE
+# SPDX-License-Identifier: Apache-2.0
+
+"""Offline snapshot of the SPDX License List, built from a license-list-data release.
+
+A snapshot is a single gzip-compressed JSON file holding, for every license and
+license exception, its original text, its normalized text, its template and a
+few metadata fields, so that building the database and showing differences need
+no network access.
+"""
+
+import gzip
+import json
+import os
+import tarfile
+from io import BytesIO
+
+import click
+
+from spdx_license_matcher.normalize import NORMALIZER_VERSION, normalize
+
+SNAPSHOT_FORMAT_VERSION = 1
+
+# (list file, list key, details directory, id field, text field, template field) in license-list-data/json.
+_LISTS = [
+    ('licenses.json', 'licenses', 'details', 'licenseId', 'licenseText', 'standardLicenseTemplate'),
+    ('exceptions.json', 'exceptions', 'exceptions', 'licenseExceptionId', 'licenseExceptionText', 'licenseExceptionTemplate'),
+]
+
+
+class Snapshot:
+    """Texts and metadata of one version of the SPDX License List."""
+
+    def __init__(self, licenseListVersion, releaseDate, entries, normalizerVersion=NORMALIZER_VERSION):
+        self.licenseListVersion = licenseListVersion
+        self.releaseDate = releaseDate
+        # License or exception ID as key, and a dictionary with the keys name,
+        # isException, isDeprecated, text, normalized and template as value.
+        self.entries = entries
+        # NORMALIZER_VERSION of the normalized texts of the entries, None if unknown.
+        self.normalizerVersion = normalizerVersion
+
+    def __contains__(self, licenseId):
+        return licenseId in self.entries
+
+    def __len__(self):
+        return len(self.entries)
+
+    def get_text(self, licenseId):
+        """Original text of a license or license exception.
+
+        Arguments:
+            licenseId {string} -- License ID or Exception ID.
+
+        Returns:
+            string -- the license text.
+        """
+        try:
+            return self.entries[licenseId]['text']
+        except KeyError:
+            raise KeyError(f"'{licenseId}' is not in the SPDX License List {self.licenseListVersion} snapshot") from None
+
+    def normalized_texts(self):
+        """Normalized texts of all the licenses and exceptions.
+
+        Returns:
+            dictionary -- license or exception ID as key and normalized text as value.
+        """
+        if self.normalizerVersion != NORMALIZER_VERSION:
+            return {licenseId: normalize(entry['text']) for licenseId, entry in self.entries.items()}
+        return {licenseId: entry['normalized'] for licenseId, entry in self.entries.items()}
+
+    def save(self, path):
+        """Write the snapshot to a gzip-compressed JSON file.
+
+        Arguments:
+            path {string} -- path of the snapshot file.
+        """
+        data = {
+            'format': SNAPSHOT_FORMAT_VERSION,
+            'normalizer': self.normalizerVersion,
+            'licenseListVersion': self.licenseListVersion,
+            'releaseDate': self.releaseDate,
+            'entries': self.entries,
+        }
+        with gzip.open(path, 'wt', encoding='utf-8') as fh:
+            json.dump(data, fh, sort_keys=True)
+
+    @classmethod
+    def load(cls, path):
+        """Read a snapshot written by save().
+
+        Arguments:
+            path {string} -- path of the snapshot file.
+
+        Returns:
+            Snapshot -- the snapshot.
+        """
+        with gzip.open(path, 'rt', encoding='utf-8') as fh:
+            data = json.load(fh)
+        if data.get('format') != SNAPSHOT_FORMAT_VERSION:
+            raise ValueError(f"Unsupported SPDX License List snapshot format {data.get('format')} in {path}.")
+        # Snapshots written before the normalizer was versioned have none.
+        return cls(data['licenseListVersion'], data['releaseDate'], data['entries'], data.get('normalizer'))
+
+    def get_template(self, licenseId):
+        """SPDX license template of a license or license exception.
+
+        Arguments:
+            licenseId {string} -- License ID or Exception ID.
+
+        Returns:
+            string -- the template, or None if the release has none for it.
+        """
+        try:
+            return self.entries[licenseId]['template']
+        except KeyError:
+            raise KeyError(f"'{licenseId}' is not in the SPDX License List {self.licenseListVersion} snapshot") from None
+
+    @classmethod
+    def from_release(cls, source):
+        """Build a snapshot from a spdx/license-list-data release.
+
+        Arguments:
+            source {string} -- path of the release directory, or of its .tar.gz archive.
+
+        Returns:
+            Snapshot -- the snapshot of the release.
+        """
+        if os.path.isdir(source):
+            reader = _DirectoryReader(source)
+        else:
+            reader = _TarReader(source)
+        with reader:
+            entries = {}
+            licenseListVersion = releaseDate = None
+            for listFile, listKey, detailsDir, idField, textField, templateField in _LISTS:
+                listJson = reader.read_json(listFile)
+                licenseListVersion = listJson.get('licenseListVersion', licenseListVersion)
+                releaseDate = listJson.get('releaseDate', releaseDate)
+                for item in listJson[listKey]:
+                    itemId = item[idField]
+                    details = reader.read_json(f'{detailsDir}/{itemId}.json')
+                    entries[itemId] = {
+                        'name': details.get('name', item.get('name')),
+                        'isException': listKey == 'exceptions',
+                        'isDeprecated': bool(details.get('isDeprecatedLicenseId', item.get('isDeprecatedLicenseId', False))),
+                        'text': details[textField],
+                        'normalized': normalize(details[textField]),
+                        'template': details.get(templateField),
+                    }
+        return cls(licenseListVersion, releaseDate, entries)
+
+
+class _DirectoryReader:
+    """Reads license-list-data/json files from a checkout or an extracted release."""
+
+    def __init__(self, path):
+        jsonDir = os.path.join(path, 'json')
+        self.jsonDir = jsonDir if os.path.isdir(jsonDir) else path
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excInfo):
+        return False
+
+    def read_json(self, name):
+        with open(os.path.join(self.jsonDir, name), 'r', encoding='utf-8') as fh:
+            return json.load(fh)
+
+
+class _TarReader:
+    """Reads license-list-data/json files from a release archive, without extracting it."""
+
+    def __init__(self, path):
+        self.tar = tarfile.open(path, 'r:*')
+        self.members = {}
+        for member in self.tar.getmembers():
+            parts = member.name.split('/')
+            if member.isfile() and 'json' in parts:
+                self.members['/'.join(parts[parts.index('json') + 1:])] = member
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excInfo):
+        self.tar.close()
+        return False
+
+    def read_json(self, name):
+        return json.load(BytesIO(self.tar.extractfile(self.members[name]).read()))
+
+
+@click.command()
+@click.argument('source', type=click.Path(exists=True))
+@click.option('--output', '-o', required=True, type=click.Path(dir_okay=False), help='Path of the snapshot file to write, e.g. spdx-licenses.json.gz.')
+def create_snapshot(source, output):
+    """Create an offline SPDX License List snapshot from a license-list-data release directory or .tar.gz archive."""
+    snapshot = Snapshot.from_release(source)
+    snapshot.save(output)
+    click.echo('Saved {} licenses and exceptions of SPDX License List {} to {}'.format(len(snapshot), snapshot.licenseListVersion, output))
+
+
+if __name__ == "__main__":
+    create_snapshot()
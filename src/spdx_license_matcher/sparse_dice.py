@@ -0,0 +1,136 @@
+# SPDX-FileCopyrightText: 2026-present SPDX Contributors
+# SPDX-FileType: SOURCE
+# SPDX-License-Identifier: Apache-2.0
+
+"""Vectorized Sørensen-Dice scoring of the whole license list with NumPy and SciPy.
+
+Requires the optional ``fast`` dependencies (``pip install license-matcher[fast]``).
+"""
+
+# The number of bigrams two texts have in common is the size of the intersection
+# of their bigram multisets, sum(min(a[g], b[g])), which is not a dot product of
+# the count vectors. It is one once every count is expanded into unary levels:
+# min(a, b) == sum over k >= 1 of [a >= k] * [b >= k]. Each (bigram, k) pair
+# becomes a binary column, so the intersection sizes of an input against all
+# licenses are exactly a sparse matrix product of integer indicators.
+
+import numpy as np
+from scipy import sparse
+
+
+class SparseDiceScorer:
+    """Scores inputs against every license of a LicenseIndex with sparse matrix products.
+
+    Scores are identical to get_dice_coefficient() and LicenseIndex.get_scores().
+    """
+
+    def __init__(self, index):
+        self.index = index
+        ids = np.frombuffer(index.ids, dtype=np.uint32).astype(np.int64)
+        counts = np.frombuffer(index.counts, dtype=np.uint32).astype(np.int64)
+        offsets = np.frombuffer(index.offsets, dtype=np.uint32).astype(np.int64)
+        self.totals = np.frombuffer(index.totals, dtype=np.uint32).astype(np.int64)
+
+        # One column per bigram and level, up to the highest count of the bigram in any license.
+        self.maxCounts = np.zeros(len(index.bigrams), dtype=np.int64)
+        np.maximum.at(self.maxCounts, ids, counts)
+        self.columnOffsets = np.concatenate(([0], np.cumsum(self.maxCounts)))
+
+        rows = np.repeat(np.repeat(np.arange(len(index)), np.diff(offsets)), counts)
+        columns = np.repeat(self.columnOffsets[ids], counts) + _levels(counts)
+        self.matrix = sparse.csr_matrix(
+            (np.ones(len(rows), dtype=np.int32), (rows, columns)),
+            shape=(len(index), int(self.columnOffsets[-1])),
+        )
+
+    def _query_matrix(self, normalizedTexts):
+        """Level-expanded indicator rows of the input texts, and their bigram totals."""
+        rows = []
+        columns = []
+        queryTotals = np.zeros(len(normalizedTexts), dtype=np.int64)
+        for row, normalizedText in enumerate(normalizedTexts):
+            queryCounts, queryTotals[row] = self.index.query_counts(normalizedText)
+            if not queryCounts:
+                continue
+            ids = np.fromiter(queryCounts.keys(), dtype=np.int64, count=len(queryCounts))
+            counts = np.fromiter(queryCounts.values(), dtype=np.int64, count=len(queryCounts))
+            # Levels above the highest count in the corpus can never be in common.
+            counts = np.minimum(counts, self.maxCounts[ids])
+            columns.append(np.repeat(self.columnOffsets[ids], counts) + _levels(counts))
+            rows.append(np.full(int(counts.sum()), row, dtype=np.int64))
+        if rows:
+            rows = np.concatenate(rows)
+            columns = np.concatenate(columns)
+        queryMatrix = sparse.csr_matrix(
+            (np.ones(len(rows), dtype=np.int32), (rows, columns)),
+            shape=(len(normalizedTexts), self.matrix.shape[1]),
+        )
+        return queryMatrix, queryTotals
+
+    def get_scores_matrix(self, normalizedTexts, candidates=None):
+        """Dice coefficients of a batch of inputs against the licenses.
+
+        Arguments:
+            normalizedTexts {list} -- normalized input license texts.
+            candidates {list} -- positions of the licenses to score (default: all of them).
+
+        Returns:
+            ndarray -- float64 array of shape (number of inputs, number of scored licenses).
+        """
+        matrix, totals = self.matrix, self.totals
+        if candidates is not None:
+            candidates = np.asarray(candidates, dtype=np.int64)
+            matrix, totals = matrix[candidates], totals[candidates]
+        queryMatrix, queryTotals = self._query_matrix(normalizedTexts)
+        matches = (queryMatrix @ matrix.T).toarray().astype(np.float64)
+        sizes = (queryTotals[:, None] + totals[None, :]).astype(np.float64)
+        scores = np.zeros(matches.shape, dtype=np.float64)
+        scorable = (queryTotals[:, None] > 0) & (totals[None, :] > 0)
+        np.divide(2.0 * matches, sizes, out=scores, where=scorable)
+        return scores
+
+    def get_scores(self, normalizedText, candidates=None):
+        """Dice coefficient of the input against the licenses.
+
+        Arguments:
+            normalizedText {string} -- normalized input license text.
+            candidates {list} -- positions of the licenses to score (default: all of them).
+
+        Returns:
+            dictionary -- license ID as key and dice coefficient as value.
+        """
+        if candidates is None:
+            return self.get_scores_many([normalizedText])[0]
+        names = [self.index.names[pos] for pos in candidates]
+        return dict(zip(names, self.get_scores_matrix([normalizedText], candidates)[0].tolist()))
+
+    def iter_scores(self, normalizedText, candidates=None):
+        """Same as get_scores(), as (license ID, dice coefficient) pairs.
+
+        Arguments:
+            normalizedText {string} -- normalized input license text.
+            candidates {list} -- positions of the licenses to score (default: all of them).
+
+        Returns:
+            iterator -- (license ID, dice coefficient) of each license, in the order of the candidates.
+        """
+        names = self.index.names if candidates is None else [self.index.names[pos] for pos in candidates]
+        return zip(names, self.get_scores_matrix([normalizedText], candidates)[0].tolist())
+
+    def get_scores_many(self, normalizedTexts):
+        """Dice coefficients of a batch of inputs against every license, in one matrix product.
+
+        Arguments:
+            normalizedTexts {list} -- normalized input license texts.
+
+        Returns:
+            list -- one dictionary per input with license ID as key and dice coefficient as value.
+        """
+        names = self.index.names
+        return [dict(zip(names, row.tolist())) for row in self.get_scores_matrix(normalizedTexts)]
+
+
+def _levels(counts):
+    """0, 1, ..., count-1 for each count, concatenated."""
+    starts = np.repeat(np.cumsum(counts) - counts, counts)
+    return np.arange(int(counts.sum()), dtype=np.int64) - starts
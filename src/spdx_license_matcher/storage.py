@@ -0,0 +1,329 @@
+# SPDX-FileCopyrightText: 2026-present SPDX Contributors
+# SPDX-FileType: SOURCE
+# SPDX-License-Identifier: Apache-2.0
+
+"""Storage backends for the normalized license texts and their bigram index.
+
+RedisStore keeps the original layout: one gzip-compressed normalized text per
+license ID key, plus the index under INDEX_KEY. MmapStore keeps everything in a
+single local file that is memory-mapped, so that worker processes loading it
+share the same pages instead of each holding a copy.
+
+Both also keep the metadata of the last build (SPDX License List version and a
+checksum of each license text), so that a rebuild only has to process what
+changed, and a build lock, so that concurrent builds are not duplicated.
+"""
+
+import gzip
+import json
+import mmap
+import os
+import tempfile
+from array import array
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+from spdx_license_matcher.index import LicenseIndex
+from spdx_license_matcher.instrument import span
+from spdx_license_matcher.utils import compressStringToBytes, decompressBytesToString
+
+# Redis keys of the precomputed bigram index, the build metadata and the build lock.
+# License and exception IDs never contain ':'.
+INDEX_KEY = 'spdx:index'
+METADATA_KEY = 'spdx:metadata'
+BUILD_LOCK_KEY = 'spdx:build-lock'
+
+# Seconds after which the build lock of a crashed build expires.
+BUILD_LOCK_TIMEOUT = 30 * 60
+
+STORE_MAGIC = b"SPDXCORP"
+STORE_FORMAT_VERSION = 1
+
+
+class CorpusStore:
+    """Where the normalized license texts and the bigram index are kept."""
+
+    # Whether worker processes can open the store themselves rather than receive a copy of the index.
+    shareable = False
+
+    # Whether the store keeps the texts gzip-compressed, so that builds can compress them in parallel.
+    compressesTexts = False
+
+    def is_empty(self):
+        """Return True if no corpus has been saved yet."""
+        raise NotImplementedError
+
+    def save(self, normalizedTexts, index, metadata=None, changed=None, compressedTexts=None):
+        """Replace the corpus with the given texts and their index, atomically:
+        readers see either the previous corpus or the new one.
+
+        Arguments:
+            normalizedTexts {dictionary} -- license ID as key and normalized text as value.
+            index {LicenseIndex} -- bigram index of the same texts.
+            metadata {dictionary} -- metadata of the build, returned by load_metadata().
+            changed {set} -- IDs whose text differs from the saved corpus, None if unknown.
+            compressedTexts {dictionary} -- texts already compressed by compressStringToBytes(), by license ID,
+                for stores which compress them.
+        """
+        raise NotImplementedError
+
+    def load_metadata(self):
+        """Metadata saved with the corpus.
+
+        Returns:
+            dictionary -- the metadata, empty if the corpus was saved without any.
+        """
+        raise NotImplementedError
+
+    def build_lock(self):
+        """Context manager held while building the corpus, waiting for any other build to finish."""
+        raise NotImplementedError
+
+    def load_index(self):
+        """Load the bigram index of the corpus.
+
+        Returns:
+            LicenseIndex -- the index.
+        """
+        raise NotImplementedError
+
+    def load_normalized_texts(self):
+        """Normalized texts of all the licenses and exceptions.
+
+        Returns:
+            dictionary -- license ID as key and normalized text as value.
+        """
+        raise NotImplementedError
+
+    def get_normalized_text(self, licenseId):
+        """Normalized text of one license or exception.
+
+        Arguments:
+            licenseId {string} -- License ID or Exception ID.
+
+        Returns:
+            string -- the normalized text, or None if the ID is not in the corpus.
+        """
+        raise NotImplementedError
+
+
+class RedisStore(CorpusStore):
+    """Corpus in a Redis (or Valkey) database."""
+
+    compressesTexts = True
+
+    def __init__(self, client=None):
+        if client is None:
+            import redis
+
+            client = redis.StrictRedis(host=os.environ.get(key="SPDX_REDIS_HOST", default="localhost"), port=6379, db=0)
+        self.client = client
+
+    def _license_keys(self):
+        return [key for key in self.client.scan_iter() if b':' not in key]
+
+    def is_empty(self):
+        # The build lock or metadata alone do not make a corpus.
+        return not any(b':' not in key for key in self.client.scan_iter(count=100))
+
+    def save(self, normalizedTexts, index, metadata=None, changed=None, compressedTexts=None):
+        compressedTexts = compressedTexts or {}
+        if changed is None:
+            removed = ()
+        else:
+            removed = [key for key in self._license_keys() if key.decode('utf-8') not in normalizedTexts]
+        # MULTI/EXEC: the whole update is applied at once, so matchers never see a partial corpus.
+        pipeline = self.client.pipeline(transaction=True)
+        if changed is None:
+            # Delete all the keys in the current database, except the lock of this build
+            for key in self.client.scan_iter():
+                if key != BUILD_LOCK_KEY.encode('utf-8'):
+                    pipeline.delete(key)
+        elif removed:
+            pipeline.delete(*removed)
+        for licenseId, normalizedText in normalizedTexts.items():
+            if changed is None or licenseId in changed:
+                compressed = compressedTexts.get(licenseId)
+                pipeline.set(licenseId, compressed if compressed is not None else compressStringToBytes(normalizedText))
+        pipeline.set(INDEX_KEY, gzip.compress(index.to_bytes()))
+        pipeline.set(METADATA_KEY, json.dumps(metadata or {}))
+        pipeline.execute()
+
+    def load_metadata(self):
+        data = self.client.get(METADATA_KEY)
+        return {} if data is None else json.loads(data)
+
+    def build_lock(self):
+        return self.client.lock(BUILD_LOCK_KEY, timeout=BUILD_LOCK_TIMEOUT)
+
+    def load_index(self):
+        # Databases built by older versions have no index; it is then computed from the stored texts.
+        with span('store.fetch'):
+            data = self.client.get(INDEX_KEY)
+        if data is not None:
+            with span('decompress'):
+                data = gzip.decompress(data)
+            with span('store.load'):
+                return LicenseIndex.from_bytes(data)
+        return LicenseIndex.from_texts(self.load_normalized_texts())
+
+    def load_normalized_texts(self):
+        with span('store.fetch'):
+            keys = self._license_keys()
+            values = self.client.mget(keys) if keys else []
+        return {
+            key.decode('utf-8'): decompressBytesToString(value)
+            for key, value in zip(keys, values)
+        }
+
+    def get_normalized_text(self, licenseId):
+        if ':' in licenseId:
+            return None
+        with span('store.fetch'):
+            value = self.client.get(licenseId)
+        return None if value is None else decompressBytesToString(value)
+
+
+class MmapStore(CorpusStore):
+    """Corpus in one local file: header, text offsets, normalized texts and the bigram index.
+
+    The index arrays are read-only views of the mapped file, so every process
+    mapping it shares the same physical pages.
+    """
+
+    shareable = True
+
+    def __init__(self, path):
+        self.path = path
+        self._mmap = None
+        self._header = None
+
+    def __getstate__(self):
+        # The mapping is reopened by each process.
+        return {'path': self.path}
+
+    def __setstate__(self, state):
+        self.__init__(state['path'])
+
+    def is_empty(self):
+        return not os.path.exists(self.path)
+
+    def save(self, normalizedTexts, index, metadata=None, changed=None, compressedTexts=None):
+        # The file is small enough to always be rewritten whole.
+        names = index.names
+        texts = b''.join(normalizedTexts[name].encode('utf-8') for name in names)
+        textOffsets = array('Q', [0])
+        for name in names:
+            textOffsets.append(textOffsets[-1] + len(normalizedTexts[name].encode('utf-8')))
+        indexBytes = index.to_bytes()
+
+        sections = [textOffsets.tobytes(), texts, indexBytes]
+        header = {'version': STORE_FORMAT_VERSION, 'names': names, 'metadata': metadata or {}, 'sections': []}
+        # Section offsets depend on the header length, which depends on the offsets: reserve room for them.
+        headerLength = len(json.dumps(dict(header, sections=[[2**63, 2**63]] * len(sections))).encode('utf-8'))
+        headerLength += -headerLength % 8
+        position = len(STORE_MAGIC) + 8 + headerLength
+        for section in sections:
+            header['sections'].append([position, len(section)])
+            position += len(section) + (-len(section) % 8)
+        headerBytes = json.dumps(header).encode('utf-8').ljust(headerLength)
+
+        # Write a new file and rename it over the old one, so readers never see a partial corpus.
+        # Processes which mapped the old file keep reading it until they reopen the store.
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, tmpPath = tempfile.mkstemp(dir=directory, prefix='.spdx-corpus-')
+        try:
+            with os.fdopen(fd, 'wb') as fh:
+                fh.write(STORE_MAGIC)
+                fh.write(len(headerBytes).to_bytes(8, 'little'))
+                fh.write(headerBytes)
+                for section in sections:
+                    fh.write(section)
+                    fh.write(b'\0' * (-len(section) % 8))
+            os.replace(tmpPath, self.path)
+        except BaseException:
+            os.unlink(tmpPath)
+            raise
+        self._mmap = self._header = None
+
+    def _open(self):
+        if self._mmap is None:
+            with open(self.path, 'rb') as fh:
+                self._mmap = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+            if self._mmap[:len(STORE_MAGIC)] != STORE_MAGIC:
+                raise ValueError(f'{self.path} is not a SPDX license corpus file.')
+            position = len(STORE_MAGIC)
+            headerLength = int.from_bytes(self._mmap[position:position+8], 'little')
+            header = json.loads(self._mmap[position+8:position+8+headerLength].decode('utf-8'))
+            if header['version'] != STORE_FORMAT_VERSION:
+                raise ValueError(f"Unsupported SPDX license corpus file version {header['version']}.")
+            self._header = header
+            self._positions = {name: pos for pos, name in enumerate(header['names'])}
+        return memoryview(self._mmap)
+
+    def _section(self, number):
+        data = self._open()
+        start, length = self._header['sections'][number]
+        return data[start:start+length]
+
+    def load_index(self):
+        with span('store.load'):
+            return LicenseIndex.from_bytes(self._section(2), copy=False)
+
+    def load_metadata(self):
+        if self.is_empty():
+            return {}
+        self._open()
+        return self._header.get('metadata', {})
+
+    @contextmanager
+    def build_lock(self):
+        if fcntl is None:
+            yield
+            return
+        with open(self.path + '.lock', 'a') as fh:
+            fcntl.flock(fh, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(fh, fcntl.LOCK_UN)
+
+    def load_normalized_texts(self):
+        self._open()
+        textOffsets = self._section(0).cast('Q')
+        texts = self._section(1)
+        return {
+            name: bytes(texts[textOffsets[pos]:textOffsets[pos+1]]).decode('utf-8')
+            for pos, name in enumerate(self._header['names'])
+        }
+
+    def get_normalized_text(self, licenseId):
+        self._open()
+        pos = self._positions.get(licenseId)
+        if pos is None:
+            return None
+        textOffsets = self._section(0).cast('Q')
+        return bytes(self._section(1)[textOffsets[pos]:textOffsets[pos+1]]).decode('utf-8')
+
+
+def open_store(spec=None):
+    """Open the corpus store described by spec.
+
+    Arguments:
+        spec {string} -- None or 'redis' for the Redis server at SPDX_REDIS_HOST,
+            a redis:// URL, or the path of a local corpus file.
+
+    Returns:
+        CorpusStore -- the store.
+    """
+    if not spec or spec == 'redis':
+        return RedisStore()
+    if spec.startswith(('redis://', 'rediss://', 'unix://')):
+        import redis
+
+        return RedisStore(redis.StrictRedis.from_url(spec))
+    return MmapStore(spec)
@@ -0,0 +1,338 @@
+# SPDX-FileCopyrightText: 2026-present SPDX Contributors
+# SPDX-FileType: SOURCE
+# SPDX-License-Identifier: Apache-2.0
+
+"""Verification of close matches against the SPDX license templates, in Python.
+
+The SPDX License List gives each license a template: its text, with
+<<beginOptional>> ... <<endOptional>> around the parts which may be left out,
+and <<var;name="...";original="...";match="...">> for the parts which may be
+replaced, such as the copyright notice. A text is the standard license if it
+matches the template, once both are reduced to words following the SPDX
+matching guidelines: case, punctuation, whitespace, bullets, copyright
+symbols and varietal spellings do not matter.
+
+Templates are compiled once into a program of word comparisons, which is run
+over the words of the input without backtracking. The regular expression of a
+variable part must match the words it replaces, with the punctuation after
+each of them; the number of words it allows bounds the spans which are tried.
+
+TemplateVerifier answers like verify.StandardVerifier without starting a JVM,
+and hands the licenses without a template to a StandardVerifier fallback.
+"""
+
+import re
+import threading
+
+from spdx_license_matcher.instrument import timed
+from spdx_license_matcher.normalize import COPYRIGHT_SYMBOLS, VARIETAL_WORDS_SPELLING
+
+# Words a variable part may have when its regular expression does not bound its length.
+VAR_MAX_WORDS = 100
+
+_TAG_PATTERN = re.compile(r'<<(.*?)>>', re.DOTALL)
+_ATTRIBUTE_PATTERN = re.compile(r'(\w+)\s*=\s*"((?:[^"\\]|\\.)*)"', re.DOTALL)
+_BOUNDED_ANY_PATTERN = re.compile(r'^\.\{(\d*),(\d+)\}$')
+_COPYRIGHT_PATTERN = re.compile(COPYRIGHT_SYMBOLS + r'|\(c\)')
+_BULLET_PATTERN = re.compile(r'(?m)^\s*(?:\(?(?:[0-9]{1,3}|[a-z]|[ivx]{1,5})[.)]|[*•·-]+)(?=\s)')
+_WORD_PATTERN = re.compile(r'[^\W_]+')
+_TOKEN_PATTERN = re.compile(r'([^\W_]+)[^\w\s]*')
+_EQUIVALENT_WORDS = {'https': 'http'}
+_VARIETAL_WORDS_SPELLING = tuple(VARIETAL_WORDS_SPELLING.items())
+
+# Instructions of compiled templates.
+_WORD = 0
+_VAR = 1
+_SPLIT = 2
+_MATCH = 3
+
+
+class TemplateError(ValueError):
+    """A license template is not well-formed."""
+
+
+def template_words(text):
+    """Words of a text, as compared with the words of the templates.
+
+    Arguments:
+        text {string} -- license text, or a literal part of a template.
+
+    Returns:
+        list -- the lowercase words, without punctuation and bullets.
+    """
+    return [_EQUIVALENT_WORDS.get(word, word) for word in _WORD_PATTERN.findall(_prepare_text(text))]
+
+
+def template_tokens(text):
+    """Words of a text, with the text the regular expressions of the variable parts are matched against.
+
+    Arguments:
+        text {string} -- license text.
+
+    Returns:
+        list -- (word, token) of each word of template_words(), the token being the word followed by
+            the punctuation after it.
+    """
+    return [
+        (_EQUIVALENT_WORDS.get(token.group(1), token.group(1)), token.group(0))
+        for token in _TOKEN_PATTERN.finditer(_prepare_text(text))
+    ]
+
+
+def _prepare_text(text):
+    text = _COPYRIGHT_PATTERN.sub(' copyright ', text.lower())
+    for initial, final in _VARIETAL_WORDS_SPELLING:
+        text = text.replace(initial, final)
+    return _BULLET_PATTERN.sub(' ', text)
+
+
+class LicenseTemplate:
+    """A license template compiled for matching texts."""
+
+    def __init__(self, template):
+        """Compile a template.
+
+        Arguments:
+            template {string} -- the SPDX license template.
+
+        Raises:
+            TemplateError -- if the optional parts are not balanced, or a regular expression is not valid in Python.
+        """
+        self.program = []
+        # Positions of the _SPLIT instructions of the optional parts not yet closed.
+        openOptional = []
+        position = 0
+        for tag in _TAG_PATTERN.finditer(template):
+            self._add_words(template[position:tag.start()])
+            position = tag.end()
+            kind, _, attributes = tag.group(1).strip().partition(';')
+            kind = kind.strip()
+            if kind == 'beginOptional':
+                openOptional.append(len(self.program))
+                self.program.append([_SPLIT, len(self.program) + 1, None])
+            elif kind == 'endOptional':
+                if not openOptional:
+                    raise TemplateError('<<endOptional>> without <<beginOptional>>')
+                self.program[openOptional.pop()][2] = len(self.program)
+            elif kind == 'var':
+                self.program.append(_compile_var(dict(_ATTRIBUTE_PATTERN.findall(attributes))))
+            else:
+                raise TemplateError('Unknown template tag <<{}>>'.format(kind))
+        self._add_words(template[position:])
+        if openOptional:
+            raise TemplateError('<<beginOptional>> without <<endOptional>>')
+        self.program.append((_MATCH,))
+
+    def _add_words(self, text):
+        self.program.extend((_WORD, word) for word in template_words(text))
+
+    def matches(self, tokens):
+        """Check whether a text matches the template.
+
+        The program is run on all the ways of matching at once: the set of its
+        positions reached after each word of the text. A variable part keeps
+        each word it was entered at, for as long as its span may still grow.
+
+        Arguments:
+            tokens {list} -- words and tokens of the text, from template_tokens().
+
+        Returns:
+            bool -- True if the whole text matches the template.
+        """
+        program = self.program
+        texts = [token for _, token in tokens]
+        # Program position as key, and the words a variable part was entered at as value (None for the others).
+        states = {}
+        self._enter(states, 0, 0, texts)
+        for position, (word, _) in enumerate(tokens):
+            nextStates = {}
+            for pc, entries in states.items():
+                instruction = program[pc]
+                if instruction[0] == _WORD:
+                    if instruction[1] == word:
+                        self._enter(nextStates, pc + 1, position + 1, texts)
+                elif instruction[0] == _VAR:
+                    for entered in entries:
+                        if position - entered < instruction[1]:
+                            self._stay(nextStates, pc, entered, position + 1, texts)
+            if not nextStates:
+                return False
+            states = nextStates
+        return len(program) - 1 in states
+
+    def _enter(self, states, pc, position, texts):
+        """Add a program position and those reachable from it without reading a word."""
+        pending = [pc]
+        splits = set()
+        while pending:
+            pc = pending.pop()
+            instruction = self.program[pc]
+            if instruction[0] == _SPLIT:
+                if pc not in splits:
+                    splits.add(pc)
+                    pending.append(instruction[2])
+                    pending.append(instruction[1])
+            elif instruction[0] == _VAR:
+                entries = states.setdefault(pc, set())
+                if position not in entries:
+                    entries.add(position)
+                    if _var_matches(instruction, texts, position, position):
+                        pending.append(pc + 1)
+            elif pc not in states:
+                states[pc] = None
+
+    def _stay(self, states, pc, entered, position, texts):
+        """Keep a variable part after it read a word, and also leave it if its regular expression matches."""
+        states.setdefault(pc, set()).add(entered)
+        if _var_matches(self.program[pc], texts, entered, position):
+            self._enter(states, pc + 1, position, texts)
+
+
+def _compile_var(attributes):
+    """Instruction of a variable part: the words it may have, and its regular expression."""
+    match = attributes.get('match', '')
+    try:
+        pattern = re.compile(match, re.IGNORECASE | re.DOTALL) if match else None
+    except re.error as e:
+        raise TemplateError('Regular expression of <<var;name="{}">> not valid in Python: {}'.format(attributes.get('name'), e)) from None
+    return (_VAR, _var_max_words(match), pattern)
+
+
+def _var_matches(instruction, texts, start, end):
+    """Whether the regular expression of a variable part matches the tokens from start to end."""
+    pattern = instruction[2]
+    return pattern is None or pattern.fullmatch(' '.join(texts[start:end])) is not None
+
+
+def _var_max_words(match):
+    """Words a variable part may have, from its regular expression."""
+    bounded = _BOUNDED_ANY_PATTERN.match(match)
+    if bounded:
+        # A word and the separator after it take at least two characters.
+        return (int(bounded.group(2)) + 1) // 2
+    if match in ('', '.+', '.*', '.+?', '.*?'):
+        return VAR_MAX_WORDS
+    return max(len(template_words(alternative)) for alternative in match.split('|')) + 2
+
+
+class TemplateVerifier:
+    """Checks whether input texts match the SPDX license templates of their close matches.
+
+    Same methods as verify.StandardVerifier. Compiled templates are kept by ID.
+    """
+
+    kind = 'template'
+
+    def __init__(self, snapshot=None, fallback=None):
+        """Create a verifier.
+
+        Arguments:
+            snapshot {Snapshot} -- offline SPDX License List snapshot to read the templates from instead of spdx.org.
+            fallback {StandardVerifier} -- verifier of the licenses without a template; None to find them not standard.
+        """
+        self.snapshot = snapshot
+        self.fallback = fallback
+        self._templates = {}
+        self._templatesLock = threading.Lock()
+
+    def get_standard_match(self, matches, inputText):
+        """Return the first close match whose SPDX license template matches the input text.
+
+        Arguments:
+            matches {dictionary} -- license IDs which matched the input text as keys, in order of preference.
+            inputText {string} -- license text input by the user.
+
+        Returns:
+            string -- the matching license ID, or None if the input differs from all of them.
+        """
+        return self.get_standard_matches([(matches, inputText)])[0]
+
+    @timed('verify')
+    def get_standard_matches(self, items):
+        """Same as get_standard_match() for a batch of inputs.
+
+        Arguments:
+            items {list} -- (matches, inputText) of each input.
+
+        Returns:
+            list -- the matching license ID or None of each input.
+        """
+        results = []
+        for matches, inputText in items:
+            tokens = None
+            found = None
+            for licenseId in matches:
+                template = self.get_template(licenseId)
+                if template is None:
+                    if self.fallback is not None and self.fallback.get_standard_match({licenseId: None}, inputText) is not None:
+                        found = licenseId
+                        break
+                    continue
+                if tokens is None:
+                    tokens = template_tokens(inputText)
+                if self._matches(template, tokens):
+                    found = licenseId
+                    break
+            results.append(found)
+        return results
+
+    def is_standard(self, licenseId, inputText):
+        """Check the input text against the SPDX license template of one license or exception.
+
+        Arguments:
+            licenseId {string} -- SPDX license or license exception ID.
+            inputText {string} -- license text input by the user.
+
+        Returns:
+            bool -- True if the input matches the template.
+        """
+        return self.get_standard_match({licenseId: None}, inputText) is not None
+
+    def get_template(self, licenseId):
+        """Get the compiled template of a license or exception, compiled once.
+
+        Arguments:
+            licenseId {string} -- SPDX license or license exception ID.
+
+        Returns:
+            LicenseTemplate -- the compiled template, or None if the license has none or it is not well-formed.
+        """
+        if licenseId in self._templates:
+            return self._templates[licenseId]
+        try:
+            source = self._get_source(licenseId)
+        except (OSError, ValueError):
+            # Not kept, so that the template is fetched again after a network error or a bad response.
+            return None
+        template = None
+        if source:
+            try:
+                template = LicenseTemplate(source)
+            except TemplateError:
+                template = None
+        with self._templatesLock:
+            return self._templates.setdefault(licenseId, template)
+
+    def close(self):
+        """Stop the verification threads of the fallback."""
+        if self.fallback is not None:
+            self.fallback.close()
+
+    def _get_source(self, licenseId):
+        """Template source of a license, None if it has none; OSError or ValueError if it could not be fetched."""
+        from spdx_license_matcher.utils import get_spdx_license_template
+
+        try:
+            return get_spdx_license_template(licenseId, self.snapshot)
+        except KeyError:
+            # Not in the snapshot.
+            return None
+        except OSError as e:
+            # Not on spdx.org; requests errors are OSErrors.
+            if getattr(getattr(e, 'response', None), 'status_code', None) == 404:
+                return None
+            raise
+
+    @timed('verify.compare')
+    def _matches(self, template, tokens):
+        return template.matches(tokens)
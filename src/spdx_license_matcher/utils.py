@@ -2,31 +2,118 @@
 # SPDX-FileType: SOURCE
 # SPDX-License-Identifier: Apache-2.0
 
-"""Utility functions for Java library interaction and text compression."""
+"""Utility functions for Java library interaction and text compression.
+
+JPype and requests are imported by the functions using them, so that matching
+texts which need neither the JVM nor a download does not pay for importing them.
+
+The JVM is started with the options of get_jvm_options(): with SPDX_JAVA_OFFLINE
+set, the SPDX Java library only uses the license list bundled in its jar and
+never goes to the network; with SPDX_JVM_ARCHIVE set, the classes loaded are
+kept in a class data sharing archive at that path, created when the first JVM
+using it exits (see verify.create_jvm_archive), and mapped by the next ones.
+"""
 
 import gzip
 import os
+import threading
+import time
 from contextlib import contextmanager
 from io import BytesIO
 
-import jpype
+from spdx_license_matcher.instrument import span, timed
 
-# Do not remove this line, it is required to import the Java classes.
-import jpype.imports  # type: ignore[import]  # noqa: F401
-import requests
+# System properties making the SPDX Java library read the listed licenses from its jar only.
+JAVA_OFFLINE_PROPERTIES = {
+    'org.spdx.useJARLicenseInfoOnly': 'true',
+    'SPDXParser.OnlyUseLocalLicenses': 'true',
+}
 
+_jvmStartup = None
+# Held while the JVM starts, so that threads needing it at the same time start it once, then wait for it.
+_jvmLock = threading.Lock()
 
-def _ensure_jvm():
-    if not jpype.isJVMStarted():
-        classpath = _get_jar_path()
-        jpype.startJVM(classpath=[classpath], convertStrings=False)
-        from org.spdx.library import SpdxModelFactory
 
-        SpdxModelFactory.init()
+def is_java_offline():
+    """Whether SPDX_JAVA_OFFLINE asks for the license list bundled in the jar.
+
+    Returns:
+        bool -- True if SPDX_JAVA_OFFLINE is set to 1, true, yes or on.
+    """
+    return os.environ.get('SPDX_JAVA_OFFLINE', '').strip().lower() in ('1', 'true', 'yes', 'on')
+
+
+def get_jvm_options(offline=None, archivePath=None):
+    """Options the JVM is started with.
+
+    Arguments:
+        offline {bool} -- only use the license list bundled in the jar (default: SPDX_JAVA_OFFLINE).
+        archivePath {string} -- class data sharing archive to map, or to create at exit if it does not exist
+            (default: SPDX_JVM_ARCHIVE).
+
+    Returns:
+        list -- the JVM options.
+    """
+    if offline is None:
+        offline = is_java_offline()
+    if archivePath is None:
+        archivePath = os.environ.get('SPDX_JVM_ARCHIVE') or None
+    options = []
+    if offline:
+        options.extend('-D{}={}'.format(name, value) for name, value in JAVA_OFFLINE_PROPERTIES.items())
+    if archivePath:
+        # Dynamic archives need Java 13+; older JVMs start without one.
+        options.extend(['-XX:+IgnoreUnrecognizedVMOptions', '-Xshare:auto'])
+        if os.path.exists(archivePath):
+            options.append('-XX:SharedArchiveFile=' + archivePath)
+        else:
+            options.append('-XX:ArchiveClassesAtExit=' + archivePath)
+    return options
+
+
+def get_jvm_startup():
+    """How the JVM of this process was started, and how long it took.
+
+    Returns:
+        dictionary -- bootSeconds, initSeconds (the SPDX model initialization), offline, and the JVM options;
+            None if the JVM was not started by _ensure_jvm().
+    """
+    return None if _jvmStartup is None else dict(_jvmStartup)
+
+
+def _ensure_jvm():
+    global _jvmStartup
+    import jpype
+
+    # Do not remove this line, it is required to import the Java classes.
+    import jpype.imports  # type: ignore[import]  # noqa: F401
+
+    # Also checked under the lock, so that no thread goes on before the SPDX model is initialized.
+    with _jvmLock:
+        if jpype.isJVMStarted():
+            return
+        options = get_jvm_options()
+        start = time.perf_counter()
+        with span('jvm.start'):
+            classpath = _get_jar_path()
+            jpype.startJVM(*options, classpath=[classpath], convertStrings=False)
+        booted = time.perf_counter()
+        with span('jvm.init'):
+            from org.spdx.library import SpdxModelFactory
+
+            SpdxModelFactory.init()
+        _jvmStartup = {
+            'bootSeconds': booted - start,
+            'initSeconds': time.perf_counter() - booted,
+            'offline': is_java_offline(),
+            'options': options,
+        }
 
 
 @contextmanager
 def _jvm_thread():
+    import jpype
+
     JThread = jpype.JClass("java.lang.Thread")
     JThread.attachAsDaemon()
     try:
@@ -45,6 +132,7 @@ def colors(string, color):
     return "\033[%sm%s\033[0m" % (color, string)
 
 
+@timed('decompress')
 def decompressBytesToString(inputBytes):
     """Decompress the given byte array (which must be valid
     compressed gzip data) and return the decoded text (utf-8).
@@ -191,27 +279,56 @@ def checkTextStandardException(licenseException, compareText):
         return bool(diff.isDifferenceFound())
 
 
-def get_spdx_license_text(licenseId):
+@timed('spdx.fetch')
+def get_spdx_license_text(licenseId, snapshot=None):
     """Get the text of the closely matched SPDX license or license exception.
 
     Arguments:
         licenseId {string} -- License ID or Exception ID of the closely matched text.
+        snapshot {Snapshot} -- offline SPDX License List snapshot to read the text from instead of spdx.org.
 
     Returns:
         string -- returns the spdx license text.
     """
+    if snapshot is not None:
+        return snapshot.get_text(licenseId)
+    licenseJson = _get_spdx_license_json(licenseId)
+    if 'licenseText' in licenseJson:
+        return licenseJson['licenseText']
+    if 'licenseExceptionText' in licenseJson:
+        return licenseJson['licenseExceptionText']
+    raise KeyError(f"No licenseText or licenseExceptionText found for '{licenseId}'")
+
+
+@timed('spdx.fetch')
+def get_spdx_license_template(licenseId, snapshot=None):
+    """Get the SPDX license template of a license or license exception.
+
+    Arguments:
+        licenseId {string} -- License ID or Exception ID.
+        snapshot {Snapshot} -- offline SPDX License List snapshot to read the template from instead of spdx.org.
+
+    Returns:
+        string -- the template, or None if the license has none.
+    """
+    if snapshot is not None:
+        return snapshot.get_template(licenseId)
+    licenseJson = _get_spdx_license_json(licenseId)
+    return licenseJson.get('standardLicenseTemplate') or licenseJson.get('licenseExceptionTemplate')
+
+
+def _get_spdx_license_json(licenseId):
+    import requests
+
+    from spdx_license_matcher.fetch import get_default_client, get_list_url
+
     try:
         # License: https://spdx.org/licenses/MIT.json
         # License exception: https://spdx.org/licenses/389-exception.json
-        res = requests.get(f"https://spdx.org/licenses/{licenseId}.json")
+        res = get_default_client().get(get_list_url(f"{licenseId}.json"))
         res.raise_for_status()
     except requests.exceptions.HTTPError:
         raise
     except requests.exceptions.RequestException:
         raise
-    licenseJson = res.json()
-    if 'licenseText' in licenseJson:
-        return licenseJson['licenseText']
-    if 'licenseExceptionText' in licenseJson:
-        return licenseJson['licenseExceptionText']
-    raise KeyError(f"No licenseText or licenseExceptionText found for '{licenseId}'")
+    return res.json()
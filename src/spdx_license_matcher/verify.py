@@ -0,0 +1,253 @@
+# SPDX-FileCopyrightText: 2026-present SPDX Contributors
+# SPDX-FileType: SOURCE
+# SPDX-License-Identifier: Apache-2.0
+
+"""Verification of close matches against the SPDX standard license texts with the SPDX Java library.
+
+The functions of utils attach the calling thread to the JVM and detach it on
+every call, and look the listed license up again each time. A StandardVerifier
+instead keeps the ListedLicense and ListedLicenseException objects by ID, and
+verifies all the candidates of an input, or of a batch of inputs, in one JVM
+round: in the calling thread, attached once, or in a pool of threads attached
+once when they start.
+
+open_verifier('template') returns a template.TemplateVerifier instead, which
+uses the Java library only for the licenses without an SPDX license template.
+It is not the default: it does not check the replaceable parts against their
+regular expressions, and has not been compared with the Java library on the
+whole license list.
+"""
+
+import json
+import os
+import subprocess
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import click
+
+from spdx_license_matcher.instrument import timed
+from spdx_license_matcher.template import TemplateVerifier
+from spdx_license_matcher.utils import _ensure_jvm, _jvm_thread, get_jvm_startup
+
+# Licenses and exceptions verified to load the classes of the lookups and the comparisons into a JVM archive.
+WARM_UP_IDS = ('MIT', 'Apache-2.0', 'BSD-3-Clause', 'GPL-2.0-only', 'Classpath-exception-2.0')
+
+_WARM_UP_CODE = '''
+import json
+from spdx_license_matcher.verify import warm_up_jvm
+print(json.dumps(warm_up_jvm()))
+'''
+
+
+class StandardVerifier:
+    """Checks whether input texts match the SPDX standard text of their close matches."""
+
+    # Kind of verifier, telling apart the verifications of the result cache.
+    kind = 'java'
+
+    def __init__(self, threads=0):
+        """Create a verifier.
+
+        Arguments:
+            threads {int} -- number of threads verifying the candidates in parallel; 0 verifies them in the calling thread.
+        """
+        self.threads = threads
+        self._listed = {}
+        self._listedLock = threading.Lock()
+        self._executor = None
+        self._executorLock = threading.Lock()
+
+    def get_standard_match(self, matches, inputText):
+        """Return the first close match whose SPDX standard text matches the input text.
+
+        Arguments:
+            matches {dictionary} -- license IDs which matched the input text as keys, in order of preference.
+            inputText {string} -- license text input by the user.
+
+        Returns:
+            string -- the matching license ID, or None if the input differs from all of them.
+        """
+        return self.get_standard_matches([(matches, inputText)])[0]
+
+    @timed('verify')
+    def get_standard_matches(self, items):
+        """Same as get_standard_match() for a batch of inputs, verified in one JVM round.
+
+        Arguments:
+            items {list} -- (matches, inputText) of each input.
+
+        Returns:
+            list -- the matching license ID or None of each input.
+        """
+        self._start_jvm()
+        if not self.threads:
+            with _jvm_thread():
+                return [self._first_standard(matches, inputText) for matches, inputText in items]
+
+        executor = self._get_executor()
+        pending = [
+            [(licenseId, executor.submit(self.is_standard, licenseId, inputText)) for licenseId in matches]
+            for matches, inputText in items
+        ]
+        results = []
+        for futures in pending:
+            found = None
+            for licenseId, future in futures:
+                if found is None:
+                    if future.result():
+                        found = licenseId
+                else:
+                    # Candidates after the match are not needed.
+                    future.cancel()
+            results.append(found)
+        return results
+
+    def is_standard(self, licenseId, inputText):
+        """Check the input text against the SPDX standard text of one license or exception.
+
+        Must be called from a thread attached to the JVM.
+
+        Arguments:
+            licenseId {string} -- SPDX license or license exception ID.
+            inputText {string} -- license text input by the user.
+
+        Returns:
+            bool -- True if the input matches the standard text.
+        """
+        isException, listed = self.get_listed(licenseId)
+        return not self._is_difference_found(isException, listed, inputText)
+
+    def get_listed(self, licenseId):
+        """Get the SPDX listed license or exception of an ID, looked up once.
+
+        Must be called from a thread attached to the JVM.
+
+        Arguments:
+            licenseId {string} -- SPDX license or license exception ID.
+
+        Returns:
+            tuple -- whether the ID is a license exception, and the ListedLicense or ListedLicenseException.
+        """
+        listed = self._listed.get(licenseId)
+        if listed is None:
+            listed = self._lookup(licenseId)
+            with self._listedLock:
+                listed = self._listed.setdefault(licenseId, listed)
+        return listed
+
+    def close(self):
+        """Stop the verification threads."""
+        with self._executorLock:
+            if self._executor is not None:
+                self._executor.shutdown()
+                self._executor = None
+
+    def _get_executor(self):
+        with self._executorLock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.threads,
+                    thread_name_prefix='spdx-verify',
+                    initializer=self._attach_thread,
+                )
+            return self._executor
+
+    def _first_standard(self, matches, inputText):
+        for licenseId in matches:
+            if self.is_standard(licenseId, inputText):
+                return licenseId
+        return None
+
+    # The JVM calls, kept apart from the threading and caching above.
+
+    def _start_jvm(self):
+        _ensure_jvm()
+
+    def _attach_thread(self):
+        import jpype
+
+        jpype.JClass("java.lang.Thread").attachAsDaemon()
+
+    @timed('verify.lookup')
+    def _lookup(self, licenseId):
+        from org.spdx.library import LicenseInfoFactory
+
+        if LicenseInfoFactory.isSpdxListedExceptionId(licenseId):
+            return True, LicenseInfoFactory.getListedExceptionV2ById(licenseId)
+        return False, LicenseInfoFactory.getListedLicenseByIdCompatV2(licenseId)
+
+    @timed('verify.compare')
+    def _is_difference_found(self, isException, listed, inputText):
+        from org.spdx.utility.compare import LicenseCompareHelper
+
+        if isException:
+            diff = LicenseCompareHelper.isTextStandardException(listed, inputText)
+        else:
+            diff = LicenseCompareHelper.isTextStandardLicense(listed, inputText)
+        return bool(diff.isDifferenceFound())
+
+
+def open_verifier(kind='java', snapshot=None, threads=0):
+    """Create a verifier of the close matches.
+
+    Arguments:
+        kind {string} -- 'java' to verify with the Java library; 'template' to verify with the SPDX license
+            templates in Python, and with the Java library the licenses without one.
+        snapshot {Snapshot} -- offline SPDX License List snapshot to read the templates from instead of spdx.org.
+        threads {int} -- number of threads verifying with the Java library in parallel; 0 for the calling thread.
+
+    Returns:
+        TemplateVerifier|StandardVerifier -- the verifier.
+    """
+    standardVerifier = StandardVerifier(threads)
+    if kind == 'template':
+        return TemplateVerifier(snapshot, fallback=standardVerifier)
+    return standardVerifier
+
+
+_defaultVerifier = open_verifier()
+
+
+def get_default_verifier():
+    """The verifier shared by the callers which do not have their own, verifying in the calling thread.
+
+    Returns:
+        StandardVerifier -- the shared verifier.
+    """
+    return _defaultVerifier
+
+
+def warm_up_jvm():
+    """Start the JVM, then look up and verify a few licenses and exceptions to load the classes used.
+
+    Returns:
+        dictionary -- the JVM startup of get_jvm_startup().
+    """
+    StandardVerifier().get_standard_match(dict.fromkeys(WARM_UP_IDS), 'Warm up.')
+    return get_jvm_startup()
+
+
+@click.command()
+@click.option('--output', '-o', required=True, type=click.Path(dir_okay=False), help='Path of the class data sharing archive to write, then to give in SPDX_JVM_ARCHIVE.')
+@click.option('--offline/--online', default=True, help='Only use the license list bundled in the jar while warming up, as with SPDX_JAVA_OFFLINE.', show_default=True)
+def create_jvm_archive(output, offline):
+    """Create a JVM class data sharing archive of the SPDX Java library, so that later JVMs start faster."""
+    output = os.path.abspath(output)
+    if os.path.exists(output):
+        os.unlink(output)
+    env = dict(os.environ, SPDX_JVM_ARCHIVE=output, SPDX_JAVA_OFFLINE='1' if offline else '0')
+    # The archive is written when the JVM exits, so it is warmed up in its own process.
+    result = subprocess.run([sys.executable, '-c', _WARM_UP_CODE], env=env, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise click.ClickException('Could not start the JVM:\n' + result.stderr)
+    if not os.path.exists(output):
+        raise click.ClickException('The JVM did not write {}: class data sharing archives need Java 13 or later.'.format(output))
+    startup = json.loads(result.stdout.splitlines()[-1])
+    click.echo('Saved the JVM archive to {} (JVM started in {:.2f} s, SPDX model initialized in {:.2f} s without the archive)'.format(
+        output, startup['bootSeconds'], startup['initSeconds']))
+
+
+if __name__ == "__main__":
+    create_jvm_archive()
@@ -0,0 +1,54 @@
+# SPDX-FileCopyrightText: 2026-present SPDX Contributors
+# SPDX-FileType: SOURCE
+# SPDX-License-Identifier: Apache-2.0
+
+"""Shared fixtures. tests/data/licenses holds a small offline subset of the SPDX License List texts."""
+
+import json
+import os
+
+import pytest
+
+LICENSES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "licenses")
+
+
+def load_license_texts():
+    """Return the bundled license texts keyed by SPDX license ID."""
+    texts = {}
+    for fileName in sorted(os.listdir(LICENSES_DIR)):
+        licenseId, _ = os.path.splitext(fileName)
+        with open(os.path.join(LICENSES_DIR, fileName), "r", encoding="utf-8") as fh:
+            texts[licenseId] = fh.read()
+    return texts
+
+
+def write_license_list_data(root, licenseTexts, exceptionTexts=None, version="3.99"):
+    """Lay out license texts like the json directory of a spdx/license-list-data release."""
+    exceptionTexts = exceptionTexts or {}
+    lists = [
+        ("licenses.json", "licenses", "details", "licenseId", "licenseText", licenseTexts),
+        ("exceptions.json", "exceptions", "exceptions", "licenseExceptionId", "licenseExceptionText", exceptionTexts),
+    ]
+    for listFile, listKey, detailsDir, idField, textField, texts in lists:
+        os.makedirs(os.path.join(root, "json", detailsDir), exist_ok=True)
+        items = []
+        for itemId, text in sorted(texts.items()):
+            detailsUrl = "https://spdx.org/licenses/{}.json".format(itemId)
+            items.append({idField: itemId, "name": itemId + " License", "detailsUrl": detailsUrl, "isDeprecatedLicenseId": False})
+            with open(os.path.join(root, "json", detailsDir, itemId + ".json"), "w", encoding="utf-8") as fh:
+                json.dump({idField: itemId, "name": itemId + " License", textField: text, "isDeprecatedLicenseId": False}, fh)
+        with open(os.path.join(root, "json", listFile), "w", encoding="utf-8") as fh:
+            json.dump({"licenseListVersion": version, "releaseDate": "2026-01-01", listKey: items}, fh)
+    return root
+
+
+@pytest.fixture(scope="session")
+def license_texts():
+    return load_license_texts()
+
+
+@pytest.fixture(scope="session")
+def normalized_texts(license_texts):
+    from spdx_license_matcher.normalize import normalize
+
+    return {licenseId: normalize(text) for licenseId, text in license_texts.items()}
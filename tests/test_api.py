@@ -0,0 +1,94 @@
+# SPDX-FileCopyrightText: 2026-present SPDX Contributors
+# SPDX-FileType: SOURCE
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for the in-process Matcher API."""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from spdx_license_matcher.api import LicenseMatch, Matcher
+from spdx_license_matcher.cache import ResultCache, corpus_generation
+from spdx_license_matcher.computation import get_close_matches, select_top_matches
+from spdx_license_matcher.index import LicenseIndex
+from spdx_license_matcher.storage import MmapStore
+
+
+@pytest.fixture(scope="module")
+def index(normalized_texts):
+    return LicenseIndex.from_texts(normalized_texts)
+
+
+class TestSelectTopMatches:
+    def test_heap_keeps_the_best(self):
+        scores = [('A', 0.5), ('B', 0.95), ('C', 0.91), ('D', 0.99), ('E', 0.95)]
+        assert select_top_matches(scores, 0.9) == [('D', 0.99), ('B', 0.95), ('E', 0.95), ('C', 0.91)]
+        assert select_top_matches(scores, 0.9, topK=2) == [('D', 0.99), ('B', 0.95)]
+        assert select_top_matches(scores, 0.96, topK=2) == [('D', 0.99)]
+
+    def test_perfect_matches_leave_out_the_others(self):
+        scores = [('A', 0.95), ('B', 1.0), ('C', 0.99), ('D', 1.0)]
+        assert select_top_matches(scores, 0.9) == [('B', 1.0), ('D', 1.0)]
+        assert select_top_matches(scores, 0.9, topK=1) == [('B', 1.0)]
+
+    def test_top_k_must_be_positive(self):
+        with pytest.raises(ValueError):
+            select_top_matches([], 0.9, topK=0)
+
+
+class TestMatcher:
+    def test_same_matches_as_get_close_matches(self, index, license_texts):
+        matcher = Matcher(index, threshold=0.5)
+        for licenseId, text in license_texts.items():
+            modified = text.replace('the', 'a')
+            result = matcher.match(modified)
+            assert result.to_dict() == get_close_matches(modified, index, 0.5)
+            scores = [match.score for match in result.matches]
+            assert scores == sorted(scores, reverse=True)
+
+    def test_top_k(self, index, license_texts):
+        matcher = Matcher(index, threshold=0.5)
+        text = license_texts['BSD-2-Clause'] + ' Modified.'
+        everything = matcher.match(text).matches
+        assert len(everything) > 2
+        assert matcher.match(text, topK=2).matches == everything[:2]
+        assert matcher.match(text, threshold=0.999).matches == []
+
+    def test_exact_match(self, index, license_texts):
+        result = Matcher(index).match(license_texts['MIT'])
+        assert result.best == LicenseMatch('MIT', 1.0)
+        assert result.best.exact
+        assert result.stats.exactHits == 1
+
+    def test_match_many_shared_by_threads(self, index, license_texts):
+        matcher = Matcher(index)
+        texts = list(license_texts.values())
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = list(pool.map(lambda _: matcher.match_many(texts, topK=1), range(4)))
+        for threadResults in results:
+            assert [result.best.licenseId for result in threadResults] == list(license_texts)
+        assert matcher.stats.exactHits == 4 * len(texts)
+
+    def test_cached_results_are_ranked(self, index, license_texts):
+        cache = ResultCache(corpus_generation(index))
+        matcher = Matcher(index, threshold=0.5, cache=cache)
+        text = license_texts['BSD-2-Clause'] + ' Modified.'
+        first = matcher.match(text, topK=3)
+        second = matcher.match(text, topK=3)
+        assert first.matches == second.matches
+        assert len(first.matches) == 3
+        assert second.stats.cacheHits == 1
+
+    def test_from_store(self, tmp_path, index, normalized_texts, license_texts):
+        store = MmapStore(str(tmp_path / "corpus.bin"))
+        store.save(normalized_texts, index)
+        assert Matcher.from_store(store.path).match(license_texts['ISC']).best.licenseId == 'ISC'
+
+    def test_shingles_from_store(self, tmp_path, index, normalized_texts, license_texts):
+        store = MmapStore(str(tmp_path / "corpus.bin"))
+        store.save(normalized_texts, index)
+        matcher = Matcher.from_store(store.path, threshold=0.8, shingles=True)
+        result = matcher.match(license_texts['X11'].replace('the', 'a', 3))
+        assert [match.licenseId for match in result.matches] == ['X11']
+        assert result.stats.prunedByShingles > 0
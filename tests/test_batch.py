@@ -0,0 +1,80 @@
+# SPDX-FileCopyrightText: 2026-present SPDX Contributors
+# SPDX-FileType: SOURCE
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for batch scoring of many files."""
+
+import os
+
+import pytest
+
+from spdx_license_matcher.batch import InputTooLargeError, collect_files, score_files
+from spdx_license_matcher.index import LicenseIndex
+from spdx_license_matcher.segment import LicenseSegmenter
+
+from .conftest import LICENSES_DIR
+
+
+@pytest.fixture(scope="module")
+def index(normalized_texts):
+    return LicenseIndex.from_texts(normalized_texts)
+
+
+class TestCollectFiles:
+    def test_directory_and_glob(self):
+        fromDirectory = collect_files(directories=[LICENSES_DIR])
+        fromGlob = collect_files(patterns=[os.path.join(LICENSES_DIR, "**", "*.txt")])
+        assert len(fromDirectory) == len(os.listdir(LICENSES_DIR))
+        assert fromDirectory == fromGlob
+
+    def test_no_duplicates(self):
+        mit = os.path.join(LICENSES_DIR, "MIT.txt")
+        paths = collect_files([mit], [LICENSES_DIR], [mit])
+        assert paths.count(mit) == 1
+        assert paths[0] == mit
+
+
+class TestScoreFiles:
+    def test_worker_processes_match_in_process(self, index):
+        paths = collect_files(directories=[LICENSES_DIR])
+        serial = list(score_files(paths, index, jobs=1))
+        parallel = list(score_files(paths, index, jobs=2))
+        assert [result.path for result in parallel] == paths
+        assert [result.matches for result in parallel] == [result.matches for result in serial]
+        for result in parallel:
+            licenseId, _ = os.path.splitext(os.path.basename(result.path))
+            assert result.matches == {licenseId: 1.0}
+
+    def test_unreadable_file(self, index, tmp_path):
+        binary = tmp_path / "binary"
+        binary.write_bytes(b"\xff\xfe\x00")
+        [result] = score_files([str(binary)], index)
+        assert isinstance(result.error, UnicodeDecodeError)
+        assert result.matches is None
+
+    def test_size_limit(self, index):
+        mit = os.path.join(LICENSES_DIR, "MIT.txt")
+        [result] = score_files([mit], index, maxSize=100)
+        assert isinstance(result.error, InputTooLargeError)
+        assert result.inputText is None
+        [result] = score_files([mit], index, maxSize=0)
+        assert result.matches == {"MIT": 1.0}
+
+    def test_size_limit_in_worker_processes(self, index, tmp_path):
+        large = tmp_path / "large.txt"
+        large.write_text("x" * 2000, encoding="utf-8")
+        mit = os.path.join(LICENSES_DIR, "MIT.txt")
+        results = list(score_files([str(large), mit], index, jobs=2, maxSize=1500))
+        assert isinstance(results[0].error, InputTooLargeError)
+        assert str(results[0].error) == "{} is larger than the limit of 1500 bytes".format(large)
+        assert results[1].matches == {"MIT": 1.0}
+
+    def test_segments_in_worker_processes(self, index, normalized_texts, license_texts, tmp_path):
+        notices = tmp_path / "THIRD-PARTY-NOTICES"
+        notices.write_text("\n\n".join(license_texts[licenseId] for licenseId in ["MIT", "Zlib"]), encoding="utf-8")
+        segmenter = LicenseSegmenter(normalized_texts)
+        [serial] = score_files([str(notices)], index, segmenter=segmenter)
+        parallel = list(score_files([str(notices)] * 2, index, jobs=2, segmenter=segmenter))
+        assert [segment.licenseId for segment in serial.segments] == ["MIT", "Zlib"]
+        assert [result.segments for result in parallel] == [serial.segments] * 2
+        assert serial.matches is None
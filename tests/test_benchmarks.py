@@ -0,0 +1,53 @@
+# SPDX-FileCopyrightText: 2026-present SPDX Contributors
+# SPDX-FileType: SOURCE
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for the benchmark suite, on a few licenses and small inputs."""
+
+import json
+
+import pytest
+from click.testing import CliRunner
+
+from benchmarks import bench
+
+
+@pytest.fixture
+def small_inputs(monkeypatch):
+    monkeypatch.setattr(bench, "LARGE_INPUT_SIZE", 20000)
+
+
+@pytest.fixture(scope="module")
+def corpus(license_texts):
+    return {licenseId: license_texts[licenseId] for licenseId in ["MIT", "ISC", "Zlib", "BSL-1.0"]}
+
+
+class TestBenchmarks:
+    def test_inputs_reproducible(self, corpus, small_inputs):
+        inputs = bench.make_inputs(corpus, seed=1)
+        assert inputs == bench.make_inputs(corpus, seed=1)
+        assert {variant for variant, _, _ in inputs} == set(bench.VARIANTS)
+        assert all(len(text) >= 20000 for variant, _, text in inputs if variant == "large")
+
+    def test_measures(self, corpus, small_inputs):
+        results = bench.run_benchmarks(corpus, repeat=2)
+        assert {"normalize/verbatim", "match/heavy", "segment/multi", "end-to-end/large"} <= set(results)
+        measures = results["match/light"]
+        assert measures["runs"] == 2 * len(corpus)
+        assert measures["p50Ms"] <= measures["p90Ms"] <= measures["p99Ms"] <= measures["maxMs"]
+        assert measures["peakMemoryBytes"] > 0
+
+    def test_baseline_comparison(self, corpus, small_inputs, tmp_path):
+        runner = CliRunner()
+        output = tmp_path / "baseline.json"
+        result = runner.invoke(bench.bench, ["-r", "1", "--no-memory", "-o", str(output)])
+        assert result.exit_code == 0, result.output
+        baseline = json.loads(output.read_text(encoding="utf-8"))
+        assert baseline["results"]["normalize/verbatim"]["runs"] > 0
+
+        for measures in baseline["results"].values():
+            measures["p50Ms"] /= 1000
+        output.write_text(json.dumps(baseline), encoding="utf-8")
+        result = runner.invoke(bench.bench, ["-r", "1", "--no-memory", "-b", str(output)])
+        assert result.exit_code == 1
+        assert "REGRESSION" in result.output
@@ -0,0 +1,142 @@
+# SPDX-FileCopyrightText: 2026-present SPDX Contributors
+# SPDX-FileType: SOURCE
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for incremental builds of the corpus store."""
+
+import threading
+
+import pytest
+
+from spdx_license_matcher import build_licenses
+from spdx_license_matcher.build_licenses import build_spdx_licenses
+from spdx_license_matcher.normalize import NORMALIZER_VERSION, normalize
+from spdx_license_matcher.snapshot import Snapshot
+from spdx_license_matcher.storage import MmapStore
+
+
+def make_snapshot(version, texts):
+    entries = {
+        licenseId: {'name': licenseId, 'isException': False, 'isDeprecated': False,
+                    'text': text, 'normalized': normalize(text), 'template': None}
+        for licenseId, text in texts.items()
+    }
+    return Snapshot(version, '2026-01-01', entries)
+
+
+class TestIncrementalBuild:
+    def test_same_version_is_not_rebuilt(self, tmp_path, license_texts):
+        store = MmapStore(str(tmp_path / "corpus.bin"))
+        snapshot = make_snapshot('3.98', license_texts)
+        assert build_spdx_licenses(snapshot, store)
+        assert store.load_metadata()['licenseListVersion'] == '3.98'
+        mtime = (tmp_path / "corpus.bin").stat().st_mtime_ns
+        assert not build_spdx_licenses(snapshot, store)
+        assert (tmp_path / "corpus.bin").stat().st_mtime_ns == mtime
+
+    def test_only_changed_licenses_are_processed(self, tmp_path, license_texts):
+        store = MmapStore(str(tmp_path / "corpus.bin"))
+        build_spdx_licenses(make_snapshot('3.98', license_texts), store)
+
+        texts = dict(license_texts)
+        del texts['curl']
+        texts['MIT'] = texts['MIT'].replace('copies', 'copy')
+        snapshot = make_snapshot('3.99', texts)
+        # Unchanged licenses must be reused from the store, not taken from the new list.
+        for licenseId, entry in snapshot.entries.items():
+            if licenseId != 'MIT':
+                entry['normalized'] = 'stale'
+        assert build_spdx_licenses(snapshot, store)
+
+        index = store.load_index()
+        assert sorted(index.names) == sorted(texts)
+        assert store.get_normalized_text('MIT') == normalize(texts['MIT'])
+        assert store.get_normalized_text('ISC') == normalize(texts['ISC'])
+        assert index.get_scores(normalize(texts['MIT']))['MIT'] == 1.0
+        assert store.load_metadata()['licenseListVersion'] == '3.99'
+
+    def test_not_rebuilt_back_and_forth_without_numpy(self, tmp_path, license_texts, monkeypatch):
+        pytest.importorskip("numpy")
+        store = MmapStore(str(tmp_path / "corpus.bin"))
+        snapshot = make_snapshot('3.98', license_texts)
+        assert build_spdx_licenses(snapshot, store)
+        assert store.load_index().signatures is not None
+        with monkeypatch.context() as patched:
+            patched.setattr(build_licenses, "find_spec", lambda name: None)
+            assert not build_spdx_licenses(snapshot, store)
+            # A new version built without NumPy has no signatures...
+            assert build_spdx_licenses(make_snapshot('3.99', license_texts), store)
+            assert store.load_index().signatures is None
+        # ...which are added once by a process with NumPy, and kept by the others.
+        assert build_spdx_licenses(make_snapshot('3.99', license_texts), store)
+        assert store.load_index().signatures is not None
+        with monkeypatch.context() as patched:
+            patched.setattr(build_licenses, "find_spec", lambda name: None)
+            assert not build_spdx_licenses(make_snapshot('3.99', license_texts), store)
+
+    def test_normalizer_changes_normalize_again(self, tmp_path, license_texts, monkeypatch):
+        store = MmapStore(str(tmp_path / "corpus.bin"))
+        snapshot = make_snapshot('3.98', license_texts)
+        assert build_spdx_licenses(snapshot, store)
+        monkeypatch.setattr(build_licenses, "NORMALIZER_VERSION", NORMALIZER_VERSION + 1)
+        monkeypatch.setattr(build_licenses, "normalize", lambda text: "changed " + normalize(text))
+        # Neither the store nor the snapshot, normalized by the previous version, are reused.
+        assert build_spdx_licenses(snapshot, store, processes=1)
+        assert store.get_normalized_text('ISC') == "changed " + normalize(license_texts['ISC'])
+        assert store.load_index().get_scores("changed " + normalize(license_texts['ISC']))['ISC'] == 1.0
+        assert not build_spdx_licenses(snapshot, store, processes=1)
+
+    def test_missing_texts_normalized_again(self, tmp_path, license_texts, monkeypatch):
+        store = MmapStore(str(tmp_path / "corpus.bin"))
+        build_spdx_licenses(make_snapshot('3.98', license_texts), store)
+        # As if the text of ISC was missing from the store.
+        loadNormalizedTexts = MmapStore.load_normalized_texts
+        getNormalizedText = MmapStore.get_normalized_text
+        monkeypatch.setattr(MmapStore, "load_normalized_texts", lambda self: {
+            licenseId: text for licenseId, text in loadNormalizedTexts(self).items() if licenseId != 'ISC'
+        })
+        monkeypatch.setattr(MmapStore, "get_normalized_text",
+                            lambda self, licenseId: None if licenseId == 'ISC' else getNormalizedText(self, licenseId))
+        snapshot = make_snapshot('3.99', license_texts)
+        snapshot.entries['ISC']['normalized'] = None
+        assert build_spdx_licenses(snapshot, store, processes=1)
+        monkeypatch.undo()
+        assert store.get_normalized_text('ISC') == normalize(license_texts['ISC'])
+
+    def test_concurrent_builds_build_once(self, tmp_path, license_texts, monkeypatch):
+        store = MmapStore(str(tmp_path / "corpus.bin"))
+        snapshot = make_snapshot('3.98', license_texts)
+        saves = []
+        save = MmapStore.save
+
+        def counting_save(self, *args):
+            saves.append(args)
+            save(self, *args)
+
+        monkeypatch.setattr(MmapStore, 'save', counting_save)
+        threads = [
+            threading.Thread(target=build_spdx_licenses, args=(snapshot, MmapStore(store.path), True))
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert len(saves) == 1
+        assert not store.is_empty()
+
+
+class TestParallelBuild:
+    def test_processes_do_not_change_the_corpus(self, tmp_path, license_texts):
+        # Without the normalized texts of the snapshot, the worker processes normalize the original ones.
+        snapshot = make_snapshot('3.98', license_texts)
+        for entry in snapshot.entries.values():
+            entry['normalized'] = None
+        corpora = []
+        for processes in (1, 3):
+            path = tmp_path / "corpus-{}.bin".format(processes)
+            store = MmapStore(str(path))
+            assert build_spdx_licenses(snapshot, store, processes=processes)
+            corpora.append(path.read_bytes())
+        assert corpora[0] == corpora[1]
+        assert MmapStore(str(tmp_path / "corpus-3.bin")).get_normalized_text('MIT') == normalize(license_texts['MIT'])
@@ -0,0 +1,135 @@
+# SPDX-FileCopyrightText: 2026-present SPDX Contributors
+# SPDX-FileType: SOURCE
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for the result cache."""
+
+import contextlib
+import os
+import pickle
+
+import pytest
+
+from spdx_license_matcher.batch import collect_files, score_files
+from spdx_license_matcher.cache import CachedVerifier, RedisTier, ResultCache, SqliteTier, corpus_generation, open_cache
+from spdx_license_matcher.candidates import CandidateStats
+from spdx_license_matcher.index import LicenseIndex
+from spdx_license_matcher.template import TemplateVerifier
+
+from .conftest import LICENSES_DIR
+from .test_verify import CANDIDATES, RecordingVerifier
+
+
+@pytest.fixture(scope="module")
+def index(normalized_texts):
+    return LicenseIndex.from_texts(normalized_texts)
+
+
+class TestResultCache:
+    def test_least_recently_used_evicted(self):
+        cache = ResultCache("generation", maxEntries=2)
+        stats = CandidateStats()
+        cache.put("a", 1, stats)
+        cache.put("b", 2, stats)
+        assert cache.get("a", stats) == 1
+        cache.put("c", 3, stats)
+        assert cache.get("b", stats) is None
+        assert cache.get("a", stats) == 1
+        assert cache.get("c", stats) == 3
+        assert (stats.cacheHits, stats.cacheMisses, stats.cacheEvictions) == (3, 1, 1)
+
+    def test_keys_depend_on_parameters(self):
+        cache = ResultCache("generation")
+        assert cache.make_key("matches", "text", 0.9) == cache.make_key("matches", "text", 0.9)
+        assert cache.make_key("matches", "text", 0.9) != cache.make_key("matches", "text", 0.8)
+        assert cache.make_key("matches", "text", 0.9) != cache.make_key("standard", "text", 0.9)
+
+    def test_generation_changes_with_the_corpus(self, normalized_texts, index):
+        assert corpus_generation(index) == corpus_generation(LicenseIndex.from_texts(normalized_texts))
+        assert corpus_generation(index) != corpus_generation(index, {"licenseListVersion": "3.99"})
+        changed = dict(normalized_texts, MIT=normalized_texts["MIT"] + " changed")
+        assert corpus_generation(index) != corpus_generation(LicenseIndex.from_texts(changed))
+
+    def test_memory_only(self, index):
+        assert open_cache(None, index, maxEntries=0) is None
+        assert open_cache(None, index).tier is None
+
+
+class TestSqliteTier:
+    def test_persistent_within_generation(self, tmp_path):
+        path = str(tmp_path / "cache.sqlite")
+        ResultCache("one", tier=SqliteTier(path)).put("key", {"MIT": 1.0})
+        stats = CandidateStats()
+        assert ResultCache("one", maxEntries=0, tier=SqliteTier(path)).get("key", stats) == {"MIT": 1.0}
+        assert stats.cacheHits == 1
+        # A rebuilt corpus drops the results of the previous one.
+        assert ResultCache("two", tier=SqliteTier(path)).get("key") is None
+        assert ResultCache("one", tier=SqliteTier(path)).get("key") is None
+
+
+class TestRedisTier:
+    def test_pickled_by_url(self):
+        tier = RedisTier("redis://example.invalid:6380/2")
+        tier.generation = "one"
+        copy = pickle.loads(pickle.dumps(tier))
+        assert copy.client.connection_pool.connection_kwargs["port"] == 6380
+        assert copy._prefix() == "spdx:cache:one:"
+
+
+class TestScoreFiles:
+    def test_results_cached_across_runs_and_workers(self, index, tmp_path):
+        paths = collect_files(directories=[LICENSES_DIR])
+        cache = open_cache(str(tmp_path / "cache.sqlite"), index)
+        first = list(score_files(paths, index, jobs=2, cache=cache))
+        assert sum(result.stats.cacheMisses for result in first) == len(paths)
+        second = list(score_files(paths, index, cache=open_cache(str(tmp_path / "cache.sqlite"), index)))
+        assert [result.matches for result in second] == [result.matches for result in first]
+        assert sum(result.stats.cacheHits for result in second) == len(paths)
+        for result in second:
+            licenseId, _ = os.path.splitext(os.path.basename(result.path))
+            assert result.matches == {licenseId: 1.0}
+
+
+class TestCachedVerifier:
+    def test_inputs_verified_once(self, monkeypatch):
+        monkeypatch.setattr("spdx_license_matcher.verify._jvm_thread", contextlib.nullcontext)
+        recording = RecordingVerifier()
+        stats = CandidateStats()
+        verifier = CachedVerifier(recording, ResultCache("generation"), stats)
+        for _ in range(3):
+            assert verifier.get_standard_match(CANDIDATES, "text BSD-3-Clause") == "BSD-3-Clause"
+            assert verifier.get_standard_match(CANDIDATES, "other text") is None
+        assert (stats.cacheHits, stats.cacheMisses) == (4, 2)
+        assert recording.comparisons == 5
+
+    def test_kinds_of_verifier_not_shared(self, monkeypatch):
+        monkeypatch.setattr("spdx_license_matcher.verify._jvm_thread", contextlib.nullcontext)
+        cache = ResultCache("generation")
+        recording = RecordingVerifier()
+        CachedVerifier(recording, cache).get_standard_match(CANDIDATES, "text BSD-3-Clause")
+        templates = TemplateVerifier(fallback=RecordingVerifier())
+        monkeypatch.setattr(templates, "get_template", lambda licenseId: None)
+        stats = CandidateStats()
+        CachedVerifier(templates, cache, stats).get_standard_match(CANDIDATES, "text BSD-3-Clause")
+        assert (stats.cacheHits, stats.cacheMisses) == (0, 1)
+
+    def test_candidate_counts_restored_on_hits(self, index, license_texts, tmp_path):
+        modified = tmp_path / "LICENSE"
+        modified.write_text(license_texts["BSD-3-Clause"].replace("Neither", "Nor"), encoding="utf-8")
+        paths = [os.path.join(LICENSES_DIR, "MIT.txt"), str(modified)]
+        cache = ResultCache("generation")
+        first = list(score_files(paths, index, cache=cache))
+        second = list(score_files(paths, index, cache=cache))
+        assert [result.stats.cacheHits for result in second] == [1, 1]
+        assert [result.stats.get_candidate_counts() for result in second] == [result.stats.get_candidate_counts() for result in first]
+        assert second[0].stats.exactHits == 1
+        assert second[1].stats.total == len(index) and second[1].stats.scored < len(index)
+
+    def test_entries_shared_with_the_server(self, index, license_texts):
+        from spdx_license_matcher.server import MatchService
+
+        cache = ResultCache("generation")
+        list(score_files([os.path.join(LICENSES_DIR, "MIT.txt")], index, cache=cache))
+        service = MatchService(index, cache=cache)
+        assert service.match(license_texts["MIT"])["matches"] == {"MIT": 1.0}
+        assert service.stats.cacheHits == 1
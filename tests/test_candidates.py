@@ -0,0 +1,100 @@
+# SPDX-FileCopyrightText: 2026-present SPDX Contributors
+# SPDX-FileType: SOURCE
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for candidate pre-filtering before exact Dice scoring."""
+
+import pickle
+
+import pytest
+
+from spdx_license_matcher.candidates import CandidateStats, get_candidates
+from spdx_license_matcher.computation import get_close_matches
+from spdx_license_matcher.index import LicenseIndex
+from spdx_license_matcher.normalize import normalize
+from spdx_license_matcher.shingles import ShingleIndex
+
+
+@pytest.fixture(scope="module")
+def index(normalized_texts):
+    return LicenseIndex.from_texts(normalized_texts)
+
+
+@pytest.fixture(scope="module")
+def shingles(index, normalized_texts):
+    return ShingleIndex(index.names, normalized_texts)
+
+
+class TestLengthPruning:
+    @pytest.mark.parametrize("threshold", [0.0, 0.5, 0.8, 0.9, 0.99, 1.0])
+    def test_never_prunes_a_match(self, index, license_texts, threshold):
+        for licenseId, text in license_texts.items():
+            normalizedQuery = normalize(text.replace("the", "a"))
+            scores = index.get_scores(normalizedQuery)
+            candidates = {index.names[pos] for pos in get_candidates(index, normalizedQuery, threshold)}
+            assert {name for name, score in scores.items() if score >= threshold} <= candidates
+
+    def test_stats(self, index, license_texts):
+        stats = CandidateStats()
+        get_candidates(index, normalize(license_texts["MIT"]), 0.9, stats=stats)
+        get_candidates(index, normalize(license_texts["GPL-2.0"]), 0.9, stats=stats)
+        assert stats.total == 2 * len(index)
+        assert stats.prunedByLength > len(index)
+        assert stats.prunedByMinHash == 0
+        assert stats.scored == stats.total - stats.prunedByLength
+
+    def test_get_close_matches_unchanged(self, index, license_texts):
+        inputText = license_texts["BSD-3-Clause"].replace("Neither", "Nor")
+        stats = CandidateStats()
+        assert get_close_matches(inputText, index, 0.9, stats=stats) == get_close_matches(inputText, license_texts, 0.9)
+        assert stats.scored < len(index)
+
+
+class TestMinHashLSH:
+    def test_keeps_near_duplicates(self, normalized_texts, license_texts):
+        pytest.importorskip("numpy")
+        from spdx_license_matcher.minhash import MinHashLSH
+
+        index = LicenseIndex.from_texts(normalized_texts, minhash=True)
+        loaded = LicenseIndex.from_bytes(index.to_bytes())
+        assert loaded.signatures == index.signatures
+        lsh = MinHashLSH(loaded.signatures)
+        stats = CandidateStats()
+        inputText = license_texts["Apache-2.0"].replace("Licensor", "Licenser", 1)
+        matches = get_close_matches(inputText, loaded, 0.9, lsh, stats)
+        assert "Apache-2.0" in matches
+        assert stats.scored == 1
+
+
+class TestWordShingles:
+    def test_keeps_the_edited_license(self, index, shingles, license_texts):
+        for licenseId, text in license_texts.items():
+            inputText = text.replace("the", "a", 3)
+            assert licenseId in get_close_matches(inputText, index, 0.9, shingles=shingles)
+
+    def test_fewer_close_matches_within_a_family(self, index, shingles, license_texts):
+        inputText = license_texts["MIT"].replace("the", "a", 3)
+        stats = CandidateStats()
+        assert len(get_close_matches(inputText, index, 0.8)) > 1
+        assert get_close_matches(inputText, index, 0.8, stats=stats, shingles=shingles) == {"MIT": pytest.approx(0.991, abs=0.001)}
+        assert stats.prunedByShingles > 0
+        assert stats.scored == stats.total - stats.prunedByLength - stats.prunedByShingles
+
+    def test_ranks_the_family_apart(self, shingles, normalized_texts):
+        ranked = shingles.rank(normalized_texts["BSD-3-Clause"])
+        assert shingles.names[ranked[0][0]] == "BSD-3-Clause"
+        assert ranked[0][1] == pytest.approx(1.0)
+        assert "BSD-2-Clause" in [shingles.names[pos] for pos, _ in ranked[1:]]
+
+    def test_short_input_keeps_all_candidates(self, shingles):
+        assert shingles.get_candidates("mit license", [1, 4, 7]) == {1, 4, 7}
+
+    def test_separating_phrases(self, shingles):
+        [phrase] = shingles.get_separating_phrases("BSD-3-Clause", "BSD-2-Clause")
+        assert "neither the name of" in phrase
+        assert "x consortium" in shingles.get_separating_phrases("X11", "MIT", limit=1)[0]
+
+    def test_pickled_to_workers(self, index, shingles, normalized_texts):
+        loaded = pickle.loads(pickle.dumps(shingles))
+        text = normalized_texts["BSD-2-Clause"]
+        assert loaded.rank(text) == shingles.rank(text)
@@ -0,0 +1,92 @@
+# SPDX-FileCopyrightText: 2026-present SPDX Contributors
+# SPDX-FileType: SOURCE
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for the similarity percentage and the differences shown for close matches."""
+
+import random
+import time
+
+import pytest
+
+from spdx_license_matcher.difference import generate_word_diff, get_similarity_percent, levenshtein_distance
+
+
+def reference_distance(text1, text2):
+    """Textbook dynamic programming Levenshtein distance."""
+    previous = list(range(len(text2) + 1))
+    for i, character1 in enumerate(text1, 1):
+        current = [i]
+        for j, character2 in enumerate(text2, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (character1 != character2)))
+        previous = current
+    return previous[-1]
+
+
+def reference_percent(text1, text2):
+    """The similarity percentage as computed before, with jellyfish."""
+    bigger = float(max(len(text1), len(text2)))
+    return round((bigger - float(reference_distance(text1, text2))) / bigger * 100, 2)
+
+
+def edit_words(text, count, rng):
+    words = text.split(" ")
+    for i in rng.sample(range(len(words)), count):
+        words[i] = "changed"
+    return " ".join(words)
+
+
+class TestLevenshteinDistance:
+    def test_random_texts(self):
+        rng = random.Random(20260201)
+        for _ in range(5000):
+            text1 = "".join(rng.choice("ab c") for _ in range(rng.randint(0, 14)))
+            text2 = "".join(rng.choice("ab c") for _ in range(rng.randint(0, 14)))
+            distance = reference_distance(text1, text2)
+            assert levenshtein_distance(text1, text2) == distance, (text1, text2)
+            maxDistance = rng.randint(0, 8)
+            assert levenshtein_distance(text1, text2, maxDistance) == (distance if distance <= maxDistance else None)
+
+    def test_same_as_jellyfish(self, license_texts):
+        jellyfish = pytest.importorskip("jellyfish")
+        rng = random.Random(1)
+        text = license_texts["Apache-2.0"]
+        edited = edit_words(text, 30, rng)
+        assert levenshtein_distance(text, edited) == jellyfish.levenshtein_distance(text, edited)
+
+
+class TestSimilarityPercent:
+    def test_random_texts_with_cutoff(self):
+        rng = random.Random(20260202)
+        for _ in range(5000):
+            text1 = "".join(rng.choice("ab c") for _ in range(rng.randint(1, 14)))
+            text2 = "".join(rng.choice("ab c") for _ in range(rng.randint(0, 14)))
+            percent = reference_percent(text1, text2)
+            assert get_similarity_percent(text1, text2) == percent
+            cutoff = rng.choice([10, 50, 66.67, 75, 90, 100])
+            assert get_similarity_percent(text1, text2, cutoff) == (percent if percent >= cutoff else None), (text1, text2, cutoff)
+
+    def test_early_exit_for_other_license(self, license_texts):
+        start = time.perf_counter()
+        assert get_similarity_percent(license_texts["Apache-2.0"], license_texts["BSL-1.0"], 90) is None
+        assert time.perf_counter() - start < 0.5
+
+    def test_identical_or_empty(self, license_texts):
+        assert get_similarity_percent(license_texts["MIT"], license_texts["MIT"]) == 100.0
+        assert get_similarity_percent("", "") == 100.0
+        assert get_similarity_percent("abc", "") == 0.0
+
+
+class TestWordDiff:
+    def test_changed_words_only(self, license_texts):
+        text = license_texts["MIT"]
+        # Case is normalized away.
+        edited = text.replace("without restriction", "with some restrictions", 1).replace("Permission", "PERMISSION")
+        lines = generate_word_diff(text, edited, context=2)
+        assert len([line for line in lines if line.startswith("@@ -")]) == 1
+        assert "-without restriction," in lines
+        assert "+with some restrictions," in lines
+        assert all(len(line.split()) <= 3 for line in lines if line[0] == " ")
+
+    def test_no_difference(self, license_texts):
+        assert generate_word_diff(license_texts["MIT"], license_texts["MIT"]) == []
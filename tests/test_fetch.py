@@ -0,0 +1,154 @@
+# SPDX-FileCopyrightText: 2026-present SPDX Contributors
+# SPDX-FileType: SOURCE
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for downloading the SPDX License List, against a local stand-in of spdx.org."""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from spdx_license_matcher.build_licenses import build_spdx_licenses
+from spdx_license_matcher.fetch import HttpClient, get_list_url
+from spdx_license_matcher.normalize import normalize
+from spdx_license_matcher.storage import MmapStore
+
+
+class ListServer(ThreadingHTTPServer):
+    """Serves JSON documents by path, with ETags, injected failures and delays."""
+
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(('127.0.0.1', 0), ListHandler)
+        self.documents = {}
+        self.failures = {}
+        self.delays = {}
+        self.requests = []
+        self.lock = threading.Lock()
+
+    @property
+    def url(self):
+        return 'http://127.0.0.1:{}/'.format(self.server_address[1])
+
+
+class ListHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.requests.append((self.path, self.headers.get('If-None-Match')))
+            failing = server.failures.get(self.path, 0)
+            if failing:
+                server.failures[self.path] = failing - 1
+        time.sleep(server.delays.get(self.path, 0))
+        if failing:
+            self.send_response(503)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        document = server.documents.get(self.path)
+        if document is None:
+            self.send_error(404)
+            return
+        body = json.dumps(document).encode('utf-8')
+        etag = '"{}"'.format(hash(body))
+        if self.headers.get('If-None-Match') == etag:
+            self.send_response(304)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('ETag', etag)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def list_server(monkeypatch):
+    server = ListServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setenv('SPDX_LICENSE_LIST_URL', server.url)
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def publish(server, licenseTexts, version='3.99'):
+    licenses = []
+    for licenseId, text in licenseTexts.items():
+        # Relative, unlike those of spdx.org, so that they resolve against the stand-in.
+        licenses.append({'licenseId': licenseId, 'detailsUrl': './{}.json'.format(licenseId)})
+        server.documents['/{}.json'.format(licenseId)] = {'licenseId': licenseId, 'licenseText': text}
+    server.documents['/licenses.json'] = {'licenseListVersion': version, 'licenses': licenses}
+    server.documents['/exceptions.json'] = {'licenseListVersion': version, 'exceptions': []}
+
+
+class TestHttpClient:
+    def test_server_errors_are_retried(self, list_server):
+        list_server.documents['/MIT.json'] = {'licenseId': 'MIT'}
+        list_server.failures['/MIT.json'] = 2
+        client = HttpClient(retries=2, backoff=0)
+        assert client.get_json(get_list_url('MIT.json')) == {'licenseId': 'MIT'}
+        assert len(list_server.requests) == 3
+
+    def test_retries_are_bounded(self, list_server):
+        list_server.documents['/MIT.json'] = {'licenseId': 'MIT'}
+        list_server.failures['/MIT.json'] = 5
+        client = HttpClient(retries=1, backoff=0)
+        with pytest.raises(requests.exceptions.RequestException):
+            client.get_json(get_list_url('MIT.json'))
+        assert len(list_server.requests) == 2
+
+    def test_hung_connection_times_out(self, list_server):
+        list_server.documents['/MIT.json'] = {'licenseId': 'MIT'}
+        list_server.delays['/MIT.json'] = 2
+        client = HttpClient(timeout=0.2, retries=0)
+        start = time.perf_counter()
+        with pytest.raises(requests.exceptions.RequestException):
+            client.get_json(get_list_url('MIT.json'))
+        assert time.perf_counter() - start < 1.5
+
+    def test_saved_documents_are_revalidated(self, list_server, tmp_path):
+        list_server.documents['/MIT.json'] = {'licenseId': 'MIT'}
+        url = get_list_url('MIT.json')
+        assert HttpClient(cacheDir=str(tmp_path)).get_json(url) == {'licenseId': 'MIT'}
+        assert HttpClient(cacheDir=str(tmp_path)).get_json(url) == {'licenseId': 'MIT'}
+        first, second = list_server.requests
+        assert first[1] is None
+        assert second[1] is not None
+
+        list_server.documents['/MIT.json'] = {'licenseId': 'MIT', 'licenseText': 'changed'}
+        assert HttpClient(cacheDir=str(tmp_path)).get_json(url)['licenseText'] == 'changed'
+
+    def test_documents_keep_the_order_of_the_urls(self, list_server):
+        urls = []
+        for number in range(20):
+            list_server.documents['/{}.json'.format(number)] = number
+            # Later documents answer sooner.
+            list_server.delays['/{}.json'.format(number)] = (20 - number) / 500
+            urls.append(get_list_url('{}.json'.format(number)))
+        assert HttpClient(concurrency=4).get_all_json(urls) == list(range(20))
+
+
+class TestBuildFromServer:
+    def test_build(self, list_server, tmp_path, license_texts):
+        publish(list_server, license_texts)
+        list_server.failures['/MIT.json'] = 1
+        store = MmapStore(str(tmp_path / 'corpus.bin'))
+        assert build_spdx_licenses(store=store, client=HttpClient(backoff=0))
+        assert sorted(store.load_index().names) == sorted(license_texts)
+        assert store.get_normalized_text('MIT') == normalize(license_texts['MIT'])
+
+        # Same version: only the license list is downloaded.
+        del list_server.requests[:]
+        assert not build_spdx_licenses(store=store, client=HttpClient(backoff=0))
+        assert [path for path, _ in list_server.requests] == ['/licenses.json']
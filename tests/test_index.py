@@ -0,0 +1,75 @@
+# SPDX-FileCopyrightText: 2026-present SPDX Contributors
+# SPDX-FileType: SOURCE
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for the precomputed bigram index."""
+
+import pytest
+
+from spdx_license_matcher.candidates import CandidateStats
+from spdx_license_matcher.computation import get_close_matches
+from spdx_license_matcher.index import LicenseIndex
+from spdx_license_matcher.normalize import normalize
+from spdx_license_matcher.sorensen_dice import get_dice_coefficient
+
+
+@pytest.fixture(scope="module")
+def index(normalized_texts):
+    return LicenseIndex.from_texts(normalized_texts)
+
+
+class TestLicenseIndex:
+    def test_scores_identical_to_dice_coefficient(self, index, license_texts, normalized_texts):
+        queries = [
+            license_texts["MIT"],
+            license_texts["BSD-3-Clause"].replace("Neither", "Nor"),
+            license_texts["Apache-2.0"][:3000],
+            "x",
+            "",
+        ]
+        for query in queries:
+            normalizedQuery = normalize(query)
+            scores = index.get_scores(normalizedQuery)
+            for licenseId, normalizedText in normalized_texts.items():
+                assert scores[licenseId] == get_dice_coefficient(normalizedQuery, normalizedText)
+
+    def test_round_trip(self, index, license_texts):
+        loaded = LicenseIndex.from_bytes(index.to_bytes())
+        assert loaded.names == index.names
+        assert loaded.bigrams == index.bigrams
+        normalizedQuery = normalize(license_texts["ISC"])
+        assert loaded.get_scores(normalizedQuery) == index.get_scores(normalizedQuery)
+
+    def test_rejects_foreign_data(self):
+        with pytest.raises(ValueError):
+            LicenseIndex.from_bytes(b"not an index")
+
+
+class TestGetCloseMatchesWithIndex:
+    def test_same_matches_as_license_texts(self, index, license_texts):
+        inputText = license_texts["BSD-2-Clause"].replace("provided", "supplied")
+        assert get_close_matches(inputText, index, 0.8) == get_close_matches(inputText, license_texts, 0.8)
+
+    def test_perfect_match(self, index, license_texts):
+        assert get_close_matches(license_texts["Zlib"], index) == {"Zlib": 1.0}
+
+
+class TestExactMatches:
+    def test_verbatim_texts_skip_scoring(self, index, license_texts):
+        stats = CandidateStats()
+        for licenseId, text in license_texts.items():
+            assert get_close_matches(text, index, stats=stats) == {licenseId: 1.0}
+        assert stats.exactHits == len(license_texts)
+        assert stats.total == 0
+
+    def test_same_normalized_text_matches_all(self, normalized_texts):
+        texts = dict(normalized_texts, **{"MIT-copy": normalized_texts["MIT"]})
+        index = LicenseIndex.from_bytes(LicenseIndex.from_texts(texts).to_bytes())
+        assert index.get_exact_matches(normalized_texts["MIT"]) == ["MIT", "MIT-copy"]
+
+    def test_miss_is_scored(self, index, license_texts):
+        stats = CandidateStats()
+        inputText = license_texts["ISC"].replace("fee", "charge")
+        assert get_close_matches(inputText, index, stats=stats) == get_close_matches(inputText, license_texts)
+        assert (stats.exactHits, stats.exactMisses) == (0, 1)
+        assert stats.total == len(index)
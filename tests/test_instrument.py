@@ -0,0 +1,84 @@
+# SPDX-FileCopyrightText: 2026-present SPDX Contributors
+# SPDX-FileType: SOURCE
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for the instrumentation spans."""
+
+import os
+
+import pytest
+from click.testing import CliRunner
+
+from spdx_license_matcher import instrument
+from spdx_license_matcher import matcher as cli
+from spdx_license_matcher.batch import score_files
+from spdx_license_matcher.computation import get_close_matches
+from spdx_license_matcher.index import LicenseIndex
+
+from .conftest import LICENSES_DIR
+
+
+@pytest.fixture
+def spans():
+    recorded = []
+
+    def listener(name, seconds):
+        recorded.append((name, seconds))
+
+    instrument.add_listener(listener)
+    yield recorded
+    instrument.remove_listener(listener)
+
+
+@pytest.fixture(scope="module")
+def index(normalized_texts):
+    return LicenseIndex.from_texts(normalized_texts)
+
+
+class TestSpans:
+    def test_stages_reported(self, spans, index, license_texts):
+        get_close_matches(license_texts["MIT"] + " changed", index)
+        assert [name for name, _ in spans] == ["normalize", "score"]
+        assert all(seconds >= 0 for _, seconds in spans)
+
+    def test_nested_spans_end_first(self, spans):
+        with instrument.span("outer"):
+            with instrument.span("inner"):
+                pass
+        assert [name for name, _ in spans] == ["inner", "outer"]
+        assert spans[0][1] <= spans[1][1]
+
+    def test_capture_holds_spans_back(self, spans):
+        with instrument.capture() as captured:
+            with instrument.span("held"):
+                pass
+        assert spans == []
+        assert [name for name, _ in captured] == ["held"]
+        instrument.record(*captured[0])
+        assert spans == captured
+
+    def test_worker_processes_send_spans_back(self, index):
+        paths = [os.path.join(LICENSES_DIR, "MIT.txt"), os.path.join(LICENSES_DIR, "ISC.txt")]
+        for result in score_files(paths, index, jobs=2):
+            assert {"read", "normalize", "score"} <= {name for name, _ in result.spans}
+
+    def test_profile(self):
+        profile = instrument.Profile()
+        profile("score", 0.5)
+        profile("score", 0.25)
+        profile("normalize", 0.1)
+        assert profile.calls == {"score": 2, "normalize": 1}
+        lines = profile.format()
+        assert lines[1].split()[:3] == ["score", "2", "0.750"]
+        assert lines[2].startswith("normalize")
+
+
+class TestProfileOption:
+    def test_breakdown_on_stderr(self, monkeypatch, index):
+        monkeypatch.setattr(cli, "is_keys_empty", lambda store: False)
+        monkeypatch.setattr(cli, "get_license_index", lambda store: index)
+        result = CliRunner().invoke(cli.matcher, ["-d", LICENSES_DIR, "--profile"])
+        assert result.exit_code == 0, result.output
+        stages = {line.split()[0] for line in result.stderr.splitlines()}
+        assert {"span", "read", "normalize", "score", "wall"} <= stages
+        assert instrument._listeners == []
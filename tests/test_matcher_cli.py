@@ -0,0 +1,124 @@
+# SPDX-FileCopyrightText: 2026-present SPDX Contributors
+# SPDX-FileType: SOURCE
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for the matcher command line interface, with the license index loaded from the test data."""
+
+import json
+import os
+
+import pytest
+from click.testing import CliRunner
+
+from spdx_license_matcher import matcher as cli
+from spdx_license_matcher.index import LicenseIndex
+from spdx_license_matcher.storage import MmapStore
+
+from .conftest import LICENSES_DIR
+
+
+@pytest.fixture
+def runner(monkeypatch, normalized_texts):
+    index = LicenseIndex.from_texts(normalized_texts)
+    monkeypatch.setattr(cli, "is_keys_empty", lambda store: False)
+    monkeypatch.setattr(cli, "get_license_index", lambda store: index)
+    return CliRunner()
+
+
+class TestJsonOutput:
+    def test_one_record_per_file(self, runner, tmp_path):
+        (tmp_path / "unrelated.txt").write_text("Nothing to see here.", encoding="utf-8")
+        result = runner.invoke(cli.matcher, ["-f", os.path.join(LICENSES_DIR, "MIT.txt"), "-d", str(tmp_path), "--format", "json"])
+        assert result.exit_code == 0, result.output
+        records = [json.loads(line) for line in result.output.splitlines()]
+        assert [record["verdict"] for record in records] == ["perfect", "no-match"]
+        assert records[0]["matches"] == [{"licenseId": "MIT", "score": 1.0}]
+        assert records[0]["matchedLicenseIds"] == ["MIT"]
+        assert set(records[0]["timings"]) == {"read", "normalize", "score"}
+        assert records[0]["candidates"]["exactMatch"]
+        assert records[0]["candidates"]["total"] == 0
+        assert not records[1]["candidates"]["exactMatch"]
+        assert records[1]["candidates"]["total"] == len(os.listdir(LICENSES_DIR))
+
+    def test_too_large(self, runner):
+        result = runner.invoke(cli.matcher, ["-f", os.path.join(LICENSES_DIR, "MIT.txt"), "--max-size", "100", "--format", "json"])
+        [record] = [json.loads(line) for line in result.output.splitlines()]
+        assert record["verdict"] == "too-large"
+        assert "100 bytes" in record["error"]
+
+    def test_segments(self, runner, tmp_path, normalized_texts, license_texts):
+        store = tmp_path / "corpus.bin"
+        MmapStore(str(store)).save(normalized_texts, LicenseIndex.from_texts(normalized_texts))
+        notices = tmp_path / "NOTICES"
+        notices.write_text(license_texts["Apache-2.0"] + "\n\n" + license_texts["ISC"], encoding="utf-8")
+        result = runner.invoke(cli.matcher, ["-f", str(notices), "--store", str(store), "--segment", "--format", "json"])
+        assert result.exit_code == 0, result.output
+        [record] = [json.loads(line) for line in result.output.splitlines()]
+        assert record["verdict"] == "segments"
+        assert [segment["licenseId"] for segment in record["segments"]] == ["Apache-2.0", "ISC"]
+        assert set(record["timings"]) == {"read", "normalize", "segment"}
+
+    def test_standard_with_template_verifier(self, runner, tmp_path, license_texts):
+        from .test_template import MIT_TEMPLATE, make_snapshot
+
+        snapshot = tmp_path / "snapshot.json.gz"
+        make_snapshot(license_texts, {"MIT": MIT_TEMPLATE}).save(str(snapshot))
+        modified = tmp_path / "LICENSE"
+        modified.write_text(license_texts["MIT"] + "\nThis copy is distributed with the Foo project.", encoding="utf-8")
+        result = runner.invoke(cli.matcher, ["-f", str(modified), "--snapshot", str(snapshot), "--verifier", "template", "--format", "json"])
+        assert result.exit_code == 0, result.output
+        [record] = [json.loads(line) for line in result.output.splitlines()]
+        assert record["verdict"] == "standard"
+        assert record["matchedLicenseIds"] == ["MIT"]
+
+    def test_shingles(self, runner, tmp_path, normalized_texts, license_texts):
+        from .test_template import MIT_TEMPLATE, make_snapshot
+
+        snapshot = tmp_path / "snapshot.json.gz"
+        make_snapshot(license_texts, {"MIT": MIT_TEMPLATE}).save(str(snapshot))
+        store = tmp_path / "corpus.bin"
+        MmapStore(str(store)).save(normalized_texts, LicenseIndex.from_texts(normalized_texts))
+        modified = tmp_path / "LICENSE"
+        modified.write_text(license_texts["MIT"].replace("the", "a", 3), encoding="utf-8")
+        result = runner.invoke(cli.matcher, ["-f", str(modified), "--store", str(store), "--snapshot", str(snapshot), "--verifier", "template", "-t", "0.8", "--shingles", "--format", "json"])
+        assert result.exit_code == 0, result.output
+        [record] = [json.loads(line) for line in result.output.splitlines()]
+        assert [match["licenseId"] for match in record["matches"]] == ["MIT"]
+        assert record["candidates"]["prunedByShingles"] > 0
+
+    def test_unreadable_file(self, runner, tmp_path):
+        (tmp_path / "binary").write_bytes(b"\xff\xfe\x00")
+        result = runner.invoke(cli.matcher, ["-d", str(tmp_path), "--format", "json"])
+        [record] = [json.loads(line) for line in result.output.splitlines()]
+        assert "error" in record
+
+
+class TestTextOutput:
+    def test_batch_headers(self, runner):
+        result = runner.invoke(cli.matcher, ["-d", LICENSES_DIR, "-j", "2"])
+        assert result.exit_code == 0, result.output
+        assert result.output.count("==> ") == len(os.listdir(LICENSES_DIR))
+
+    def test_shingles_not_with_segments(self, runner):
+        result = runner.invoke(cli.matcher, ["-f", os.path.join(LICENSES_DIR, "MIT.txt"), "--segment", "--shingles"])
+        assert result.exit_code == 2
+        assert "--shingles" in result.output
+
+    def test_verifier_closed_on_errors(self, runner, monkeypatch):
+        from .test_template import RecordingFallback
+
+        verifier = RecordingFallback()
+        monkeypatch.setattr(cli, "open_verifier", lambda kind, snapshot, threads: verifier)
+
+        def failing_scan(*args):
+            raise OSError("Disk failure")
+            yield
+
+        monkeypatch.setattr(cli, "score_files", failing_scan)
+        result = runner.invoke(cli.matcher, ["-f", os.path.join(LICENSES_DIR, "MIT.txt")])
+        assert isinstance(result.exception, OSError)
+        assert verifier.closed
+
+    def test_requires_input(self, runner):
+        result = runner.invoke(cli.matcher, [])
+        assert result.exit_code == 2
@@ -0,0 +1,96 @@
+# SPDX-FileCopyrightText: 2026-present SPDX Contributors
+# SPDX-FileType: SOURCE
+# SPDX-License-Identifier: Apache-2.0
+
+"""Regression tests of normalize() against the original implementation.
+
+Set SPDX_LICENSE_SNAPSHOT to an offline snapshot (see spdx-license-matcher-snapshot)
+to also compare every text of the SPDX License List.
+"""
+
+import os
+import random
+import re
+import time
+
+import pytest
+
+from spdx_license_matcher.normalize import (
+    ADDENDIUM_EXHIBIT_REGEX,
+    BULLETS_NUMBERING_REGEX,
+    COMMENTS_REGEX,
+    COPYRIGHT_NOTICE_REGEX,
+    COPYRIGHT_SYMBOLS,
+    EXTRANEOUS_REGEX,
+    URL_REGEX,
+    VARIETAL_WORDS_SPELLING,
+    normalize,
+)
+from spdx_license_matcher.snapshot import Snapshot
+
+
+def reference_normalize(licenseText):
+    """normalize() as originally written, one uncompiled re.sub or str.replace per step."""
+    licenseText = re.sub(URL_REGEX, 'normalized/url', licenseText)
+    licenseText = re.sub(COMMENTS_REGEX, "", licenseText)
+    licenseText = re.sub(EXTRANEOUS_REGEX, "", licenseText)
+    licenseText = re.sub(ADDENDIUM_EXHIBIT_REGEX, "", licenseText)
+    licenseText = re.sub(COPYRIGHT_SYMBOLS, "(C)", licenseText)
+    licenseText = re.sub(COPYRIGHT_NOTICE_REGEX, "", licenseText)
+    licenseText = licenseText.lower()
+    if 'license' in licenseText.split('\n')[0]:
+        licenseText = '\n'.join(licenseText.split('\n')[1:])
+    licenseText = re.sub(BULLETS_NUMBERING_REGEX, " ", licenseText)
+    for initial, final in VARIETAL_WORDS_SPELLING.items():
+        licenseText = licenseText.replace(initial, final)
+    licenseText = " ".join(licenseText.split())
+    return licenseText
+
+
+# Fragments exercising every step, including spellings that chain or overlap.
+FRAGMENTS = [
+    "\n", "\n\n", " ", "  ", "\t", "License", "LICENSE", "license", "Copyright", "copyright",
+    "(c) 2020 Someone", "©", "Ⓒ", "ⓒ", "https://example.org/a?b=c", "http://x.y", "// ", "/* ",
+    "# ", " 1. ", " (a) ", " * ", " (ii) ", "END OF TERMS AND CONDITIONS", "Appendix", "EXHIBIT",
+    "sub-licence", "sub licence", "per centre", "non-commercialabour", "fulfill", "wilfull",
+    "Owner", "Programme", "l", "-", "sub", "per", "cen", "re", "licen", "The", "words",
+    "\\n", "Copyright\n", "Copyright ", "CopyrightX", "\r\n", "   \n\t ", "End  of terms and conditions",
+    "end of terms and conditions", "\u212a", "\u0130", "APADDENDUM", "APPENDIX A", "\u00a0",
+]
+FRAGMENTS += list(VARIETAL_WORDS_SPELLING) + list(VARIETAL_WORDS_SPELLING.values())
+
+
+class TestNormalize:
+    def test_license_texts(self, license_texts):
+        for licenseText in license_texts.values():
+            assert normalize(licenseText) == reference_normalize(licenseText)
+
+    def test_edge_cases(self):
+        for text in ["", "license", "License\n", "no newline", "\nlicense", "MIT License\nCopyright\n"]:
+            assert normalize(text) == reference_normalize(text)
+
+    def test_random_fragments(self):
+        rng = random.Random(20260101)
+        for _ in range(20000):
+            text = "".join(rng.choice(FRAGMENTS) for _ in range(rng.randint(1, 12)))
+            assert normalize(text) == reference_normalize(text), repr(text)
+
+    def test_long_lines_in_linear_time(self):
+        # The original regexes take seconds on these, and minutes on lines ten times longer.
+        for text in ["Copyright" + " x" * 10000, " " * 20000 + "end", "a" * 20000 + "\nCopyright"]:
+            start = time.perf_counter()
+            normalize(text)
+            assert time.perf_counter() - start < 0.5, repr(text[:20])
+
+    def test_part_of_text(self):
+        text = "MIT License\nSome terms.\nEND OF TERMS AND CONDITIONS\nISC License\nOther terms."
+        assert "other terms" not in normalize(text)
+        normalized = normalize(text, wholeText=False)
+        assert normalized.startswith("mit license")
+        assert "other terms" in normalized
+
+    @pytest.mark.skipif(not os.environ.get("SPDX_LICENSE_SNAPSHOT"), reason="SPDX_LICENSE_SNAPSHOT is not set")
+    def test_snapshot(self):
+        snapshot = Snapshot.load(os.environ["SPDX_LICENSE_SNAPSHOT"])
+        for licenseId, entry in snapshot.entries.items():
+            assert normalize(entry["text"]) == reference_normalize(entry["text"]), licenseId
@@ -0,0 +1,73 @@
+# SPDX-FileCopyrightText: 2026-present SPDX Contributors
+# SPDX-FileType: SOURCE
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for the detection of several licenses in one text."""
+
+import pickle
+
+import pytest
+
+from spdx_license_matcher.computation import get_close_matches
+from spdx_license_matcher.index import LicenseIndex
+from spdx_license_matcher.normalize import normalize
+from spdx_license_matcher.segment import LicenseSegmenter, _slide_window
+from spdx_license_matcher.sorensen_dice import get_dice_coefficient
+
+SEPARATOR = "\n\n------------------------------------------------------------\nThis package also includes:\n\n"
+
+
+@pytest.fixture(scope="module")
+def segmenter(normalized_texts):
+    return LicenseSegmenter(normalized_texts)
+
+
+def notices(license_texts, licenseIds):
+    return normalize(SEPARATOR.join(license_texts[licenseId] for licenseId in licenseIds), wholeText=False)
+
+
+class TestLicenseSegmenter:
+    def test_finds_each_license_in_order(self, segmenter, license_texts, normalized_texts):
+        licenseIds = ["MIT", "Apache-2.0", "Zlib", "BSL-1.0"]
+        text = notices(license_texts, licenseIds)
+        # Matched as a whole, the file resembles none of them.
+        assert get_close_matches(text, LicenseIndex.from_texts(normalized_texts)) == {}
+        segments = segmenter.find_segments(text)
+        assert [segment.licenseId for segment in segments] == licenseIds
+        for segment, nextSegment in zip(segments, segments[1:]):
+            assert segment.end <= nextSegment.start
+        assert all(segment.score >= 0.9 for segment in segments)
+
+    def test_license_repeated(self, segmenter, license_texts):
+        segments = segmenter.find_segments(notices(license_texts, ["ISC", "curl", "ISC"]))
+        assert [segment.licenseId for segment in segments] == ["ISC", "curl", "ISC"]
+
+    def test_nothing_found(self, segmenter):
+        assert segmenter.find_segments(normalize("Nothing to see here. " * 50, wholeText=False)) == []
+
+    def test_same_in_another_process(self, segmenter, license_texts):
+        # Shingles are hashed the same way in worker processes.
+        text = notices(license_texts, ["MIT", "Zlib"])
+        assert pickle.loads(pickle.dumps(segmenter)).find_segments(text) == segmenter.find_segments(text)
+
+
+class TestSlideWindow:
+    def test_incremental_scores_match_dice_coefficient(self, normalized_texts):
+        license = normalized_texts["0BSD"]
+        text = "some leading words " + license[:400] + " and trailing words"
+        bigramIds = {}
+        licenseCounts = [0]
+        for i in range(len(license) - 1):
+            bigramId = bigramIds.setdefault(license[i:i+2], len(bigramIds) + 1)
+            if bigramId == len(licenseCounts):
+                licenseCounts.append(0)
+            licenseCounts[bigramId] += 1
+        textIds = [bigramIds.get(text[i:i+2], 0) for i in range(len(text) - 1)]
+        windowTotal = 300
+        score, start = _slide_window(textIds, licenseCounts, len(license) - 1, 0, len(text), windowTotal)
+        expected = max(
+            get_dice_coefficient(text[windowStart:windowStart + windowTotal + 1], license)
+            for windowStart in range(len(text) - windowTotal)
+        )
+        assert score == expected
+        assert get_dice_coefficient(text[start:start + windowTotal + 1], license) == expected
@@ -0,0 +1,104 @@
+# SPDX-FileCopyrightText: 2026-present SPDX Contributors
+# SPDX-FileType: SOURCE
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for the long-running matching server."""
+
+import http.client
+import json
+import threading
+import urllib.error
+import urllib.request
+
+import pytest
+
+from spdx_license_matcher.computation import get_close_matches, get_matching_string
+from spdx_license_matcher.index import LicenseIndex
+from spdx_license_matcher.server import MatchService, make_server
+
+
+class FailingVerifier:
+    """Stands for a verifier whose JVM or downloads fail."""
+
+    def get_standard_match(self, matches, inputText):
+        raise OSError("Network is unreachable")
+
+
+def _serve(service):
+    server = make_server(service, port=0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server
+
+
+@pytest.fixture(scope="module")
+def server_url(normalized_texts):
+    server = _serve(MatchService(LicenseIndex.from_texts(normalized_texts)))
+    yield "http://127.0.0.1:{}".format(server.server_port)
+    server.shutdown()
+    server.server_close()
+
+
+def _post(url, payload):
+    request = urllib.request.Request(url, data=json.dumps(payload).encode("utf-8"), method="POST")
+    with urllib.request.urlopen(request) as response:
+        return json.loads(response.read())
+
+
+class TestServer:
+    def test_health(self, server_url, normalized_texts):
+        with urllib.request.urlopen(server_url + "/health") as response:
+            health = json.loads(response.read())
+        assert health["status"] == "ok"
+        assert health["licenses"] == len(normalized_texts)
+        assert health["exactHits"] >= 0 and health["exactMisses"] >= 0
+        assert health["cacheHits"] == health["cacheMisses"] == health["cacheEvictions"] == 0
+
+    def test_same_output_as_functions(self, server_url, license_texts):
+        for text in [license_texts["MIT"], "Nothing to see here."]:
+            matches = get_close_matches(text, license_texts)
+            assert _post(server_url + "/match", {"text": text}) == {
+                "matches": matches,
+                "matchingString": get_matching_string(matches, text),
+            }
+
+    def test_concurrent_requests(self, server_url, license_texts):
+        ids = ["MIT", "ISC", "Zlib", "0BSD", "BSL-1.0", "Unlicense"] * 3
+        results = [None] * len(ids)
+
+        def worker(i):
+            results[i] = _post(server_url + "/match", {"text": license_texts[ids[i]], "threshold": 0.95})
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(len(ids))]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert [result["matches"] for result in results] == [{licenseId: 1.0} for licenseId in ids]
+
+    def test_bad_request(self, server_url):
+        with pytest.raises(urllib.error.HTTPError) as excinfo:
+            _post(server_url + "/match", {"threshold": 0.9})
+        assert excinfo.value.code == 400
+
+    def test_invalid_content_length(self, server_url):
+        for length in ["-1", "ten"]:
+            connection = http.client.HTTPConnection(server_url[len("http://"):], timeout=5)
+            connection.putrequest("POST", "/match")
+            connection.putheader("Content-Length", length)
+            connection.endheaders()
+            response = connection.getresponse()
+            assert response.status == 400
+            assert "error" in json.loads(response.read())
+            connection.close()
+
+    def test_matching_errors(self, normalized_texts, license_texts):
+        server = _serve(MatchService(LicenseIndex.from_texts(normalized_texts), verifier=FailingVerifier()))
+        try:
+            with pytest.raises(urllib.error.HTTPError) as excinfo:
+                _post("http://127.0.0.1:{}/match".format(server.server_port), {"text": license_texts["MIT"] + " Some note."})
+            assert excinfo.value.code == 500
+            assert "Network is unreachable" in json.loads(excinfo.value.read())["error"]
+        finally:
+            server.shutdown()
+            server.server_close()
@@ -0,0 +1,62 @@
+# SPDX-FileCopyrightText: 2026-present SPDX Contributors
+# SPDX-FileType: SOURCE
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for offline SPDX License List snapshots."""
+
+import tarfile
+
+import pytest
+
+from spdx_license_matcher.normalize import normalize
+from spdx_license_matcher.snapshot import Snapshot
+from spdx_license_matcher.utils import get_spdx_license_text
+
+from .conftest import write_license_list_data
+
+EXCEPTION_TEXT = "As a special exception, you may link this library with independent modules."
+
+
+@pytest.fixture(scope="module")
+def release_dir(tmp_path_factory, license_texts):
+    root = tmp_path_factory.mktemp("license-list-data")
+    return write_license_list_data(str(root), license_texts, {"Test-exception": EXCEPTION_TEXT})
+
+
+class TestSnapshot:
+    def test_from_release_directory(self, release_dir, license_texts):
+        snapshot = Snapshot.from_release(release_dir)
+        assert snapshot.licenseListVersion == "3.99"
+        assert len(snapshot) == len(license_texts) + 1
+        assert snapshot.entries["Test-exception"]["isException"]
+        assert snapshot.get_text("MIT") == license_texts["MIT"]
+        assert snapshot.normalized_texts()["GPL-2.0"] == normalize(license_texts["GPL-2.0"])
+
+    def test_from_release_archive(self, release_dir, tmp_path):
+        archive = tmp_path / "license-list-data-3.99.tar.gz"
+        with tarfile.open(archive, "w:gz") as tar:
+            tar.add(release_dir, arcname="license-list-data-3.99")
+        assert Snapshot.from_release(str(archive)).entries == Snapshot.from_release(release_dir).entries
+
+    def test_save_and_load(self, release_dir, tmp_path):
+        snapshot = Snapshot.from_release(release_dir)
+        path = str(tmp_path / "snapshot.json.gz")
+        snapshot.save(path)
+        loaded = Snapshot.load(path)
+        assert loaded.licenseListVersion == snapshot.licenseListVersion
+        assert loaded.entries == snapshot.entries
+        assert loaded.normalizerVersion == snapshot.normalizerVersion
+
+    def test_texts_of_other_normalizers_normalized_again(self, release_dir, license_texts):
+        snapshot = Snapshot.from_release(release_dir)
+        snapshot.entries["MIT"]["normalized"] = "stale"
+        assert snapshot.normalized_texts()["MIT"] == "stale"
+        snapshot.normalizerVersion = None
+        assert snapshot.normalized_texts()["MIT"] == normalize(license_texts["MIT"])
+
+    def test_license_text_without_network(self, release_dir, license_texts):
+        snapshot = Snapshot.from_release(release_dir)
+        assert get_spdx_license_text("Apache-2.0", snapshot) == license_texts["Apache-2.0"]
+        assert get_spdx_license_text("Test-exception", snapshot) == EXCEPTION_TEXT
+        with pytest.raises(KeyError):
+            get_spdx_license_text("No-Such-License", snapshot)
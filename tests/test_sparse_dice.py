@@ -0,0 +1,48 @@
+# SPDX-FileCopyrightText: 2026-present SPDX Contributors
+# SPDX-FileType: SOURCE
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for the vectorized NumPy/SciPy Sørensen-Dice scorer."""
+
+import pytest
+
+pytest.importorskip("numpy")
+pytest.importorskip("scipy")
+
+from spdx_license_matcher.computation import get_close_matches  # noqa: E402
+from spdx_license_matcher.index import LicenseIndex  # noqa: E402
+from spdx_license_matcher.normalize import normalize  # noqa: E402
+from spdx_license_matcher.sorensen_dice import get_dice_coefficient  # noqa: E402
+from spdx_license_matcher.sparse_dice import SparseDiceScorer  # noqa: E402
+
+
+@pytest.fixture(scope="module")
+def scorer(normalized_texts):
+    return SparseDiceScorer(LicenseIndex.from_texts(normalized_texts))
+
+
+@pytest.fixture(scope="module")
+def queries(license_texts):
+    return [
+        normalize(license_texts["GPL-2.0"]),
+        normalize(license_texts["BSD-2-Clause"].replace("provided", "supplied")),
+        normalize(license_texts["MIT"] + license_texts["ISC"]),
+        "aaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa",
+        "x",
+        "",
+    ]
+
+
+class TestSparseDiceScorer:
+    def test_scores_identical_to_dice_coefficient(self, scorer, queries, normalized_texts):
+        for query in queries:
+            scores = scorer.get_scores(query)
+            for licenseId, normalizedText in normalized_texts.items():
+                assert scores[licenseId] == get_dice_coefficient(query, normalizedText)
+
+    def test_batch_identical_to_single(self, scorer, queries):
+        assert scorer.get_scores_many(queries) == [scorer.get_scores(query) for query in queries]
+
+    def test_get_close_matches(self, scorer, license_texts):
+        inputText = license_texts["BSD-3-Clause"].replace("Neither", "Nor")
+        assert get_close_matches(inputText, scorer, 0.8) == get_close_matches(inputText, license_texts, 0.8)
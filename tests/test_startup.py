@@ -0,0 +1,71 @@
+# SPDX-FileCopyrightText: 2026-present SPDX Contributors
+# SPDX-FileType: SOURCE
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests that the command line starts without importing what the run does not need, in fresh interpreters."""
+
+import json
+import os
+import subprocess
+import sys
+
+from spdx_license_matcher.index import LicenseIndex
+from spdx_license_matcher.storage import MmapStore
+
+from .conftest import LICENSES_DIR
+
+# Modules only needed to verify close matches, download, use Redis, score with NumPy or run worker processes.
+HEAVY_MODULES = ['jpype', 'multiprocessing', 'numpy', 'redis', 'requests', 'scipy']
+
+# Seconds to import the command line module; it took about 0.5 s when JPype, Redis and requests were imported eagerly.
+IMPORT_TIME_LIMIT = 0.4
+
+REPORT = '''
+import json, sys
+print(json.dumps(sorted(name for name in {heavy!r} if name in sys.modules)))
+'''
+
+
+def run_python(code, *args):
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(path for path in sys.path if path))
+    result = subprocess.run([sys.executable, *args, '-c', code], capture_output=True, text=True, env=env, timeout=120)
+    assert result.returncode == 0, result.stderr
+    return result
+
+
+def loaded_heavy_modules(code):
+    output = run_python(code + REPORT.format(heavy=HEAVY_MODULES)).stdout
+    return json.loads(output.splitlines()[-1])
+
+
+class TestStartup:
+    def test_import_is_light(self):
+        assert loaded_heavy_modules('import spdx_license_matcher.matcher') == []
+
+    def test_import_time(self):
+        stderr = run_python('import spdx_license_matcher.matcher', '-X', 'importtime').stderr
+        line = [line for line in stderr.splitlines() if line.endswith('| spdx_license_matcher.matcher')][0]
+        assert int(line.split('|')[1]) / 1e6 < IMPORT_TIME_LIMIT
+
+    def test_version_and_help(self):
+        code = '''
+from spdx_license_matcher.matcher import matcher
+for args in (['--version'], ['--help']):
+    try:
+        matcher(args)
+    except SystemExit:
+        pass
+'''
+        assert loaded_heavy_modules(code) == []
+
+    def test_perfect_match_does_not_start_the_jvm(self, tmp_path, normalized_texts):
+        store = MmapStore(str(tmp_path / 'corpus.bin'))
+        store.save(normalized_texts, LicenseIndex.from_texts(normalized_texts))
+        code = '''
+from spdx_license_matcher.matcher import matcher
+try:
+    matcher(['--store', {store!r}, '-f', {path!r}])
+except SystemExit:
+    pass
+'''.format(store=store.path, path=os.path.join(LICENSES_DIR, 'MIT.txt'))
+        assert loaded_heavy_modules(code) == []
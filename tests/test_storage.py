@@ -0,0 +1,81 @@
+# SPDX-FileCopyrightText: 2026-present SPDX Contributors
+# SPDX-FileType: SOURCE
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for the corpus stores."""
+
+import pickle
+
+import pytest
+
+from spdx_license_matcher.batch import collect_files, score_files
+from spdx_license_matcher.index import LicenseIndex
+from spdx_license_matcher.storage import MmapStore, RedisStore, open_store
+
+from .conftest import LICENSES_DIR
+
+
+@pytest.fixture(scope="module")
+def index(normalized_texts):
+    return LicenseIndex.from_texts(normalized_texts)
+
+
+@pytest.fixture
+def store(tmp_path, normalized_texts, index):
+    store = MmapStore(str(tmp_path / "corpus.bin"))
+    store.save(normalized_texts, index)
+    return store
+
+
+class TestMmapStore:
+    def test_empty_until_saved(self, tmp_path, normalized_texts, index):
+        store = MmapStore(str(tmp_path / "corpus.bin"))
+        assert store.is_empty()
+        store.save(normalized_texts, index)
+        assert not store.is_empty()
+        assert sorted(path.name for path in tmp_path.iterdir()) == ["corpus.bin"]
+
+    def test_index_round_trip(self, store, index, normalized_texts):
+        loaded = store.load_index()
+        assert loaded.names == index.names
+        for licenseId, text in normalized_texts.items():
+            assert loaded.get_scores(text) == index.get_scores(text)
+
+    def test_normalized_texts(self, store, normalized_texts):
+        for licenseId, text in normalized_texts.items():
+            assert store.get_normalized_text(licenseId) == text
+        assert store.get_normalized_text("No-Such-License") is None
+
+    def test_resave_replaces_corpus(self, store, normalized_texts):
+        fewer = {licenseId: normalized_texts[licenseId] for licenseId in ("MIT", "ISC")}
+        store.load_index()
+        store.save(fewer, LicenseIndex.from_texts(fewer))
+        assert sorted(store.load_index().names) == ["ISC", "MIT"]
+
+    def test_not_a_corpus_file(self, tmp_path):
+        path = tmp_path / "other.bin"
+        path.write_bytes(b"not a corpus" * 4)
+        with pytest.raises(ValueError):
+            MmapStore(str(path)).load_index()
+
+    def test_pickles_by_path(self, store):
+        store.load_index()
+        copy = pickle.loads(pickle.dumps(store))
+        assert copy.path == store.path
+        assert copy.get_normalized_text("MIT") == store.get_normalized_text("MIT")
+
+    def test_shared_by_worker_processes(self, store):
+        paths = collect_files(directories=[LICENSES_DIR])
+        index = store.load_index()
+        serial = list(score_files(paths, index, jobs=1))
+        parallel = list(score_files(paths, index, jobs=2, store=store))
+        assert [result.matches for result in parallel] == [result.matches for result in serial]
+
+
+class TestOpenStore:
+    def test_specs(self, tmp_path):
+        assert isinstance(open_store(None), RedisStore)
+        assert isinstance(open_store("redis"), RedisStore)
+        assert isinstance(open_store("redis://localhost:6379/1"), RedisStore)
+        store = open_store(str(tmp_path / "corpus.bin"))
+        assert isinstance(store, MmapStore)
@@ -0,0 +1,211 @@
+# SPDX-FileCopyrightText: 2026-present SPDX Contributors
+# SPDX-FileType: SOURCE
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for the Python matching of the SPDX license templates."""
+
+import os
+import time
+
+import pytest
+
+from spdx_license_matcher.normalize import normalize
+from spdx_license_matcher.snapshot import Snapshot
+from spdx_license_matcher.template import LicenseTemplate, TemplateError, TemplateVerifier, template_tokens, template_words
+
+MIT_TEMPLATE = '''<<beginOptional>> MIT License<<endOptional>>
+
+<<var;name="copyright";original="Copyright (c) <year> <copyright holders>";match=".{0,5000}">>
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated documentation files (the "Software"), to deal in the Software without restriction, including without limitation the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software, and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.<<beginOptional>> <<var;name="extra";original="";match=".+">><<endOptional>>
+'''
+
+BSD_TEMPLATE = '''<<var;name="copyright";original="Copyright (c) <year> <owner>";match=".+">> All rights reserved.
+
+Redistribution and use in source and binary forms, with or without modification, are permitted provided that the following conditions are met:
+
+<<var;name="bullet";original="1.";match=".{0,20}">> Redistributions of source code must retain the above copyright notice, this list of conditions and the following disclaimer.
+
+<<var;name="bullet";original="2.";match=".{0,20}">> Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the following disclaimer in the documentation and/or other materials provided with the distribution.<<beginOptional>> <<var;name="clause";original="3.";match="3\\.|iii\\.">> Neither the name of <<var;name="organization";original="the copyright holder";match=".+">> nor the names of its contributors may be used to endorse or promote products derived from this software without specific prior written permission.<<endOptional>>
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES ARE DISCLAIMED.
+'''
+
+
+def make_snapshot(texts, templates):
+    entries = {
+        licenseId: {'name': licenseId, 'isException': False, 'isDeprecated': False,
+                    'text': text, 'normalized': normalize(text), 'template': templates.get(licenseId)}
+        for licenseId, text in texts.items()
+    }
+    return Snapshot('3.99', '2026-01-01', entries)
+
+
+class RecordingFallback:
+    """Stands for the Java verifier, finding every input standard and recording the licenses asked for."""
+
+    def __init__(self):
+        self.licenseIds = []
+        self.closed = False
+
+    def get_standard_match(self, matches, inputText):
+        self.licenseIds.extend(matches)
+        return next(iter(matches))
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture(scope="module")
+def mit():
+    return LicenseTemplate(MIT_TEMPLATE)
+
+
+class TestTemplateWords:
+    def test_guidelines_equivalences(self):
+        assert template_words('© 2026 Foo, Inc.') == ['copyright', '2026', 'foo', 'inc']
+        assert template_words('(C) the Licence\n  1. Analyse') == ['copyright', 'the', 'license', 'analyze']
+        assert template_words('See HTTPS://example.org') == ['see', 'http', 'example', 'org']
+
+    def test_tokens_keep_the_punctuation_after_words(self):
+        assert template_tokens('Clause iii. Neither (the Foo) nor') == [
+            ('clause', 'clause'), ('iii', 'iii.'), ('neither', 'neither'), ('the', 'the'), ('foo', 'foo)'), ('nor', 'nor')]
+        assert [word for word, _ in template_tokens(BSD_TEMPLATE)] == template_words(BSD_TEMPLATE)
+
+
+class TestLicenseTemplate:
+    def test_license_text_matches(self, mit, license_texts):
+        assert mit.matches(template_tokens(license_texts['MIT']))
+
+    def test_replaceable_and_optional_parts(self, mit, license_texts):
+        text = license_texts['MIT'].replace('MIT License', '').replace('<year> <copyright holders>', '2019-2026 Jane Doe and the Foo project')
+        assert mit.matches(template_tokens(text))
+        assert mit.matches(template_tokens(text + '\nSome note added at the end.'))
+
+    def test_substantive_changes_do_not_match(self, mit, license_texts):
+        text = license_texts['MIT']
+        assert not mit.matches(template_tokens(text.replace('free of charge, ', '')))
+        assert not mit.matches(template_tokens(text.replace('any person', 'any person or animal')))
+        assert not mit.matches(template_tokens(text.replace('NONINFRINGEMENT', 'NONINFRINGEMENT AND TITLE')))
+        assert not mit.matches(template_tokens(text.replace('The above', 'Some note. The above')))
+
+    def test_variable_part_length_is_bounded(self):
+        template = LicenseTemplate('Copyright <<var;name="c";original="";match=".{0,10}">> reserved')
+        assert template.matches(template_tokens('Copyright 2026 Foo reserved'))
+        assert not template.matches(template_tokens('Copyright ' + 'foo ' * 10 + 'reserved'))
+
+    def test_alternatives_and_nested_optional_parts(self, license_texts):
+        template = LicenseTemplate(BSD_TEMPLATE)
+        twoClause = ('Copyright (c) 2026 Foo. All rights reserved. Redistribution and use in source and binary forms, '
+                     'with or without modification, are permitted provided that the following conditions are met: '
+                     '1. Redistributions of source code must retain the above copyright notice, this list of conditions '
+                     'and the following disclaimer. 2. Redistributions in binary form must reproduce the above copyright '
+                     'notice, this list of conditions and the following disclaimer in the documentation and/or other '
+                     'materials provided with the distribution. THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND '
+                     'CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES ARE DISCLAIMED.')
+        threeClause = twoClause.replace(
+            'distribution.', 'distribution. iii. Neither the name of the Foo Project nor the names of its contributors '
+            'may be used to endorse or promote products derived from this software without specific prior written permission.')
+        assert template.matches(template_tokens(twoClause))
+        assert template.matches(template_tokens(threeClause))
+        assert not template.matches(template_tokens(threeClause.replace('Neither', 'Either')))
+
+    def test_variable_parts_match_their_regular_expression(self):
+        template = LicenseTemplate(BSD_TEMPLATE.split(' Redistributions in binary form')[0] + ' End.'
+                                   '<<beginOptional>> <<var;name="clause";original="3.";match="3\\.|iii\\.">> Clause.<<endOptional>>')
+        text = ('Copyright 2026 Foo. All rights reserved. Redistribution and use in source and binary forms, with or '
+                'without modification, are permitted provided that the following conditions are met: '
+                '1. Redistributions of source code must retain the above copyright notice, this list of conditions '
+                'and the following disclaimer. End.')
+        assert template.matches(template_tokens(text))
+        assert template.matches(template_tokens(text + ' III. Clause.'))
+        assert not template.matches(template_tokens(text + ' 4. Clause.'))
+        assert not template.matches(template_tokens(text + ' any three words Clause.'))
+        assert not template.matches(template_tokens(text.replace('Copyright 2026 Foo.', '')))
+
+    def test_regular_expressions_python_cannot_compile(self):
+        with pytest.raises(TemplateError):
+            LicenseTemplate('Copyright <<var;name="c";original="";match="\\p{L}+">>')
+
+    def test_unbalanced_optional_parts(self):
+        with pytest.raises(TemplateError):
+            LicenseTemplate('<<beginOptional>> Title')
+        with pytest.raises(TemplateError):
+            LicenseTemplate('Title <<endOptional>>')
+        with pytest.raises(TemplateError):
+            LicenseTemplate('<<include;name="other">>')
+
+    def test_large_input_time_is_linear(self, mit, license_texts):
+        tokens = template_tokens(license_texts['MIT'] * 200)
+        start = time.perf_counter()
+        assert not mit.matches(tokens)
+        assert time.perf_counter() - start < 1.0
+
+
+class TestTemplateVerifier:
+    def test_verifies_from_the_snapshot(self, license_texts):
+        snapshot = make_snapshot(license_texts, {'MIT': MIT_TEMPLATE, 'X11': 'X11 <<var;name="c";original="";match=".+">>'})
+        verifier = TemplateVerifier(snapshot)
+        text = license_texts['MIT'].replace('<year> <copyright holders>', '2026 Jane Doe')
+        assert verifier.get_standard_match({'X11': 0.95, 'MIT': 0.97}, text) == 'MIT'
+        assert verifier.is_standard('MIT', text)
+        assert not verifier.is_standard('MIT', text.replace('sublicense, ', ''))
+        assert verifier.get_standard_matches([({'MIT': 0.9}, text), ({'MIT': 0.9}, 'MIT')]) == ['MIT', None]
+        assert verifier.get_template('MIT') is verifier.get_template('MIT')
+
+    def test_licenses_without_template_use_the_fallback(self, license_texts):
+        snapshot = make_snapshot(license_texts, {'MIT': MIT_TEMPLATE, 'ISC': '<<beginOptional>> ISC'})
+        fallback = RecordingFallback()
+        verifier = TemplateVerifier(snapshot, fallback)
+        assert verifier.get_standard_match({'MIT': 0.99}, license_texts['MIT']) == 'MIT'
+        assert verifier.get_standard_match({'ISC': 0.99}, license_texts['ISC']) == 'ISC'
+        assert verifier.get_standard_match({'Zlib': 0.99}, license_texts['Zlib']) == 'Zlib'
+        assert verifier.get_standard_match({'Unknown': 0.99}, 'text') == 'Unknown'
+        assert fallback.licenseIds == ['ISC', 'Zlib', 'Unknown']
+        verifier.close()
+        assert fallback.closed
+
+    def test_fetch_errors_are_not_kept(self, monkeypatch, license_texts):
+        answers = [ConnectionError('Network is unreachable'), MIT_TEMPLATE]
+
+        def get_template(licenseId, snapshot=None):
+            answer = answers.pop(0)
+            if isinstance(answer, Exception):
+                raise answer
+            return answer
+
+        monkeypatch.setattr('spdx_license_matcher.utils.get_spdx_license_template', get_template)
+        verifier = TemplateVerifier()
+        assert verifier.get_template('MIT') is None
+        assert verifier.get_template('MIT') is not None
+        assert verifier.get_template('MIT') is verifier.get_template('MIT')
+        assert answers == []
+
+    def test_without_fallback_is_not_standard(self, license_texts):
+        verifier = TemplateVerifier(make_snapshot(license_texts, {}))
+        assert verifier.get_standard_match({'MIT': 0.99}, license_texts['MIT']) is None
+
+
+@pytest.mark.skipif(not os.environ.get('SPDX_LICENSE_SNAPSHOT'), reason='needs a snapshot with the SPDX license templates')
+class TestSameAsJava:
+    """Compares the answers with the SPDX Java library on the whole license list of SPDX_LICENSE_SNAPSHOT."""
+
+    def test_license_texts(self):
+        pytest.importorskip('jpype')
+        from spdx_license_matcher.verify import StandardVerifier
+
+        snapshot = Snapshot.load(os.environ['SPDX_LICENSE_SNAPSHOT'])
+        javaVerifier = StandardVerifier()
+        templateVerifier = TemplateVerifier(snapshot)
+        differences = []
+        for licenseId, entry in snapshot.entries.items():
+            if entry['isDeprecated'] or templateVerifier.get_template(licenseId) is None:
+                continue
+            for text in (entry['text'], entry['text'] + ' This sentence is not in the license.'):
+                if templateVerifier.is_standard(licenseId, text) != javaVerifier.is_standard(licenseId, text):
+                    differences.append(licenseId)
+        assert differences == []
@@ -0,0 +1,122 @@
+# SPDX-FileCopyrightText: 2026-present SPDX Contributors
+# SPDX-FileType: SOURCE
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for the threading and caching of the standard text verification, with the JVM calls replaced, and the JVM options."""
+
+import contextlib
+import threading
+
+import pytest
+from click.testing import CliRunner
+
+from spdx_license_matcher.computation import get_matching_string
+from spdx_license_matcher.utils import get_jvm_options
+from spdx_license_matcher.verify import StandardVerifier, create_jvm_archive
+
+EXCEPTIONS = {"Classpath-exception-2.0"}
+
+
+class RecordingVerifier(StandardVerifier):
+    """Treats an input as standard for the license IDs it contains, and records the JVM calls."""
+
+    def __init__(self, threads=0):
+        super().__init__(threads)
+        self.lookups = []
+        self.attachedThreads = []
+        self.comparedThreads = set()
+        self.comparisons = 0
+
+    def _start_jvm(self):
+        pass
+
+    def _attach_thread(self):
+        self.attachedThreads.append(threading.get_ident())
+
+    def _lookup(self, licenseId):
+        self.lookups.append(licenseId)
+        return licenseId in EXCEPTIONS, "listed " + licenseId
+
+    def _is_difference_found(self, isException, listed, inputText):
+        self.comparedThreads.add(threading.get_ident())
+        self.comparisons += 1
+        assert isException == (listed[len("listed "):] in EXCEPTIONS)
+        return listed[len("listed "):] not in inputText.split()
+
+
+@pytest.fixture(autouse=True)
+def no_jvm_thread(monkeypatch):
+    monkeypatch.setattr("spdx_license_matcher.verify._jvm_thread", contextlib.nullcontext)
+
+
+CANDIDATES = {"BSD-2-Clause": 0.95, "BSD-3-Clause": 0.93, "Classpath-exception-2.0": 0.91}
+
+
+@pytest.mark.parametrize("threads", [0, 3])
+class TestStandardVerifier:
+    def test_first_standard_candidate(self, threads):
+        verifier = RecordingVerifier(threads)
+        assert verifier.get_standard_match(CANDIDATES, "text BSD-3-Clause Classpath-exception-2.0") == "BSD-3-Clause"
+        assert verifier.get_standard_match(CANDIDATES, "text Classpath-exception-2.0") == "Classpath-exception-2.0"
+        assert verifier.get_standard_match(CANDIDATES, "other text") is None
+        verifier.close()
+
+    def test_listed_objects_looked_up_once(self, threads):
+        verifier = RecordingVerifier(threads)
+        items = [(CANDIDATES, "text {}".format(licenseId)) for licenseId in list(CANDIDATES) * 4]
+        assert verifier.get_standard_matches(items) == list(CANDIDATES) * 4
+        assert sorted(verifier.lookups) == sorted(CANDIDATES)
+        verifier.close()
+
+    def test_matching_string(self, threads):
+        verifier = RecordingVerifier(threads)
+        assert get_matching_string(CANDIDATES, "BSD-2-Clause", verifier) == "The following license ID(s) match: BSD-2-Clause"
+        assert get_matching_string(CANDIDATES, "other", verifier) == ""
+        verifier.close()
+
+
+class TestThreads:
+    def test_pool_threads_attached_once(self):
+        verifier = RecordingVerifier(2)
+        for _ in range(10):
+            verifier.get_standard_matches([(CANDIDATES, "other text")] * 5)
+        assert len(verifier.attachedThreads) == len(set(verifier.attachedThreads)) <= 2
+        assert verifier.comparedThreads <= set(verifier.attachedThreads)
+        assert threading.get_ident() not in verifier.comparedThreads
+        verifier.close()
+
+    def test_calling_thread_without_pool(self):
+        verifier = RecordingVerifier()
+        verifier.get_standard_match(CANDIDATES, "other text")
+        assert verifier.attachedThreads == []
+        assert verifier.comparedThreads == {threading.get_ident()}
+
+
+class TestJvmOptions:
+    def test_defaults(self, monkeypatch):
+        monkeypatch.delenv("SPDX_JAVA_OFFLINE", raising=False)
+        monkeypatch.delenv("SPDX_JVM_ARCHIVE", raising=False)
+        assert get_jvm_options() == []
+
+    def test_offline(self, monkeypatch):
+        monkeypatch.setenv("SPDX_JAVA_OFFLINE", "true")
+        monkeypatch.delenv("SPDX_JVM_ARCHIVE", raising=False)
+        options = get_jvm_options()
+        assert "-Dorg.spdx.useJARLicenseInfoOnly=true" in options
+        assert "-DSPDXParser.OnlyUseLocalLicenses=true" in options
+        assert get_jvm_options(offline=False) == []
+
+    def test_archive_created_then_mapped(self, tmp_path):
+        archive = tmp_path / "spdx.jsa"
+        assert "-XX:ArchiveClassesAtExit=" + str(archive) in get_jvm_options(False, str(archive))
+        archive.write_bytes(b"")
+        options = get_jvm_options(False, str(archive))
+        assert "-XX:SharedArchiveFile=" + str(archive) in options
+        assert "-XX:+IgnoreUnrecognizedVMOptions" in options
+
+    def test_archive_without_jvm(self, monkeypatch, tmp_path):
+        monkeypatch.setenv("SPDX_TOOLS_JAR", str(tmp_path / "missing.jar"))
+        result = CliRunner().invoke(create_jvm_archive, ["-o", str(tmp_path / "spdx.jsa")])
+        assert result.exit_code == 1
+        assert "Could not start the JVM" in result.output
+        assert not (tmp_path / "spdx.jsa").exists()